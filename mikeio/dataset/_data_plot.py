@@ -543,6 +543,10 @@ class _DataArrayPlotterFM(_DataArrayPlotter):
             kwargs["label"] = self._label_txt()
         if "title" not in kwargs:
             kwargs["title"] = title
+        if kwargs.get("plot_type") in ("contour", "contourf", "shaded"):
+            # reuse the cached tri-only mesh and element to node operator
+            kwargs["tri_only_element_table"] = geometry._tri_only_element_table
+            kwargs["node_centered_operator"] = geometry._get_node_centered_operator()
 
         return _plot_map(
             node_coordinates=geometry.node_coordinates,
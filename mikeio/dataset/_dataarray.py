@@ -31,6 +31,7 @@ from ._data_utils import _get_time_idx_list, _n_selected_timesteps
 
 if TYPE_CHECKING:
     from ._dataset import Dataset
+    import geopandas
     import xarray
 
 
@@ -1265,6 +1266,78 @@ class DataArray:
         assert isinstance(da, DataArray)
         return da
 
+    def depth_average(self) -> "DataArray":
+        """Depth-averaged values of 3d flexible mesh data
+
+        The layer thickness is calculated from the dynamic z-values
+        of the nodes (zn) if available, otherwise from the static
+        z-values of the node coordinates. NaN values are skipped and
+        the average is taken over the height of the remaining layers.
+
+        Returns
+        -------
+        DataArray
+            depth-averaged values on the 2d geometry
+
+        See Also
+        --------
+            vertical_integral : Vertically integrated values
+
+        Examples
+        --------
+        ```{python}
+        ds = mikeio.read("../data/oresund_sigma_z.dfsu")
+        ds.Temperature.depth_average()
+        ```
+        """
+        return self._vertical_integral(average=True)
+
+    def vertical_integral(self) -> "DataArray":
+        """Vertically integrated values of 3d flexible mesh data
+
+        The values of each layer are multiplied by the layer thickness
+        and summed over the water column. The layer thickness is
+        calculated from the dynamic z-values of the nodes (zn) if available,
+        otherwise from the static z-values of the node coordinates.
+        NaN values are skipped, i.e. they do not contribute to the integral.
+
+        Returns
+        -------
+        DataArray
+            vertically integrated values on the 2d geometry
+
+        See Also
+        --------
+            depth_average : Depth-averaged values
+        """
+        return self._vertical_integral(average=False)
+
+    def _vertical_integral(self, average: bool) -> "DataArray":
+        if not isinstance(self.geometry, GeometryFM3D):
+            raise ValueError(
+                "Vertical integration is only available for 3d flexible mesh data (GeometryFM3D)"
+            )
+
+        geometry = self.geometry
+        dz = geometry._dz if self._zn is None else geometry._calc_dz(self._zn)
+        data = geometry._vertical_integral(
+            self.to_numpy().astype(np.float64), dz, average=average
+        )
+
+        item = deepcopy(self.item)
+        if not average:
+            # the unit is multiplied by the unit of z
+            item = ItemInfo(self.name, itemtype=EUMType.Undefined)
+
+        return DataArray(
+            data=data,
+            time=self.time,
+            item=item,
+            geometry=geometry.geometry2d,
+            dims=self.dims,
+            dt=self._dt,
+        )
+
     # ============= Aggregation methods ===========
 
     def max(self, axis: int | str = 0, **kwargs: Any) -> "DataArray":
@@ -1874,6 +1947,27 @@ class DataArray:
         )
         return xr_da
 
+    def to_geopandas(self, time: int = 0) -> "geopandas.GeoDataFrame":
+        """Export a time step of 2d flexible mesh data to geopandas GeoDataFrame
+
+        Parameters
+        ----------
+        time : int, optional
+            index of the time step to export, default 0 (first);
+            ignored if the DataArray has no time dimension
+
+        Returns
+        -------
+        geopandas.GeoDataFrame
+            element_id, values and a polygon for each element
+        """
+        if not isinstance(self.geometry, GeometryFM2D):
+            raise ValueError(
+                "Export to GeoDataFrame is only available for 2d flexible mesh data (GeometryFM2D)"
+            )
+        da = self.isel(time=time) if "time" in self.dims else self
+        return self.geometry.to_geopandas(data={self.name: da.to_numpy()})
+
     # ===============================================
 
     def __repr__(self) -> str:
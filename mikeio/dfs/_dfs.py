@@ -22,6 +22,7 @@ from ..dataset import Dataset
 from ..eum import EUMType, EUMUnit, ItemInfo, ItemInfoList
 from ..exceptions import ItemsError
 from .._time import DateTimeSelector
+from ..instrumentation import _buffer, _wrap, instrumented
 
 
 @dataclass
@@ -60,7 +61,7 @@ def _read_item_time_step(
             d = np.zeros(shape[1])
             d[:] = fill_bad_data_value
             dfs.Close()
-            dfs = DfsFileFactory.DfsGenericOpen(filename)
+            dfs = _wrap(DfsFileFactory.DfsGenericOpen(filename))
     return dfs, d, t
 
 
@@ -242,7 +243,9 @@ def _get_item_info(
     return ItemInfoList(items)
 
 
+@instrumented("write_dfs")
 def write_dfs_data(*, dfs: DfsFile, ds: Dataset, n_spatial_dims: int) -> None:
+    dfs = _wrap(dfs)
     deletevalue = dfs.FileInfo.DeleteValueFloat  # ds.deletevalue
     has_no_time = "time" not in ds.dims
     if ds.is_equidistant:
@@ -341,6 +344,7 @@ class _Dfs123:
 
         return str.join("\n", out)
 
+    @instrumented("Dfs123.read")
     def read(
         self,
         *,
@@ -390,12 +394,14 @@ class _Dfs123:
         data_list: List[np.ndarray] = [
             np.ndarray(shape=shape, dtype=dtype) for _ in range(n_items)
         ]
+        _buffer(*data_list)
 
         t_seconds = np.zeros(len(time_steps))
 
+        dfs = _wrap(self._dfs)
         for i, it in enumerate(tqdm(time_steps, disable=not self.show_progress)):
             for item in range(n_items):
-                itemdata = self._dfs.ReadItemTimeStep(item_numbers[item] + 1, int(it))
+                itemdata = dfs.ReadItemTimeStep(item_numbers[item] + 1, int(it))
 
                 src = itemdata.Data
                 d = src
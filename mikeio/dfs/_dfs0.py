@@ -15,8 +15,10 @@ from .. import __dfs_version__
 from ..dataset import Dataset, DataArray
 from ._dfs import _get_item_info, _valid_item_numbers, _valid_timesteps
 from ..eum import EUMType, EUMUnit, ItemInfo, TimeStepUnit
+from ..instrumentation import _wrap, instrumented
 
 
+@instrumented("write_dfs0")
 def _write_dfs0(
     filename: str | Path,
     dataset: Dataset,
@@ -61,7 +63,7 @@ def _write_dfs0(
 
     builder.CreateFile(filename)
 
-    dfs = builder.GetFile()
+    dfs = _wrap(builder.GetFile())
 
     delete_value = dfs.FileInfo.DeleteValueFloat
 
@@ -201,12 +203,13 @@ class Dfs0:
 
         return ds
 
+    @instrumented("Dfs0.read")
     def _read(self, filename: str) -> tuple[list[np.ndarray], pd.DatetimeIndex]:
         """
         Read all data from a dfs0 file.
         """
         self._dfs = DfsFileFactory.DfsGenericOpen(filename)
-        raw_data = self._dfs.ReadDfs0DataDouble()  # Bulk read the data
+        raw_data = _wrap(self._dfs).ReadDfs0DataDouble()  # Bulk read the data
 
         self._dfs.Close()
 
@@ -24,6 +24,7 @@ from ._dfs import (
     write_dfs_data,
 )
 from ..eum import TimeStepUnit
+from ..instrumentation import _buffer, _wrap, instrumented
 from ..spatial import Grid2D
 
 
@@ -143,6 +144,7 @@ class Dfs2(_Dfs123):
         dfs.Close()
         self._validate_no_orientation_in_geo()
 
+    @instrumented("Dfs2.read")
     def read(
         self,
         *,
@@ -201,12 +203,14 @@ class Dfs2(_Dfs123):
         data_list: List[np.ndarray] = [
             np.ndarray(shape=shape, dtype=dtype) for _ in range(n_items)
         ]
+        _buffer(*data_list)
 
         t_seconds = np.zeros(len(time_steps))
 
+        dfs = _wrap(self._dfs)
         for i, it in enumerate(tqdm(time_steps, disable=not self.show_progress)):
             for item in range(n_items):
-                itemdata = self._dfs.ReadItemTimeStep(item_numbers[item] + 1, int(it))
+                itemdata = dfs.ReadItemTimeStep(item_numbers[item] + 1, int(it))
                 d = itemdata.Data
 
                 d[d == self.deletevalue] = np.nan
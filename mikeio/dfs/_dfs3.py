@@ -23,6 +23,7 @@ from ._dfs import (
     write_dfs_data,
 )
 from ..eum import TimeStepUnit
+from ..instrumentation import _buffer, _wrap, instrumented
 from ..spatial import Grid3D
 
 
@@ -146,6 +147,7 @@ class Dfs3(_Dfs123):
         self._ny = self._dfs.SpatialAxis.YCount
         self._nz = self._dfs.SpatialAxis.ZCount
 
+    @instrumented("Dfs3.read")
     def read(
         self,
         *,
@@ -185,7 +187,7 @@ class Dfs3(_Dfs123):
         # if keepdims is not False:
         #    return NotImplementedError("keepdims is not yet implemented for Dfs3")
 
-        dfs = DfsFileFactory.DfsGenericOpen(self._filename)
+        dfs = _wrap(DfsFileFactory.DfsGenericOpen(self._filename))
 
         item_numbers = _valid_item_numbers(dfs.ItemInfo, items)
         n_items = len(item_numbers)
@@ -222,6 +224,7 @@ class Dfs3(_Dfs123):
         for item in range(n_items):
             data: np.ndarray = np.ndarray(shape=shape, dtype=dtype)
             data_list.append(data)
+        _buffer(*data_list)
 
         if single_time_selected and not keepdims:
             shape = shape[1:]
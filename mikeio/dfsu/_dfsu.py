@@ -28,10 +28,12 @@ from ..dfs._dfs import (
 from ..spatial import (
     GeometryFM2D,
 )
+from ..spatial._FM_geometry import _split_connectivity
 from ..spatial import Grid2D
 from .._track import _extract_track
 from ._common import get_elements_from_source, get_nodes_from_source
 from ..eum import ItemInfo, TimeStepUnit
+from ..instrumentation import _buffer, _wrap, instrumented
 
 
 def write_dfsu(filename: str | Path, data: Dataset) -> None:
@@ -44,9 +46,30 @@ def write_dfsu(filename: str | Path, data: Dataset) -> None:
     data: Dataset
         Dataset to be written
     """
+    dfs = _create_dfsu_file(
+        filename,
+        geometry=data.geometry,
+        items=data.items,
+        start_time=data.time[0],
+        timestep=data.timestep,
+        equidistant=data.is_equidistant,
+    )
+
+    write_dfsu_data(dfs, data, data.geometry.is_layered)
+
+
+def _create_dfsu_file(
+    filename: str | Path,
+    *,
+    geometry: Any,
+    items: Sequence[ItemInfo],
+    start_time: datetime,
+    timestep: float,
+    equidistant: bool = True,
+) -> DfsuFile:
+    """Create an empty dfsu file, ready for writing data time step by time step"""
     filename = str(filename)
 
-    geometry = data.geometry
     dfsu_filetype = DfsuFileType.Dfsu2D
 
     if geometry.is_layered:
@@ -56,7 +79,9 @@ def write_dfsu(filename: str | Path, data: Dataset) -> None:
     yn = geometry.node_coordinates[:, 1]
     zn = geometry.node_coordinates[:, 2]
 
-    elem_table = [np.array(e) + 1 for e in geometry.element_table]
+    elem_table = _split_connectivity(
+        geometry._connectivity + 1, geometry._n_nodes_per_element
+    )
 
     builder = DfsuBuilder.Create(dfsu_filetype)
     if dfsu_filetype != DfsuFileType.Dfsu2D:
@@ -69,13 +94,13 @@ def write_dfsu(filename: str | Path, data: Dataset) -> None:
     proj = factory.CreateProjection(geometry.projection_string)
     builder.SetProjection(proj)
 
-    if data.is_equidistant:
+    if equidistant:
         temporal_axis = factory.CreateTemporalEqCalendarAxis(
-            TimeStepUnit.SECOND, data.time[0], 0, data.timestep
+            TimeStepUnit.SECOND, start_time, 0, timestep
         )
     else:
         temporal_axis = factory.CreateTemporalNonEqCalendarAxis(
-            TimeStepUnit.SECOND, data.time[0]
+            TimeStepUnit.SECOND, start_time
         )
     builder.SetTemporalAxis(temporal_axis)
     builder.SetZUnit(eumUnit.eumUmeter)
@@ -83,17 +108,17 @@ def write_dfsu(filename: str | Path, data: Dataset) -> None:
     if dfsu_filetype != DfsuFileType.Dfsu2D:
         builder.SetNumberOfSigmaLayers(geometry.n_sigma_layers)
 
-    for item in data.items:
+    for item in items:
         builder.AddDynamicItem(item.name, eumQuantity.Create(item.type, item.unit))
 
     builder.ApplicationTitle = "mikeio"
     builder.ApplicationVersion = __dfs_version__
-    dfs = builder.CreateFile(filename)
-
-    write_dfsu_data(dfs, data, geometry.is_layered)
+    return builder.CreateFile(filename)
 
 
+@instrumented("write_dfsu")
 def write_dfsu_data(dfs: DfsuFile, ds: Dataset, is_layered: bool) -> None:
+    dfs = _wrap(dfs)
 
     n_time_steps = len(ds.time)
     data = ds
@@ -389,6 +414,7 @@ class Dfsu2DH:
         dfs.Close()
         return geometry
 
+    @instrumented("Dfsu2DH.read")
     def read(
         self,
         *,
@@ -438,7 +464,7 @@ class Dfsu2DH:
 
         if dtype not in [np.float32, np.float64]:
             raise ValueError("Invalid data type. Choose np.float32 or np.float64")
-        dfs = DfsuFile.Open(self._filename)
+        dfs = _wrap(DfsuFile.Open(self._filename))
 
         single_time_selected, time_steps = _valid_timesteps(dfs, time)
 
@@ -476,6 +502,7 @@ class Dfsu2DH:
             # Initialize an empty data block
             data: np.ndarray = np.ndarray(shape=shape, dtype=dtype)
             data_list.append(data)
+        _buffer(*data_list)
 
         for i in trange(n_steps, disable=not self.show_progress):
             it = time_steps[i]
@@ -7,7 +7,6 @@ import numpy as np
 from mikecore.DfsuFile import DfsuFile, DfsuFileType
 from mikecore.DfsFileFactory import DfsFileFactory
 import pandas as pd
-from scipy.spatial import cKDTree
 from tqdm import trange
 
 from ..dataset import DataArray, Dataset
@@ -18,7 +17,8 @@ from ..dfs._dfs import (
     _valid_timesteps,
 )
 from ..eum import EUMType, ItemInfo
-from .._interpolation import get_idw_interpolant, interp2d
+from ..instrumentation import _buffer, _wrap, instrumented
+from .._interpolation import interp2d
 from ..spatial import (
     GeometryFM3D,
     GeometryFMVerticalProfile,
@@ -197,6 +197,7 @@ class DfsuLayered:
         """Maximum number of z-layers"""
         return self.n_layers - self.n_sigma_layers
 
+    @instrumented("DfsuLayered.read")
     def read(
         self,
         *,
@@ -253,7 +254,7 @@ class DfsuLayered:
         if dtype not in [np.float32, np.float64]:
             raise ValueError("Invalid data type. Choose np.float32 or np.float64")
 
-        dfs = DfsuFile.Open(self._filename)
+        dfs = _wrap(DfsuFile.Open(self._filename))
 
         single_time_selected, time_steps = _valid_timesteps(dfs, time)
 
@@ -311,6 +312,7 @@ class DfsuLayered:
             else:
                 data = np.ndarray(shape=(n_steps, n_elems), dtype=dtype)
             data_list.append(data)
+        _buffer(*data_list)
 
         if single_time_selected and not keepdims:
             data = data[0]
@@ -475,6 +477,10 @@ class Dfsu3D(DfsuLayered):
         Extract surface elevation from a 3d dfsu file (based on zn)
         to a new 2d dfsu file with a surface elevation item.
 
+        The file is read one time step at a time. To write the surface
+        elevation directly to a 2d dfsu file, use
+        `mikeio.generic.extract_surface_elevation`.
+
         Parameters
         ---------
         n_nearest: int, optional
@@ -486,30 +492,28 @@ class Dfsu3D(DfsuLayered):
             or self._type == DfsuFileType.Dfsu3DSigmaZ
         )
         assert n_nearest > 0
+        geometry = self.geometry
+        assert isinstance(geometry, GeometryFM3D)
+
+        # cached 3d nodes-to-2d elements interpolator
+        geom, node_ids, weights = geometry._get_surface_interpolant(n_nearest)
+
+        n_steps = self.n_timesteps
+        surf2d = np.empty(shape=(n_steps, geom.n_elements))
+        t_seconds = np.zeros(n_steps)
+
+        # read zn (first item) from 3d file and interpolate to element centers
+        dfs = _wrap(DfsFileFactory.DfsGenericOpen(self._filename))
+        for it in trange(n_steps, disable=not self.show_progress):
+            itemdata = dfs.ReadItemTimeStep(1, it)
+            t_seconds[it] = itemdata.Time
+            surf2d[it] = interp2d(itemdata.Data, node_ids, weights)
+        dfs.Close()
 
-        # make 2d nodes-to-elements interpolator
-        top_el = self.geometry.top_elements
-        geom = self.geometry.elements_to_geometry(top_el, node_layers="top")
-        xye = geom.element_coordinates[:, 0:2]  # type: ignore
-        xyn = geom.node_coordinates[:, 0:2]  # type: ignore
-        tree2d = cKDTree(xyn)
-        dist, node_ids = tree2d.query(xye, k=n_nearest)
-        if n_nearest == 1:
-            weights = None
-        else:
-            weights = get_idw_interpolant(dist)
-
-        # read zn from 3d file and interpolate to element centers
-        ds = self.read(items=0, keepdims=True)  # read only zn
-        node_ids_surf, _ = self.geometry._get_nodes_and_table_for_elements(
-            top_el, node_layers="top"
-        )
-        assert isinstance(ds[0]._zn, np.ndarray)
-        zn_surf = ds[0]._zn[:, node_ids_surf]  # surface
-        surf2d = interp2d(zn_surf, node_ids, weights)
+        time = pd.to_datetime(t_seconds, unit="s", origin=self.start_time)
         surf_da = DataArray(
             data=surf2d,
-            time=ds.time,
+            time=time,
             geometry=geom,
             item=ItemInfo(EUMType.Surface_Elevation),
         )
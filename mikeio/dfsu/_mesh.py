@@ -16,6 +16,7 @@ from ._common import (
 )
 
 if TYPE_CHECKING:
+    from geopandas import GeoDataFrame
     from shapely.geometry import MultiPolygon
 
 
@@ -150,3 +151,13 @@ class Mesh:
         ```
         """
         return self.geometry.to_shapely()
+
+    def to_geopandas(self) -> GeoDataFrame:
+        """Convert Mesh geometry to geopandas GeoDataFrame
+
+        Returns
+        -------
+        GeoDataFrame
+            element_id and a polygon for each element
+        """
+        return self.geometry.to_geopandas()
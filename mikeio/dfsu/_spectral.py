@@ -10,6 +10,7 @@ from tqdm import trange
 from ..dataset import DataArray, Dataset
 from ..eum import ItemInfo
 from ..dfs._dfs import _get_item_info, _valid_item_numbers, _valid_timesteps
+from ..instrumentation import _buffer, _wrap, instrumented
 from .._spectral import calc_m0_from_spectrum
 from ._dfsu import (
     _get_dfsu_info,
@@ -235,6 +236,7 @@ class DfsuSpectral:
 
         return read_shape, shape, tuple(dims)
 
+    @instrumented("DfsuSpectral.read")
     def read(
         self,
         *,
@@ -300,7 +302,7 @@ class DfsuSpectral:
 
         # Open the dfs file for reading
         # self._read_dfsu_header(self._filename)
-        dfs = DfsuFile.Open(self._filename)
+        dfs = _wrap(DfsuFile.Open(self._filename))
 
         single_time_selected, time_steps = _valid_timesteps(dfs, time)
 
@@ -333,6 +335,7 @@ class DfsuSpectral:
             # Initialize an empty data block
             data: np.ndarray = np.ndarray(shape=read_shape, dtype=dtype)
             data_list.append(data)
+        _buffer(*data_list)
 
         t_seconds = np.zeros(n_steps, dtype=float)
 
@@ -1,12 +1,14 @@
 from __future__ import annotations
+import json
 import math
 import os
 import pathlib
 from copy import deepcopy
 from datetime import datetime, timedelta
 from shutil import copyfile
-from collections.abc import Iterable, Sequence
-from typing import Union, List, Tuple
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Union, List, Tuple
 
 
 import numpy as np
@@ -19,6 +21,7 @@ from mikecore.DfsFile import (
     DfsNonEqTimeAxis,
     DfsEqCalendarAxis,
     DfsNonEqCalendarAxis,
+    TimeAxisType,
 )
 from mikecore.DfsFileFactory import DfsFileFactory
 from mikecore.eum import eumQuantity
@@ -26,7 +29,14 @@ from tqdm import tqdm, trange
 
 from . import __dfs_version__
 from .dfs._dfs import _get_item_info, _valid_item_numbers
-from .eum import ItemInfo
+from .eum import EUMType, EUMUnit, ItemInfo, TimeStepUnit
+from .instrumentation import _buffer, _wrap, instrumented
+from .spatial import (
+    GeometryFM2D,
+    GeometryFM3D,
+    GeometryFMVerticalProfile,
+    GeometryUndefined,
+)
 import mikeio
 
 
@@ -102,6 +112,126 @@ class _ChunkInfo:
         return _ChunkInfo(n_data, n_chunks)
 
 
+class _TimeAccumulator:
+    """Running temporal statistic of item data, updated one time step at a time
+
+    Only the running statistic and the number of valid values are kept in
+    memory, i.e. the memory use corresponds to two time steps of data.
+
+    Parameters
+    ----------
+    how : str
+        statistic to calculate, one of "mean", "sum", "min" or "max"
+    """
+
+    HOW = ("mean", "sum", "min", "max")
+
+    def __init__(self, how: str = "mean"):
+        if how not in self.HOW:
+            raise ValueError(f"how must be one of {self.HOW}, not '{how}'")
+        self.how = how
+        self.n_steps = 0
+        self._value: np.ndarray | None = None
+        self._count: np.ndarray | None = None
+
+    def __repr__(self) -> str:
+        return f"_TimeAccumulator(how='{self.how}', n_steps={self.n_steps})"
+
+    def add(self, data: np.ndarray) -> None:
+        """Add data from one time step (NaN for missing values)"""
+        if self._value is None or self._count is None:
+            init = {"mean": 0.0, "sum": 0.0, "min": np.inf, "max": -np.inf}
+            self._value = np.full(data.shape, init[self.how], dtype=np.float64)
+            self._count = np.zeros(data.shape, dtype=np.int32)
+
+        has_value = ~np.isnan(data)
+        if self.how in ("mean", "sum"):
+            self._value[has_value] += data[has_value]
+        elif self.how == "min":
+            np.fmin(self._value, data, out=self._value)
+        else:
+            np.fmax(self._value, data, out=self._value)
+        self._count[has_value] += 1
+        self.n_steps += 1
+
+    def result(self, min_count: int = 1) -> np.ndarray:
+        """Return the statistic, NaN where less than min_count values were added"""
+        if self._value is None or self._count is None:
+            raise ValueError("No data has been added")
+
+        has_value = self._count >= max(min_count, 1)
+        out = np.full(self._value.shape, np.nan, dtype=np.float64)
+        if self.how == "mean":
+            out[has_value] = self._value[has_value] / self._count[has_value]
+        else:
+            out[has_value] = self._value[has_value]
+        return out
+
+
+class _RollingWindow:
+    """Rolling temporal statistic of item data over the last window time steps
+
+    The time steps are kept in a ring buffer of shape (window, n_data).
+    For "mean" and "sum" a running sum and count of valid values are
+    updated incrementally when a time step enters or leaves the window.
+
+    Parameters
+    ----------
+    window : int
+        number of time steps in the window
+    how : str
+        statistic to calculate, one of "mean", "sum", "min" or "max"
+    n_data : int
+        number of data points per time step
+    """
+
+    def __init__(self, window: int, how: str, n_data: int):
+        if how not in _TimeAccumulator.HOW:
+            raise ValueError(f"how must be one of {_TimeAccumulator.HOW}, not '{how}'")
+        self.window = window
+        self.how = how
+        self.n_data = n_data
+        self.n_steps = 0
+        self._buffer = np.full((window, n_data), np.nan, dtype=np.float64)
+        self._sum = np.zeros(n_data, dtype=np.float64)
+        self._count = np.zeros(n_data, dtype=np.int32)
+
+    def __repr__(self) -> str:
+        return f"_RollingWindow(window={self.window}, how='{self.how}', n_steps={self.n_steps})"
+
+    def add(self, data: np.ndarray) -> None:
+        """Add data from one time step (NaN for missing values), dropping the oldest"""
+        pos = self.n_steps % self.window
+        old = self._buffer[pos]
+        had_value = ~np.isnan(old)
+        has_value = ~np.isnan(data)
+
+        if self.how in ("mean", "sum"):
+            self._sum[had_value] -= old[had_value]
+            self._sum[has_value] += data[has_value]
+        self._count -= had_value
+        self._count += has_value
+
+        self._buffer[pos] = data
+        self.n_steps += 1
+
+    def result(self, min_periods: int) -> np.ndarray:
+        """Return the statistic, NaN where less than min_periods values are in the window"""
+        has_value = self._count >= max(min_periods, 1)
+        out = np.full(self._count.shape, np.nan, dtype=np.float64)
+        if self.how == "mean":
+            out[has_value] = self._sum[has_value] / self._count[has_value]
+        elif self.how == "sum":
+            out[has_value] = self._sum[has_value]
+        else:
+            if self.how == "min":
+                value = np.fmin.reduce(self._buffer, axis=0)
+            else:
+                value = np.fmax.reduce(self._buffer, axis=0)
+            out[has_value] = value[has_value]
+        return out
+
+
 def _clone(
     infilename: str | pathlib.Path,
     outfilename: str | pathlib.Path,
@@ -198,13 +328,14 @@ def _clone(
         builder.AddStaticItem(static_item)
 
     # Get the file
-    file = builder.GetFile()
+    file = _wrap(builder.GetFile())
 
     source.Close()
 
     return file
 
 
+@instrumented("generic.scale")
 def scale(
     infilename: str | pathlib.Path,
     outfilename: str | pathlib.Path,
@@ -231,7 +362,7 @@ def scale(
     infilename = str(infilename)
     outfilename = str(outfilename)
     copyfile(infilename, outfilename)
-    dfs = DfsFileFactory.DfsGenericOpenEdit(outfilename)
+    dfs = _wrap(DfsFileFactory.DfsGenericOpenEdit(outfilename))
 
     item_numbers = _valid_item_numbers(dfs.ItemInfo, items)
     n_items = len(item_numbers)
@@ -257,6 +388,7 @@ def scale(
     dfs.Close()
 
 
+@instrumented("generic.fill_corrupt")
 def fill_corrupt(
     infilename: str | pathlib.Path,
     outfilename: str | pathlib.Path,
@@ -278,7 +410,7 @@ def fill_corrupt(
     items: List[str] or List[int], optional
         Process only selected items, by number (0-based) or name, by default: all
     """
-    dfs_i = DfsFileFactory.DfsGenericOpen(infilename)
+    dfs_i = _wrap(DfsFileFactory.DfsGenericOpen(infilename))
 
     item_numbers = _valid_item_numbers(dfs_i.ItemInfo, items)
     n_items = len(item_numbers)
@@ -307,7 +439,7 @@ def fill_corrupt(
 
                 # close and re-open file to solve problem with reading
                 dfs_i.Close()
-                dfs_i = DfsFileFactory.DfsGenericOpen(infilename)
+                dfs_i = _wrap(DfsFileFactory.DfsGenericOpen(infilename))
 
             d[np.isnan(d)] = deletevalue
             darray = d.astype(np.float32)
@@ -318,6 +450,7 @@ def fill_corrupt(
     dfs.Close()
 
 
+@instrumented("generic.sum")
 def sum(
     infilename_a: str | pathlib.Path,
     infilename_b: str | pathlib.Path,
@@ -339,9 +472,9 @@ def sum(
     outfilename = str(outfilename)
     copyfile(infilename_a, outfilename)
 
-    dfs_i_a = DfsFileFactory.DfsGenericOpen(infilename_a)
-    dfs_i_b = DfsFileFactory.DfsGenericOpen(infilename_b)
-    dfs_o = DfsFileFactory.DfsGenericOpenEdit(outfilename)
+    dfs_i_a = _wrap(DfsFileFactory.DfsGenericOpen(infilename_a))
+    dfs_i_b = _wrap(DfsFileFactory.DfsGenericOpen(infilename_b))
+    dfs_o = _wrap(DfsFileFactory.DfsGenericOpenEdit(outfilename))
 
     deletevalue = dfs_i_a.FileInfo.DeleteValueFloat
 
@@ -371,6 +504,7 @@ def sum(
     dfs_o.Close()
 
 
+@instrumented("generic.diff")
 def diff(
     infilename_a: str | pathlib.Path,
     infilename_b: str | pathlib.Path,
@@ -393,9 +527,9 @@ def diff(
 
     copyfile(infilename_a, outfilename)
 
-    dfs_i_a = DfsFileFactory.DfsGenericOpen(infilename_a)
-    dfs_i_b = DfsFileFactory.DfsGenericOpen(infilename_b)
-    dfs_o = DfsFileFactory.DfsGenericOpenEdit(outfilename)
+    dfs_i_a = _wrap(DfsFileFactory.DfsGenericOpen(infilename_a))
+    dfs_i_b = _wrap(DfsFileFactory.DfsGenericOpen(infilename_b))
+    dfs_o = _wrap(DfsFileFactory.DfsGenericOpenEdit(outfilename))
 
     deletevalue = dfs_i_a.FileInfo.DeleteValueFloat
 
@@ -426,6 +560,7 @@ def diff(
     dfs_o.Close()
 
 
+@instrumented("generic.concat")
 def concat(
     infilenames: Sequence[str | pathlib.Path],
     outfilename: str | pathlib.Path,
@@ -458,7 +593,7 @@ def concat(
         ds.to_dfs(outfilename)
         return
 
-    dfs_i_a = DfsFileFactory.DfsGenericOpen(str(infilenames[0]))
+    dfs_i_a = _wrap(DfsFileFactory.DfsGenericOpen(str(infilenames[0])))
 
     dfs_o = _clone(str(infilenames[0]), str(outfilename))
 
@@ -468,7 +603,7 @@ def concat(
     current_time = datetime(1, 1, 1)  # beginning of time...
 
     for i, infilename in enumerate(tqdm(infilenames, disable=not show_progress)):
-        dfs_i = DfsFileFactory.DfsGenericOpen(str(infilename))
+        dfs_i = _wrap(DfsFileFactory.DfsGenericOpen(str(infilename)))
         t_axis = dfs_i.FileInfo.TimeAxis
         n_time_steps = t_axis.NumberOfTimeSteps
         dt = t_axis.TimeStep
@@ -548,6 +683,7 @@ def concat(
     dfs_o.Close()
 
 
+@instrumented("generic.extract")
 def extract(
     infilename: str | pathlib.Path,
     outfilename: str | pathlib.Path,
@@ -585,7 +721,7 @@ def extract(
     >>> extract('f_in.dfsu', 'f_out.dfsu', items="Salinity")
     >>> extract('f_in.dfsu', 'f_out.dfsu', end='2018-2-1 00:00', items="Salinity")
     """
-    dfs_i = DfsFileFactory.DfsGenericOpenEdit(str(infilename))
+    dfs_i = _wrap(DfsFileFactory.DfsGenericOpenEdit(str(infilename)))
 
     is_layered_dfsu = dfs_i.ItemInfo[0].Name == "Z coordinate"
 
@@ -722,6 +858,20 @@ def _parse_start_end(
     return file_start_new, start_step, start_sec, end_step, end_sec
 
 
+def _time_unit_in_seconds(time_axis: TimeAxis) -> float:
+    """Length of the time unit of the time axis in seconds"""
+    seconds = {
+        TimeStepUnit.SECOND: 1.0,
+        TimeStepUnit.MINUTE: 60.0,
+        TimeStepUnit.HOUR: 3600.0,
+        TimeStepUnit.DAY: 86400.0,
+    }
+    unit = int(time_axis.TimeUnit)
+    if unit not in seconds:
+        raise ValueError(f"Time unit {unit} of the time axis is not supported")
+    return seconds[TimeStepUnit(unit)]
+
+
 def _parse_step(time_axis: TimeAxis, step: int) -> float | None:
     """Helper function for parsing step argument"""
     if step == 1:
@@ -735,6 +885,7 @@ def _parse_step(time_axis: TimeAxis, step: int) -> float | None:
     return timestep
 
 
+@instrumented("generic.avg_time")
 def avg_time(
     infilename: str | pathlib.Path,
     outfilename: str | pathlib.Path,
@@ -752,7 +903,7 @@ def avg_time(
         exclude NaN/delete values when computing the result, default True
     """
 
-    dfs_i = DfsFileFactory.DfsGenericOpen(str(infilename))
+    dfs_i = _wrap(DfsFileFactory.DfsGenericOpen(str(infilename)))
 
     dfs_o = _clone(infilename, outfilename)
 
@@ -762,44 +913,448 @@ def avg_time(
     n_time_steps = dfs_i.FileInfo.TimeAxis.NumberOfTimeSteps
     deletevalue = dfs_i.FileInfo.DeleteValueFloat
 
-    outdatalist = []
-    steps_list = []
+    accumulators = [_TimeAccumulator("mean") for _ in item_numbers]
 
-    # step 0
-    for item in item_numbers:
-        indatatime = dfs_i.ReadItemTimeStep(item + 1, 0.0)
-        indata = indatatime.Data
-        has_value = indata != deletevalue
-        indata[~has_value] = np.nan
-        outdatalist.append(indata.astype(np.float32))
-        step0 = np.zeros_like(indata, dtype=np.int32)
-        step0[has_value] = 1
-        steps_list.append(step0)
-
-    for timestep in trange(1, n_time_steps, disable=not show_progress):
-        for item in range(n_items):
-            itemdata = dfs_i.ReadItemTimeStep(item_numbers[item] + 1, timestep)
-            d = itemdata.Data
-            has_value = d != deletevalue
-
-            outdatalist[item][has_value] += d[has_value]
-            steps_list[item][has_value] += 1
+    for timestep in trange(n_time_steps, disable=not show_progress):
+        for item, acc in zip(item_numbers, accumulators):
+            acc.add(_read_item(dfs_i, item, timestep))
 
-    for item in range(n_items):
-        darray = np.zeros_like(outdatalist[item], dtype=np.float32)
-        if skipna:
-            has_value = steps_list[item] == n_time_steps
-        else:
-            has_value = steps_list[item] > 0
-        darray[has_value] = outdatalist[item][has_value].astype(
-            np.float32
-        ) / steps_list[item][has_value].astype(np.float32)
-        darray[~has_value] = deletevalue
+    min_count = n_time_steps if skipna else 1
+    for acc in accumulators:
+        darray = acc.result(min_count=min_count).astype(np.float32)
+        darray[np.isnan(darray)] = deletevalue
         dfs_o.WriteItemTimeStepNext(0.0, darray)
 
+    dfs_i.Close()
+    dfs_o.Close()
+
+
+@instrumented("generic.depth_average")
+def depth_average(
+    infilename: str | pathlib.Path,
+    outfilename: str | pathlib.Path,
+    items: Sequence[int | str] | None = None,
+) -> None:
+    """Depth-average a 3d dfsu file to a 2d dfsu file
+
+    The file is processed one time step at a time, the layer thickness
+    is calculated from the dynamic z-values of the nodes. Delete values
+    are skipped; the average is taken over the remaining layers.
+
+    Parameters
+    ----------
+    infilename: str | pathlib.Path
+        full path to the input 3d dfsu file
+    outfilename: str | pathlib.Path
+        full path to the output 2d dfsu file
+    items: List[str] or List[int], optional
+        Process only selected items, by number (0-based) or name, by default: all
+    """
+    _vertical_integral(infilename, outfilename, items=items, average=True)
+
+
+@instrumented("generic.vertical_integral")
+def vertical_integral(
+    infilename: str | pathlib.Path,
+    outfilename: str | pathlib.Path,
+    items: Sequence[int | str] | None = None,
+) -> None:
+    """Vertically integrate a 3d dfsu file to a 2d dfsu file
+
+    The file is processed one time step at a time, the layer thickness
+    is calculated from the dynamic z-values of the nodes. Delete values
+    are skipped, i.e. they do not contribute to the integral.
+
+    Parameters
+    ----------
+    infilename: str | pathlib.Path
+        full path to the input 3d dfsu file
+    outfilename: str | pathlib.Path
+        full path to the output 2d dfsu file
+    items: List[str] or List[int], optional
+        Process only selected items, by number (0-based) or name, by default: all
+    """
+    _vertical_integral(infilename, outfilename, items=items, average=False)
+
+
+@instrumented("generic.extract_surface_elevation")
+def extract_surface_elevation(
+    infilename: str | pathlib.Path,
+    outfilename: str | pathlib.Path,
+    n_nearest: int = 4,
+) -> None:
+    """Extract surface elevation from a 3d dfsu file to a 2d dfsu file
+
+    The file is processed one time step at a time, the dynamic z-values
+    of the surface nodes are interpolated (inverse distance) to the
+    element centers of the 2d geometry.
+
+    Parameters
+    ----------
+    infilename: str | pathlib.Path
+        full path to the input 3d dfsu file
+    outfilename: str | pathlib.Path
+        full path to the output 2d dfsu file
+    n_nearest: int, optional
+        number of points for spatial interpolation (inverse_distance), default=4
+
+    See Also
+    --------
+    mikeio.Dfsu3D.extract_surface_elevation_from_3d
+    """
+    from ._interpolation import interp2d
+    from .dfsu._dfsu import _create_dfsu_file, _get_dfsu_info
+    from .spatial import GeometryFM3D
+
+    dfsu = mikeio.open(infilename)
+    info = _get_dfsu_info(infilename)
+    geometry = dfsu.geometry
+    if not isinstance(geometry, GeometryFM3D):
+        raise ValueError(
+            "Surface elevation can only be extracted from 3d dfsu files (GeometryFM3D)"
+        )
+    if n_nearest < 1:
+        raise ValueError(f"n_nearest must be a positive integer, not {n_nearest}")
+
+    # cached 3d nodes-to-2d elements interpolator
+    geom, node_ids, weights = geometry._get_surface_interpolant(n_nearest)
+
+    dfs_i = _wrap(DfsFileFactory.DfsGenericOpen(str(infilename)))
+    dfs_o = _wrap(
+        _create_dfsu_file(
+            outfilename,
+            geometry=geom,
+            items=[ItemInfo(EUMType.Surface_Elevation)],
+            start_time=info.start_time,
+            timestep=info.timestep,
+            equidistant=info.equidistant,
+        )
+    )
+
+    n_time_steps = dfs_i.FileInfo.TimeAxis.NumberOfTimeSteps
+    for timestep in trange(n_time_steps, disable=not show_progress):
+        # first item of a 3d file is the dynamic z-values of the nodes
+        itemdata = dfs_i.ReadItemTimeStep(1, timestep)
+        surf = interp2d(itemdata.Data, node_ids, weights)
+        dfs_o.WriteItemTimeStepNext(itemdata.Time, surf.astype(np.float32))
+
+    dfs_i.Close()
+    dfs_o.Close()
+
+
+def _vertical_integral(
+    infilename: str | pathlib.Path,
+    outfilename: str | pathlib.Path,
+    items: Sequence[int | str] | None,
+    average: bool,
+) -> None:
+    from .dfsu._dfsu import _create_dfsu_file, _get_dfsu_info
+    from .spatial import GeometryFM3D
+
+    dfsu = mikeio.open(infilename)
+    info = _get_dfsu_info(infilename)
+    geometry = dfsu.geometry
+    if not isinstance(geometry, GeometryFM3D):
+        raise ValueError(
+            "Vertical integration is only available for 3d dfsu files (GeometryFM3D)"
+        )
+
+    dfs_i = _wrap(DfsFileFactory.DfsGenericOpen(str(infilename)))
+    item_numbers = _valid_item_numbers(dfs_i.ItemInfo, items, ignore_first=True)
+    out_items = [info.items[item + 1] for item in item_numbers]
+    if not average:
+        out_items = [ItemInfo(item.name, EUMType.Undefined) for item in out_items]
+
+    dfs_o = _wrap(
+        _create_dfsu_file(
+            outfilename,
+            geometry=geometry.geometry2d,
+            items=out_items,
+            start_time=info.start_time,
+            timestep=info.timestep,
+            equidistant=info.equidistant,
+        )
+    )
+
+    n_time_steps = dfs_i.FileInfo.TimeAxis.NumberOfTimeSteps
+    deletevalue = dfs_i.FileInfo.DeleteValueFloat
+
+    for timestep in trange(n_time_steps, disable=not show_progress):
+        # first item of a 3d file is the dynamic z-values of the nodes
+        itemdata = dfs_i.ReadItemTimeStep(1, timestep)
+        time = itemdata.Time
+        zn = itemdata.Data.astype(np.float64)
+        zn[zn == deletevalue] = np.nan
+        dz = geometry._calc_dz(zn)
+        for item in item_numbers:
+            values = _read_item(dfs_i, item + 1, timestep)
+            outdata = geometry._vertical_integral(values, dz, average=average)
+            outdata[np.isnan(outdata)] = deletevalue
+            dfs_o.WriteItemTimeStepNext(time, outdata.astype(np.float32))
+
+    dfs_i.Close()
+    dfs_o.Close()
+
+
+@instrumented("generic.resample")
+def resample(
+    infilename: str | pathlib.Path,
+    outfilename: str | pathlib.Path,
+    freq: str = "1D",
+    how: str = "mean",
+    *,
+    items: Sequence[int | str] | None = None,
+    start: int | float | str | datetime = 0,
+    end: int | float | str | datetime = -1,
+) -> None:
+    """Temporal resampling of a dfs file, e.g. hourly to daily means
+
+    The input file is read one time step at a time and the statistic is
+    accumulated for the current output interval; each output time step is
+    written as soon as its interval is complete. Only one time step per
+    item is kept in memory.
+
+    Delete values are ignored; the output is a delete value where no valid
+    values exist within the interval. In layered dfsu files the
+    Z coordinate item is always included and averaged.
+
+    Parameters
+    ----------
+    infilename : str | pathlib.Path
+        input filename
+    outfilename : str | pathlib.Path
+        output filename
+    freq : str, optional
+        fixed output frequency as a pandas offset alias,
+        e.g. "1h", "6h" or "1D", by default "1D". The intervals are
+        floored relative to the epoch (1970-01-01), like pandas
+        origin="epoch", i.e. for multi-day frequencies such as "7D"
+        the first interval may start before the first time step
+    how : str, optional
+        statistic, one of "mean", "sum", "min" or "max", by default "mean"
+    items : int, list(int), str, list(str), optional
+        items to be included in the new file, by default all
+    start : int, float, str or datetime, optional
+        start of input as either step, relative seconds
+        or datetime/str, by default 0 (start of file)
+    end : int, float, str or datetime, optional
+        end of input as either step, relative seconds
+        or datetime/str, by default -1 (end of file)
+
+    Examples
+    --------
+    >>> resample("hourly.dfsu", "daily_mean.dfsu", freq="1D")
+    >>> resample("hourly.dfsu", "daily_max.dfsu", freq="1D", how="max")
+    >>> resample("f_in.dfs0", "f_6h.dfs0", freq="6h", start="2018-1-1")
+    """
+    offset = pd.tseries.frequencies.to_offset(freq)
+    if not isinstance(offset, pd.offsets.Tick):
+        raise ValueError(
+            f"freq must be a fixed frequency, e.g. '1h' or '1D', not '{freq}'"
+        )
+    dt_out = pd.Timedelta(offset).total_seconds()
+    if how not in _TimeAccumulator.HOW:
+        raise ValueError(f"how must be one of {_TimeAccumulator.HOW}, not '{how}'")
+
+    dfs_i = _wrap(DfsFileFactory.DfsGenericOpen(str(infilename)))
+    time_axis = dfs_i.FileInfo.TimeAxis
+
+    # time of a time step is given in the unit of the time axis, e.g. days
+    unit_sec = _time_unit_in_seconds(time_axis)
+
+    is_layered_dfsu = dfs_i.ItemInfo[0].Name == "Z coordinate"
+
+    _, start_step, start_sec, end_step, end_sec = _parse_start_end(
+        time_axis, start, end
+    )
+    item_numbers = _valid_item_numbers(
+        dfs_i.ItemInfo, items, ignore_first=is_layered_dfsu
+    )
+    item_hows = [how] * len(item_numbers)
+
+    if is_layered_dfsu:
+        item_numbers = [it + 1 for it in item_numbers]
+        item_numbers.insert(0, 0)
+        item_hows.insert(0, "mean")
+
+    file_start = time_axis.StartDateTime
+    deletevalue = dfs_i.FileInfo.DeleteValueFloat
+    n_elements = [dfs_i.ItemInfo[item].ElementCount for item in item_numbers]
+
+    dfs_o: DfsFile | None = None
+    out_start = bin_start = file_start
+    timestep_out = 0
+    accumulators = [_TimeAccumulator(h) for h in item_hows]
+
+    def _write_bin() -> None:
+        assert dfs_o is not None
+        time_out = (bin_start - out_start).total_seconds() / unit_sec
+        for item_out, acc in enumerate(accumulators):
+            if acc.n_steps > 0:
+                darray = acc.result().astype(np.float32)
+                darray[np.isnan(darray)] = deletevalue
+            else:
+                darray = np.full(n_elements[item_out], deletevalue, dtype=np.float32)
+            dfs_o.WriteItemTimeStep(item_out + 1, timestep_out, time_out, darray)
+
+    for timestep in trange(start_step, end_step, disable=not show_progress):
+        itemdata = dfs_i.ReadItemTimeStep(item_numbers[0] + 1, timestep)
+        time_sec = itemdata.Time
+        if time_sec > end_sec:
+            break
+        if time_sec < start_sec:
+            continue
+
+        current_bin = (
+            pd.Timestamp(file_start + timedelta(seconds=time_sec * unit_sec))
+            .floor(offset)
+            .to_pydatetime()
+        )
+        if dfs_o is None:
+            out_start = bin_start = current_bin
+            dfs_o = _clone(
+                str(infilename),
+                str(outfilename),
+                start_time=out_start,
+                timestep=(
+                    dt_out / unit_sec
+                    if time_axis.TimeAxisType == TimeAxisType.CalendarEquidistant
+                    else None
+                ),
+                items=item_numbers,
+            )
+
+        while current_bin > bin_start:
+            # interval is complete
+            _write_bin()
+            timestep_out += 1
+            bin_start = bin_start + timedelta(seconds=dt_out)
+            accumulators = [_TimeAccumulator(h) for h in item_hows]
+
+        for item_out, item in enumerate(item_numbers):
+            if item_out > 0:
+                itemdata = dfs_i.ReadItemTimeStep(item + 1, timestep)
+            d = itemdata.Data.astype(np.float64)
+            d[d == deletevalue] = np.nan
+            accumulators[item_out].add(d)
+
+    dfs_i.Close()
+    if dfs_o is None:
+        raise ValueError("No time steps selected")
+
+    _write_bin()
     dfs_o.Close()
 
 
+@instrumented("generic.rolling")
+def rolling(
+    infilename: str | pathlib.Path,
+    outfilename: str | pathlib.Path,
+    window: int,
+    how: str = "mean",
+    *,
+    center: bool = False,
+    min_periods: int | None = None,
+    items: Sequence[int | str] | None = None,
+) -> None:
+    """Rolling window statistics along the time axis, e.g. a 25-hour running mean
+
+    The input file is read one time step at a time; only the last `window`
+    time steps per item are kept in memory (ring buffer). The output file
+    has the same time axis as the input file, and the result is labelled
+    like `pandas.Series.rolling`, i.e. by the last time step in the window,
+    or by the center of the window if center is True.
+
+    In layered dfsu files the Z coordinate item is always included and averaged.
+
+    Parameters
+    ----------
+    infilename : str | pathlib.Path
+        input filename
+    outfilename : str | pathlib.Path
+        output filename
+    window : int
+        number of time steps in the window
+    how : str, optional
+        statistic, one of "mean", "sum", "min" or "max", by default "mean"
+    center : bool, optional
+        label the result by the center of the window, by default False
+    min_periods : int, optional
+        minimum number of valid (non-delete) values in the window required
+        to produce a value, by default window
+    items : int, list(int), str, list(str), optional
+        items to be included in the new file, by default all
+
+    Examples
+    --------
+    >>> rolling("hourly.dfsu", "tidal_filtered.dfsu", window=25, center=True)
+    >>> rolling("f_in.dfs0", "f_max.dfs0", window=6, how="max", min_periods=1)
+    """
+    if window < 1:
+        raise ValueError(f"window must be a positive integer, not {window}")
+    n_min = window if min_periods is None else min_periods
+    if how not in _TimeAccumulator.HOW:
+        raise ValueError(f"how must be one of {_TimeAccumulator.HOW}, not '{how}'")
+
+    dfs_i = _wrap(DfsFileFactory.DfsGenericOpen(str(infilename)))
+
+    is_layered_dfsu = dfs_i.ItemInfo[0].Name == "Z coordinate"
+
+    item_numbers = _valid_item_numbers(
+        dfs_i.ItemInfo, items, ignore_first=is_layered_dfsu
+    )
+    item_hows = [how] * len(item_numbers)
+
+    if is_layered_dfsu:
+        item_numbers = [it + 1 for it in item_numbers]
+        item_numbers.insert(0, 0)
+        item_hows.insert(0, "mean")
+
+    n_time_steps = dfs_i.FileInfo.TimeAxis.NumberOfTimeSteps
+    deletevalue = dfs_i.FileInfo.DeleteValueFloat
+
+    dfs_o = _clone(infilename, outfilename, items=item_numbers)
+
+    windows = [
+        _RollingWindow(window, h, dfs_i.ItemInfo[item].ElementCount)
+        for item, h in zip(item_numbers, item_hows)
+    ]
+    _buffer(*[rw._buffer for rw in windows])
+
+    # the result for a time step is available when lag more steps have been added
+    lag = (window - 1) // 2 if center else 0
+    times: deque = deque()
+
+    def _write_step(timestep_out: int) -> None:
+        time_sec = times.popleft()
+        for item_out, rw in enumerate(windows):
+            darray = rw.result(min_periods=n_min).astype(np.float32)
+            darray[np.isnan(darray)] = deletevalue
+            dfs_o.WriteItemTimeStep(item_out + 1, timestep_out, time_sec, darray)
+
+    for timestep in trange(n_time_steps, disable=not show_progress):
+        for item, rw in zip(item_numbers, windows):
+            itemdata = dfs_i.ReadItemTimeStep(item + 1, timestep)
+            d = itemdata.Data.astype(np.float64)
+            d[d == deletevalue] = np.nan
+            rw.add(d)
+        times.append(itemdata.Time)
+
+        if timestep >= lag:
+            _write_step(timestep - lag)
+
+    # the windows of the last steps extend beyond the end of the file
+    for timestep_out in range(max(n_time_steps - lag, 0), n_time_steps):
+        while windows[0].n_steps < timestep_out + lag + 1:
+            for rw in windows:
+                rw.add(np.full(rw.n_data, np.nan))
+        _write_step(timestep_out)
+
+    dfs_i.Close()
+    dfs_o.Close()
+
+
+@instrumented("generic.quantile")
 def quantile(
     infilename: str | pathlib.Path,
     outfilename: str | pathlib.Path,
@@ -808,6 +1363,7 @@ def quantile(
     items: Sequence[int | str] | None = None,
     skipna: bool = True,
     buffer_size: float = 1.0e9,
+    sidecar: str | pathlib.Path | None = None,
 ) -> None:
     """Create temporal quantiles of all items in dfs file
 
@@ -828,6 +1384,10 @@ def quantile(
         for huge files the quantiles need to be calculated for chunks of
         elements. buffer_size gives the maximum amount of memory available
         for the computation in bytes, by default 1e9 (=1GB)
+    sidecar: str | pathlib.Path, optional
+        element-major store of infilename created with `transpose()`;
+        if given, the data for each chunk of elements is read from the
+        store instead of reading all time steps of the dfs file per chunk
 
     Examples
     --------
@@ -836,10 +1396,13 @@ def quantile(
     >>> quantile("huge.dfsu", "Q01.dfsu", q=0.1, buffer_size=5.0e9)
 
     >>> quantile("with_nans.dfsu", "Q05.dfsu", q=0.5, skipna=False)
+
+    >>> transpose("huge.dfsu", "huge_sidecar")
+    >>> quantile("huge.dfsu", "Q99.dfsu", q=0.99, sidecar="huge_sidecar")
     """
     func = np.nanquantile if skipna else np.quantile
 
-    dfs_i = DfsFileFactory.DfsGenericOpen(infilename)
+    dfs_i = _wrap(DfsFileFactory.DfsGenericOpen(infilename))
 
     is_dfsu_3d = dfs_i.ItemInfo[0].Name == "Z coordinate"
 
@@ -856,6 +1419,14 @@ def quantile(
 
     ci = _ChunkInfo.from_dfs(dfs_i, item_numbers, buffer_size)
 
+    store = None
+    if sidecar is not None:
+        store = TransposedStore(sidecar)
+        if store.n_timesteps != n_time_steps:
+            raise ValueError(
+                f"Sidecar has {store.n_timesteps} time steps, but file has {n_time_steps}"
+            )
+
     qvec: Sequence[float] = [q] if isinstance(q, float) else q
     qtxt = [f"Quantile {q!r}" for q in qvec]
     core_items = [dfs_i.ItemInfo[i] for i in item_numbers]
@@ -878,6 +1449,7 @@ def quantile(
         for _ in qvec:
             outdatalist.append(np.zeros_like(indata))
         datalist.append(np.zeros((n_time_steps, ci.chunk_size)))
+    _buffer(*datalist, *outdatalist)
 
     e1 = 0
     for _ in range(ci.n_chunks):
@@ -886,19 +1458,23 @@ def quantile(
         chunk_end = ci.chunk_end(e1)
 
         # read all data for this chunk
-        for timestep in range(n_time_steps):
-            item_out = 0
-            for item_no in item_numbers:
-                itemdata = _read_item(dfs_i, item_no, timestep)
-                data_chunk = itemdata[e1:e2]
-                datalist[item_out][timestep, 0:chunk_end] = data_chunk
-                item_out += 1
+        if store is not None:
+            for item_out, item_no in enumerate(item_numbers):
+                data_chunk = store._item_values(item_no)[e1:e2]
+                datalist[item_out][:, 0:chunk_end] = data_chunk.T
+        else:
+            for timestep in range(n_time_steps):
+                item_out = 0
+                for item_no in item_numbers:
+                    itemdata = _read_item(dfs_i, item_no, timestep)
+                    data_chunk = itemdata[e1:e2]
+                    datalist[item_out][timestep, 0:chunk_end] = data_chunk
+                    item_out += 1
 
         # calculate quantiles (for this chunk)
         item_out = 0
         for item in range(n_items_in):
-            qdat = np.zeros((len(qvec), (ci.chunk_size)))
-            qdat[:, :] = func(datalist[item][:, 0:chunk_end], q=qvec, axis=0)
+            qdat = func(datalist[item][:, 0:chunk_end], q=qvec, axis=0)
             for j in range(len(qvec)):
                 outdatalist[item_out][e1:e2] = qdat[j, :]
                 item_out += 1
@@ -917,6 +1493,535 @@ def quantile(
     dfs_o.Close()
 
 
+class Pipeline:
+    """Chain of generic operations applied in a single pass over a dfs file
+
+    The operations are collected by calling the methods of the pipeline
+    (each returning the pipeline itself) and executed when calling `to()`.
+    Each time step is read once, all operations are applied in memory, and
+    the result is written directly to the output file, avoiding the
+    intermediate files created when calling e.g. `extract()`, `scale()`
+    and `avg_time()` one after the other.
+
+    Parameters
+    ----------
+    infilename : str | pathlib.Path
+        input filename
+
+    Examples
+    --------
+    >>> from mikeio import generic
+    >>> (
+    ...     generic.Pipeline("hourly.dfsu")
+    ...     .select(items="Surface elevation", start="2018-1-1")
+    ...     .scale(factor=100.0)
+    ...     .where(lambda x: x > 0.0)
+    ...     .reduce("mean")
+    ...     .to("mean_positive_elevation.dfsu")
+    ... )
+    """
+
+    def __init__(self, infilename: str | pathlib.Path):
+        self.infilename = str(infilename)
+        self._items: Sequence[int | str] | None = None
+        self._start: int | float | str | datetime = 0
+        self._end: int | float | str | datetime = -1
+        self._step = 1
+        self._stages: List[
+            Tuple[str, Callable[[np.ndarray], np.ndarray], Sequence[int | str] | None]
+        ] = []
+        self._how: str | None = None
+        self._skipna = True
+
+    def __repr__(self) -> str:
+        out = [f"Pipeline: {self.infilename}"]
+        if self._items is not None or (self._start, self._end, self._step) != (
+            0,
+            -1,
+            1,
+        ):
+            out.append(
+                f"  select(items={self._items!r}, start={self._start!r}, end={self._end!r}, step={self._step})"
+            )
+        for name, _, items in self._stages:
+            out.append(f"  {name}(items={items!r})")
+        if self._how is not None:
+            out.append(f"  reduce('{self._how}')")
+        return "\n".join(out)
+
+    def select(
+        self,
+        items: Sequence[int | str] | int | str | None = None,
+        start: int | float | str | datetime = 0,
+        end: int | float | str | datetime = -1,
+        step: int = 1,
+    ) -> "Pipeline":
+        """Select items and time steps, see `extract()`
+
+        Parameters
+        ----------
+        items : int, list(int), str, list(str), optional
+            items to include in the output, by default all
+        start : int, float, str or datetime, optional
+            start of selection as either step, relative seconds
+            or datetime/str, by default 0 (start of file)
+        end : int, float, str or datetime, optional
+            end of selection as either step, relative seconds
+            or datetime/str, by default -1 (end of file)
+        step : int, optional
+            jump this many step, by default 1 (every step between start and end)
+        """
+        self._items = [items] if isinstance(items, (int, str)) else items
+        self._start = start
+        self._end = end
+        self._step = step
+        return self
+
+    def scale(
+        self,
+        offset: float = 0.0,
+        factor: float = 1.0,
+        items: Sequence[int | str] | None = None,
+    ) -> "Pipeline":
+        """Apply scaling, see `scale()`
+
+        Parameters
+        ----------
+        offset: float, optional
+            value to add to all items, default 0.0
+        factor: float, optional
+            value to multiply to all items, default 1.0
+        items: List[str] or List[int], optional
+            Process only selected items, by number (0-based) or name, by default: all
+        """
+
+        def _scale(d: np.ndarray) -> np.ndarray:
+            return d * factor + offset
+
+        self._stages.append(("scale", _scale, items))
+        return self
+
+    def where(
+        self,
+        cond: Callable[[np.ndarray], np.ndarray],
+        items: Sequence[int | str] | None = None,
+    ) -> "Pipeline":
+        """Keep values where condition is True, replace others with delete value
+
+        Parameters
+        ----------
+        cond: Callable
+            function taking the data of a time step as a numpy array
+            and returning a boolean array of the same shape
+        items: List[str] or List[int], optional
+            Process only selected items, by number (0-based) or name, by default: all
+        """
+
+        def _where(d: np.ndarray) -> np.ndarray:
+            with np.errstate(invalid="ignore"):
+                mask = np.asarray(cond(d), dtype=bool)
+            return np.where(mask, d, np.nan)
+
+        self._stages.append(("where", _where, items))
+        return self
+
+    def reduce(self, how: str = "mean", skipna: bool = True) -> "Pipeline":
+        """Reduce the time dimension to a single time step, see `avg_time()`
+
+        Parameters
+        ----------
+        how: str, optional
+            statistic, one of "mean", "sum", "min" or "max", by default "mean"
+        skipna : bool, optional
+            exclude NaN/delete values when computing the result, default True.
+            If False, a NaN/delete value in any time step gives a delete value
+        """
+        if how not in _TimeAccumulator.HOW:
+            raise ValueError(f"how must be one of {_TimeAccumulator.HOW}, not '{how}'")
+        self._how = how
+        self._skipna = skipna
+        return self
+
+    @instrumented("generic.Pipeline")
+    def to(self, outfilename: str | pathlib.Path) -> None:
+        """Execute the pipeline and write the result to a new dfs file
+
+        Parameters
+        ----------
+        outfilename : str | pathlib.Path
+            output filename
+        """
+        dfs_i = _wrap(DfsFileFactory.DfsGenericOpen(self.infilename))
+
+        is_layered_dfsu = dfs_i.ItemInfo[0].Name == "Z coordinate"
+
+        file_start_new, start_step, start_sec, end_step, end_sec = _parse_start_end(
+            dfs_i.FileInfo.TimeAxis, self._start, self._end
+        )
+        timestep = _parse_step(dfs_i.FileInfo.TimeAxis, self._step)
+
+        def _item_numbers(items: Sequence[int | str] | None) -> List[int]:
+            numbers = _valid_item_numbers(
+                dfs_i.ItemInfo, items, ignore_first=is_layered_dfsu
+            )
+            return [it + 1 for it in numbers] if is_layered_dfsu else numbers
+
+        item_numbers = _item_numbers(self._items)
+        stages_per_item: List[List[Callable[[np.ndarray], np.ndarray]]] = [
+            [] for _ in item_numbers
+        ]
+        for name, func, items in self._stages:
+            stage_items = item_numbers if items is None else _item_numbers(items)
+            for item in stage_items:
+                if item not in item_numbers:
+                    raise ValueError(
+                        f"{name}: item '{dfs_i.ItemInfo[item].Name}' is not selected"
+                    )
+                stages_per_item[item_numbers.index(item)].append(func)
+
+        if is_layered_dfsu:
+            item_numbers.insert(0, 0)
+            stages_per_item.insert(0, [])
+
+        deletevalue = dfs_i.FileInfo.DeleteValueFloat
+
+        dfs_o = _clone(
+            self.infilename,
+            str(outfilename),
+            start_time=file_start_new,
+            timestep=timestep,
+            items=item_numbers,
+        )
+
+        file_start_shift = 0.0
+        if file_start_new is not None:
+            file_start_orig = dfs_i.FileInfo.TimeAxis.StartDateTime
+            file_start_shift = (file_start_new - file_start_orig).total_seconds()
+
+        accumulators = None
+        if self._how is not None:
+            accumulators = [_TimeAccumulator(self._how) for _ in item_numbers]
+
+        timestep_out = -1
+        for timestep in trange(
+            start_step, end_step, self._step, disable=not show_progress
+        ):
+            itemdata = dfs_i.ReadItemTimeStep(item_numbers[0] + 1, timestep)
+            time_sec = itemdata.Time
+            if time_sec > end_sec:
+                break
+            if time_sec < start_sec:
+                continue
+            timestep_out = timestep_out + 1
+            time_sec_out = time_sec - file_start_shift
+
+            for item_out, item in enumerate(item_numbers):
+                if item_out > 0:
+                    itemdata = dfs_i.ReadItemTimeStep(item + 1, timestep)
+                d = itemdata.Data.astype(np.float64)
+                d[d == deletevalue] = np.nan
+                for func in stages_per_item[item_out]:
+                    d = func(d)
+
+                if accumulators is not None:
+                    accumulators[item_out].add(d)
+                else:
+                    d[np.isnan(d)] = deletevalue
+                    darray = d.astype(itemdata.Data.dtype)
+                    dfs_o.WriteItemTimeStep(
+                        (item_out + 1), timestep_out, time_sec_out, darray
+                    )
+
+        if accumulators is not None:
+            if timestep_out < 0:
+                dfs_i.Close()
+                dfs_o.Close()
+                raise ValueError("No time steps selected")
+            # skipna=False: a single NaN/delete value gives a delete value
+            min_count = 1 if self._skipna else timestep_out + 1
+            for acc in accumulators:
+                darray = acc.result(min_count=min_count).astype(np.float32)
+                darray[np.isnan(darray)] = deletevalue
+                dfs_o.WriteItemTimeStepNext(0.0, darray)
+
+        dfs_i.Close()
+        dfs_o.Close()
+
+
+@instrumented("generic.transpose")
+def transpose(
+    infilename: str | pathlib.Path,
+    sidecar: str | pathlib.Path,
+    *,
+    items: Sequence[int | str] | None = None,
+    block_size: float = 1.0e8,
+) -> None:
+    """Create an element-major (time series optimized) copy of a dfs file
+
+    Dfs files are stored time step by time step, so reading the full time
+    series of a single element requires reading every time step of the file.
+    The sidecar is a directory with one binary array of shape
+    (n_elements, n_timesteps) per item (delete values stored as NaN), such
+    that the time series of an element is a single contiguous read.
+    Use `TransposedStore` to read from the sidecar.
+
+    The file is read once, in blocks of time steps; the memory use is
+    bounded by block_size.
+
+    Parameters
+    ----------
+    infilename : str | pathlib.Path
+        input filename
+    sidecar : str | pathlib.Path
+        output directory
+    items: List[str] or List[int], optional
+        Process only selected items, by number (0-based) or name, by default: all
+    block_size: float, optional
+        maximum amount of memory used for the block of time steps
+        in bytes, by default 1e8 (=100MB)
+
+    Examples
+    --------
+    >>> transpose("HD.dfsu", "HD_sidecar")
+    >>> store = TransposedStore("HD_sidecar")
+    >>> ds = store.read(elements=[10, 20])
+    """
+    dfs_i = _wrap(DfsFileFactory.DfsGenericOpen(str(infilename)))
+    time_axis = dfs_i.FileInfo.TimeAxis
+
+    item_numbers = _valid_item_numbers(dfs_i.ItemInfo, items)
+    item_infos = _get_item_info(dfs_i.ItemInfo, item_numbers)
+    n_data = [dfs_i.ItemInfo[item].ElementCount for item in item_numbers]
+
+    n_time_steps = time_axis.NumberOfTimeSteps
+    deletevalue = dfs_i.FileInfo.DeleteValueFloat
+
+    n_block = max(1, int(block_size // (4 * np.sum(n_data))))
+    n_block = min(n_block, n_time_steps)
+
+    path = pathlib.Path(sidecar)
+    path.mkdir(parents=True, exist_ok=True)
+
+    arrays = [
+        np.lib.format.open_memmap(
+            path / f"item_{item}.npy",
+            mode="w+",
+            dtype=np.float32,
+            shape=(n, n_time_steps),
+        )
+        for item, n in zip(item_numbers, n_data)
+    ]
+    buffers = [np.zeros((n_block, n), dtype=np.float32) for n in n_data]
+    _buffer(*buffers)
+    time_sec = np.zeros(n_time_steps)
+
+    for t1 in trange(0, n_time_steps, n_block, disable=not show_progress):
+        t2 = min(t1 + n_block, n_time_steps)
+        for timestep in range(t1, t2):
+            for item, buffer in zip(item_numbers, buffers):
+                itemdata = dfs_i.ReadItemTimeStep(item + 1, timestep)
+                d = itemdata.Data
+                buffer[timestep - t1] = d
+                time_sec[timestep] = itemdata.Time
+        for array, buffer in zip(arrays, buffers):
+            block = buffer[: t2 - t1].T
+            block[block == deletevalue] = np.nan
+            array[:, t1:t2] = block
+
+    for array in arrays:
+        array.flush()
+    dfs_i.Close()
+
+    # source relative to the sidecar, such that they can be moved together
+    source = pathlib.Path(infilename).resolve()
+    try:
+        source_path = os.path.relpath(source, path.resolve())
+    except ValueError:  # e.g. different drives on Windows
+        source_path = str(source)
+
+    info = {
+        "source": source_path,
+        "start_time": time_axis.StartDateTime.isoformat(),
+        "time": time_sec.tolist(),
+        "items": [
+            {
+                "number": item,
+                "name": iteminfo.name,
+                "type": int(iteminfo.type),
+                "unit": int(iteminfo.unit),
+                "n_data": n,
+            }
+            for item, iteminfo, n in zip(item_numbers, item_infos, n_data)
+        ],
+    }
+    with open(path / "info.json", "w") as f:
+        json.dump(info, f, indent=2)
+
+
+class TransposedStore:
+    """Reader for element-major sidecars created with `transpose()`
+
+    The time series of each element is stored contiguously, making it
+    cheap to read all time steps for a few elements.
+
+    Parameters
+    ----------
+    sidecar : str | pathlib.Path
+        directory created with `transpose()`
+
+    Examples
+    --------
+    >>> transpose("HD.dfsu", "HD_sidecar")
+    >>> store = TransposedStore("HD_sidecar")
+    >>> ds = store.read(elements=[10, 20])
+    >>> ds = store.read(x=340000, y=6160000)
+    """
+
+    SPATIAL_SUFFIXES = (".dfsu", ".dfs1", ".dfs2", ".dfs3")
+
+    def __init__(self, sidecar: str | pathlib.Path):
+        self.path = pathlib.Path(sidecar)
+        with open(self.path / "info.json") as f:
+            info = json.load(f)
+        # absolute path (old sidecars) or relative to the sidecar
+        self.source = str((self.path / info["source"]).resolve())
+        self._item_numbers = [item["number"] for item in info["items"]]
+        self._items = [
+            ItemInfo(item["name"], EUMType(item["type"]), EUMUnit(item["unit"]))
+            for item in info["items"]
+        ]
+        self._time = pd.to_datetime(
+            info["time"], unit="s", origin=pd.Timestamp(info["start_time"])
+        )
+        self._geometry: Any = None
+
+    def __repr__(self) -> str:
+        out = [f"<TransposedStore>: {self.path}", f"source: {self.source}", "items:"]
+        for number, item in zip(self._item_numbers, self._items):
+            out.append(f"  {number}:  {item}")
+        out.append(
+            f"time: {self.time[0]} - {self.time[-1]} ({self.n_timesteps} records)"
+        )
+        return "\n".join(out)
+
+    @property
+    def items(self) -> List[ItemInfo]:
+        """Items in the store"""
+        return self._items
+
+    @property
+    def time(self) -> pd.DatetimeIndex:
+        """Time axis"""
+        return self._time
+
+    @property
+    def n_timesteps(self) -> int:
+        """Number of time steps"""
+        return len(self._time)
+
+    @property
+    def geometry(self) -> Any:
+        """Geometry of the source file
+
+        GeometryUndefined if the source is not a spatial file (e.g. dfs0)
+        or if the source file is no longer available
+        """
+        if self._geometry is None:
+            source = pathlib.Path(self.source)
+            if source.suffix.lower() in self.SPATIAL_SUFFIXES and source.exists():
+                self._geometry = mikeio.open(source).geometry
+            else:
+                self._geometry = GeometryUndefined()
+        return self._geometry
+
+    def _item_values(self, item: int) -> np.ndarray:
+        """Memory-mapped array (n_elements, n_timesteps) for item number in source file"""
+        if item not in self._item_numbers:
+            raise ValueError(f"Item {item} is not in the sidecar {self.path}")
+        return np.load(self.path / f"item_{item}.npy", mmap_mode="r")
+
+    def read(
+        self,
+        *,
+        items: str | int | Sequence[str | int] | None = None,
+        elements: int | Sequence[int] | np.ndarray | None = None,
+        x: float | None = None,
+        y: float | None = None,
+    ) -> mikeio.Dataset:
+        """Read the full time series of selected elements
+
+        Parameters
+        ----------
+        items: int, str, list[int] or list[str], optional
+            Read only selected items, by number (0-based) in the store,
+            or by name, by default None (=all)
+        elements: list[int], optional
+            Read only selected element ids, by default None (=all)
+        x, y: float, optional
+            Read only data for the element containing the (x,y) point,
+            (requires the dfsu source file)
+
+        Returns
+        -------
+        Dataset
+            A Dataset with data dimensions [t,elements]
+        """
+        if x is not None or y is not None:
+            if elements is not None:
+                raise ValueError("Cannot select both elements and x,y")
+            if isinstance(self.geometry, GeometryUndefined):
+                raise ValueError(
+                    f"Selecting by x,y requires the spatial source file {self.source}"
+                )
+            if not isinstance(
+                self.geometry, (GeometryFM2D, GeometryFM3D, GeometryFMVerticalProfile)
+            ):
+                raise ValueError(
+                    "Selecting by x,y is only supported for flexible mesh (dfsu) "
+                    f"sources, not {type(self.geometry).__name__}. "
+                    "Use elements (flat indices) instead."
+                )
+            elements = self.geometry.find_index(x=x, y=y)
+
+        names = [item.name for item in self._items]
+        if items is None:
+            idx = [i for i, name in enumerate(names) if name != "Z coordinate"]
+        else:
+            items = [items] if isinstance(items, (int, str)) else items
+            idx = [names.index(it) if isinstance(it, str) else it for it in items]
+
+        if elements is not None:
+            elements = np.atleast_1d(elements)
+
+        geometry: Any = GeometryUndefined()
+        if hasattr(self.geometry, "elements_to_geometry"):
+            if elements is None:
+                geometry = self.geometry
+            else:
+                geometry = self.geometry.elements_to_geometry(elements)
+
+        data = []
+        for i in idx:
+            values = self._item_values(self._item_numbers[i])
+            if elements is not None:
+                values = values[elements]
+            data.append(np.array(values.T, dtype=np.float32))
+
+        dims: Tuple[str, ...] = ("time", "element")
+        if elements is not None and len(elements) == 1:
+            # squeeze point data
+            dims = ("time",)
+            data = [d[:, 0] for d in data]
+
+        return mikeio.Dataset(
+            data,
+            self.time,
+            [self._items[i] for i in idx],
+            geometry=geometry,
+            dims=dims,
+        )
+
+
 def _read_item(dfs: DfsFile, item: int, timestep: int) -> np.ndarray:
     """Read item data from dfs file
 
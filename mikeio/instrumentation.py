@@ -0,0 +1,245 @@
+"""Throughput instrumentation of readers, writers and generic functions
+
+Each call to an instrumented function (e.g. `Dfsu.read`, `Dfs2.read`,
+`Dfs0.read`, `Dataset.to_dfs` and the functions in `mikeio.generic`)
+produces a `CallStats` record with the number of bytes and item time steps
+read and written, the time spent in mikecore and the peak size of the data
+buffers. The records are passed to the registered callbacks and logged on
+the "mikeio.instrumentation" logger at DEBUG level.
+
+Instrumentation is only active when a callback is registered or the
+logger is enabled for DEBUG, otherwise the overhead is a single check per call.
+
+Examples
+--------
+>>> import mikeio
+>>> from mikeio import instrumentation
+>>> with instrumentation.record() as records:
+...     ds = mikeio.read("HD2D.dfsu")
+>>> records[0].bytes_read
+>>> instrumentation.add_callback(lambda stats: print(stats.throughput))
+"""
+
+from __future__ import annotations
+import functools
+import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, List, TypeVar
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_callbacks: List[Callable[["CallStats"], None]] = []
+
+_current: ContextVar["CallStats" | None] = ContextVar(
+    "mikeio_instrumentation", default=None
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class CallStats:
+    """Statistics of a single call to an instrumented function
+
+    Attributes
+    ----------
+    name : str
+        name of the instrumented function, e.g. "Dfsu.read" or "generic.scale"
+    bytes_read : int
+        number of bytes of item data read from dfs files
+    bytes_written : int
+        number of bytes of item data written to dfs files
+    item_steps_read : int
+        number of item time steps read
+    item_steps_written : int
+        number of item time steps written
+    time_total : float
+        duration of the call in seconds
+    time_mikecore : float
+        time spent in mikecore reading and writing item data in seconds
+    peak_buffer : int
+        size of the largest data buffer in bytes
+    """
+
+    name: str
+    bytes_read: int = 0
+    bytes_written: int = 0
+    item_steps_read: int = 0
+    item_steps_written: int = 0
+    time_total: float = 0.0
+    time_mikecore: float = 0.0
+    peak_buffer: int = 0
+
+    @property
+    def time_processing(self) -> float:
+        """Time spent outside mikecore, e.g. NumPy post-processing (delete value masking, casts)"""
+        return max(self.time_total - self.time_mikecore, 0.0)
+
+    @property
+    def throughput(self) -> float:
+        """Bytes read and written per second"""
+        if self.time_total <= 0.0:
+            return 0.0
+        return (self.bytes_read + self.bytes_written) / self.time_total
+
+    def _buffer(self, nbytes: int) -> None:
+        self.peak_buffer = max(self.peak_buffer, int(nbytes))
+
+
+def add_callback(func: Callable[[CallStats], None]) -> None:
+    """Register a function to be called with the `CallStats` of every instrumented call"""
+    _callbacks.append(func)
+
+
+def remove_callback(func: Callable[[CallStats], None]) -> None:
+    """Unregister a function registered with `add_callback()`"""
+    _callbacks.remove(func)
+
+
+@contextmanager
+def record() -> Iterator[List[CallStats]]:
+    """Collect the `CallStats` of all instrumented calls within a with-block
+
+    Examples
+    --------
+    >>> with instrumentation.record() as records:
+    ...     generic.scale("in.dfsu", "out.dfsu", factor=2.0)
+    >>> records[0].time_mikecore
+    """
+    records: List[CallStats] = []
+    add_callback(records.append)
+    try:
+        yield records
+    finally:
+        remove_callback(records.append)
+
+
+def _enabled() -> bool:
+    return len(_callbacks) > 0 or logger.isEnabledFor(logging.DEBUG)
+
+
+def _emit(stats: CallStats) -> None:
+    logger.debug(
+        "%s: read %d bytes (%d item steps), wrote %d bytes (%d item steps), "
+        "%.3fs total, %.3fs in mikecore, peak buffer %d bytes",
+        stats.name,
+        stats.bytes_read,
+        stats.item_steps_read,
+        stats.bytes_written,
+        stats.item_steps_written,
+        stats.time_total,
+        stats.time_mikecore,
+        stats.peak_buffer,
+    )
+    for func in list(_callbacks):
+        func(stats)
+
+
+def instrumented(name: str) -> Callable[[F], F]:
+    """Decorator recording a `CallStats` for each call of the decorated function
+
+    Nested instrumented calls are accounted to the outermost call.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _current.get() is not None or not _enabled():
+                return func(*args, **kwargs)
+
+            stats = CallStats(name)
+            token = _current.set(stats)
+            t0 = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.time_total = perf_counter() - t0
+                _current.reset(token)
+                _emit(stats)
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def _buffer(*arrays: np.ndarray) -> None:
+    """Record the size of data buffers allocated by the current call"""
+    stats = _current.get()
+    if stats is not None:
+        stats._buffer(sum(a.nbytes for a in arrays))
+
+
+def _wrap(dfs: Any) -> Any:
+    """Wrap a mikecore dfs file to record reads and writes in the current call"""
+    stats = _current.get()
+    if stats is None or dfs is None or isinstance(dfs, _InstrumentedDfs):
+        return dfs
+    return _InstrumentedDfs(dfs, stats)
+
+
+class _InstrumentedDfs:
+    """Proxy of a mikecore dfs file recording reads and writes of item data"""
+
+    def __init__(self, dfs: Any, stats: CallStats) -> None:
+        self._dfs = dfs
+        self._stats = stats
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._dfs, name)
+
+    def _read(self, data: np.ndarray, n_item_steps: int, t0: float) -> None:
+        self._stats.time_mikecore += perf_counter() - t0
+        self._stats.bytes_read += data.nbytes
+        self._stats.item_steps_read += n_item_steps
+        self._stats._buffer(data.nbytes)
+
+    def _write(self, data: np.ndarray, n_item_steps: int, t0: float) -> None:
+        self._stats.time_mikecore += perf_counter() - t0
+        self._stats.bytes_written += data.nbytes
+        self._stats.item_steps_written += n_item_steps
+        self._stats._buffer(data.nbytes)
+
+    def ReadItemTimeStep(self, *args: Any, **kwargs: Any) -> Any:
+        t0 = perf_counter()
+        itemdata = self._dfs.ReadItemTimeStep(*args, **kwargs)
+        if itemdata is not None:
+            self._read(itemdata.Data, 1, t0)
+        return itemdata
+
+    def ReadItemTimeStepNext(self, *args: Any, **kwargs: Any) -> Any:
+        t0 = perf_counter()
+        itemdata = self._dfs.ReadItemTimeStepNext(*args, **kwargs)
+        if itemdata is not None:
+            self._read(itemdata.Data, 1, t0)
+        return itemdata
+
+    def ReadDfs0DataDouble(self) -> np.ndarray:
+        t0 = perf_counter()
+        data = self._dfs.ReadDfs0DataDouble()
+        n_time, n_cols = data.shape
+        self._read(data, n_time * (n_cols - 1), t0)
+        return data
+
+    def WriteItemTimeStep(
+        self, itemNo: int, timestepIndex: int, time: float, data: np.ndarray
+    ) -> None:
+        t0 = perf_counter()
+        self._dfs.WriteItemTimeStep(itemNo, timestepIndex, time, data)
+        self._write(data, 1, t0)
+
+    def WriteItemTimeStepNext(self, time: float, data: np.ndarray) -> None:
+        t0 = perf_counter()
+        self._dfs.WriteItemTimeStepNext(time, data)
+        self._write(data, 1, t0)
+
+    def WriteDfs0DataDouble(self, data: np.ndarray) -> None:
+        t0 = perf_counter()
+        self._dfs.WriteDfs0DataDouble(data)
+        n_time, n_cols = data.shape
+        self._write(data, n_time * (n_cols - 1), t0)
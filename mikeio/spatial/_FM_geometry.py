@@ -3,9 +3,11 @@ from collections import namedtuple
 from functools import cached_property
 from pathlib import Path
 from typing import (
+    Dict,
     List,
     Any,
     Literal,
+    Mapping,
     Sequence,
     Sized,
     Tuple,
@@ -17,13 +19,17 @@ import numpy as np
 from mikecore.DfsuFile import DfsuFileType
 from mikecore.eum import eumQuantity
 from mikecore.MeshBuilder import MeshBuilder
+from scipy.sparse import csr_matrix
 from scipy.spatial import cKDTree
 
 from ..eum import EUMType, EUMUnit
 from ..exceptions import OutsideModelDomainError
 from .._interpolation import get_idw_interpolant, interp2d
+from ._FM_index import _ElementIndex, _PolygonIndex
 from ._FM_utils import (
-    _get_node_centered_data,
+    _apply_node_centered_operator,
+    _create_tri_only_element_table,
+    _node_centered_operator,
     _plot_map,
     BoundaryPolylines,
     _set_xy_label_by_projection,  # TODO remove
@@ -32,14 +38,67 @@ from ._FM_utils import (
 from ._geometry import GeometryPoint2D, _Geometry
 
 from ._grid_geometry import Grid2D
+from .crs import CRS
 from ._utils import xy_to_bbox
 
 
 if TYPE_CHECKING:
     from ._FM_geometry_layered import GeometryFM3D
+    import geopandas
     from matplotlib.axes import Axes
 
 
+def _to_connectivity(
+    element_table: np.ndarray | List[Sequence[int]] | List[np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compact connectivity of an element table
+
+    Parameters
+    ----------
+    element_table : array or list
+        sequence of node ids for each element or a
+        (n_elements, max_nodes) array padded with -1
+
+    Returns
+    -------
+    np.ndarray
+        (n_elements, max_nodes) int32 array of node ids padded with -1
+    np.ndarray
+        number of nodes of each element
+    """
+    if isinstance(element_table, np.ndarray) and element_table.dtype != object:
+        if element_table.ndim != 2:
+            raise ValueError(
+                "element_table must be a 2d array or a sequence of node ids for each element"
+            )
+        table = element_table.astype(np.int32)
+        n_nodes_per_element = np.sum(table >= 0, axis=1, dtype=np.int32)
+        return table, n_nodes_per_element
+
+    n_elements = len(element_table)
+    n_nodes_per_element = np.fromiter(
+        (len(e) for e in element_table), dtype=np.int32, count=n_elements
+    )
+    max_nodes = int(n_nodes_per_element.max()) if n_elements > 0 else 0
+    table = np.full((n_elements, max_nodes), -1, dtype=np.int32)
+    for n in np.unique(n_nodes_per_element):
+        if n == 0:
+            continue
+        idx = np.flatnonzero(n_nodes_per_element == n)
+        table[idx, :n] = np.array([element_table[i] for i in idx])
+    return table, n_nodes_per_element
+
+
+def _split_connectivity(
+    connectivity: np.ndarray, n_nodes_per_element: np.ndarray
+) -> np.ndarray:
+    """Element table (object array with node ids for each element) from compact connectivity"""
+    element_table = np.empty(len(connectivity), dtype=object)
+    for j, n in enumerate(n_nodes_per_element):
+        element_table[j] = connectivity[j, :n]
+    return element_table
+
+
 class _GeometryFMPlotter:
     """Plot GeometryFM
 
@@ -109,6 +168,14 @@ class _GeometryFMPlotter:
         plot_type = kwargs.pop("plot_type")
 
         g = self.g
+        if isinstance(g, GeometryFM2D) and plot_type in (
+            "contour",
+            "contourf",
+            "shaded",
+        ):
+            # reuse the cached tri-only mesh and element to node operator
+            kwargs["tri_only_element_table"] = g._tri_only_element_table
+            kwargs["node_centered_operator"] = g._get_node_centered_operator()
 
         return _plot_map(
             node_coordinates=g.node_coordinates,
@@ -251,8 +318,9 @@ class _GeometryFM(_Geometry):
 
         self._type = dfsu_type
 
-        self.element_table, self._element_ids = self._check_elements(
-            element_table=element_table,
+        self._connectivity, self._n_nodes_per_element = _to_connectivity(element_table)
+        self._element_table: np.ndarray | None = None
+        self._element_ids = self._check_elements(
             element_ids=element_ids,
             validate=validate,
         )
@@ -260,79 +328,167 @@ class _GeometryFM(_Geometry):
         if reindex:
             self._reindex()
 
-    def _calc_element_coordinates(self, maxnodes: int = 4) -> np.ndarray:
-        element_table = self.element_table
-
-        n_elements = len(element_table)
-        ec = np.empty([n_elements, 3])
-
-        # pre-allocate for speed
-        idx = np.zeros(maxnodes, dtype=int)
-        xcoords = np.zeros([maxnodes, n_elements])
-        ycoords = np.zeros([maxnodes, n_elements])
-        zcoords = np.zeros([maxnodes, n_elements])
-        nnodes_per_elem = np.zeros(n_elements)
-
-        for j in range(n_elements):
-            nodes = element_table[j]
-            nnodes = len(nodes)
-            nnodes_per_elem[j] = nnodes
-            for i in range(nnodes):
-                idx[i] = nodes[i]  # - 1
-
-            x, y, z = self.node_coordinates[idx[:nnodes]].T
+    @property
+    def element_table(self) -> np.ndarray:
+        """Element table with an array of node ids for each element
 
-            xcoords[:nnodes, j] = x
-            ycoords[:nnodes, j] = y
-            zcoords[:nnodes, j] = z
+        The element table is read-only; changes must go through the setter,
+        e.g. ``g.element_table = new_table``, to keep derived properties
+        in sync.
+        """
+        if self._element_table is None:
+            connectivity = self._connectivity.view()
+            connectivity.flags.writeable = False
+            element_table = _split_connectivity(connectivity, self._n_nodes_per_element)
+            element_table.flags.writeable = False
+            self._element_table = element_table
+        return self._element_table
+
+    @element_table.setter
+    def element_table(
+        self, v: np.ndarray | List[Sequence[int]] | List[np.ndarray]
+    ) -> None:
+        connectivity, n_nodes_per_element = _to_connectivity(v)
+        if len(connectivity) != self.n_elements:
+            raise ValueError(
+                f"element_table must have length of elements ({self.n_elements})"
+            )
+        self._connectivity = connectivity
+        self._n_nodes_per_element = n_nodes_per_element
+        self._clear_derived()
+
+    def _clear_derived(self) -> None:
+        """Reset properties derived from the element table"""
+        self._element_table = None
+        for cls in type(self).__mro__:
+            for name, attr in vars(cls).items():
+                if isinstance(attr, cached_property):
+                    self.__dict__.pop(name, None)
 
-        ec[:, 0] = np.sum(xcoords, axis=0) / nnodes_per_elem
-        ec[:, 1] = np.sum(ycoords, axis=0) / nnodes_per_elem
-        ec[:, 2] = np.sum(zcoords, axis=0) / nnodes_per_elem
+    @property
+    def n_nodes_per_element(self) -> np.ndarray:
+        """Number of nodes of each element"""
+        return self._n_nodes_per_element
+
+    def _calc_element_coordinates(self) -> np.ndarray:
+        table = self._connectivity
+        valid = table >= 0
+        idx = np.where(valid, table, 0)
+        n_nodes = self._n_nodes_per_element
+
+        ec = np.empty([len(table), 3])
+        for i in range(3):
+            coords = self.node_coordinates[idx, i]
+            coords[~valid] = 0.0
+            ec[:, i] = np.sum(coords, axis=1) / n_nodes
 
         return ec
 
     def _check_elements(
         self,
-        element_table: np.ndarray | List[Sequence[int]] | List[np.ndarray],
         element_ids: np.ndarray | None = None,
         validate: bool = True,
-    ) -> tuple[Any, Any]:
-        if validate:
-            max_node_id = self._node_ids.max()
-            for i, e in enumerate(element_table):
-                # TODO: avoid looping through all elements (could be +1e6)!
-                if not isinstance(e, np.ndarray):
-                    e = np.asarray(e)
-                    element_table[i] = e
-
-                # NOTE: this check "e.max()" takes the most of the time when constructing a new FM_geometry
-                if e.max() > max_node_id:
-                    raise ValueError(
-                        f"Element table has node # {e.max()}. Max node id: {max_node_id}"
-                    )
-
+    ) -> np.ndarray:
+        n_elements = len(self._connectivity)
         if element_ids is None:
-            element_ids = np.arange(len(element_table))
+            element_ids = np.arange(n_elements)
         element_ids = np.asarray(element_ids)
 
-        # TODO make sure return type is np.ndarray
-        return element_table, element_ids
+        if validate and self._connectivity.size > 0:
+            table = self._connectivity
+
+            # node ids must be non-negative (-1 is only used for padding)
+            cols = np.arange(table.shape[1])
+            misplaced = (table >= 0) != (cols < self._n_nodes_per_element[:, None])
+            if misplaced.any():
+                elem = np.flatnonzero(misplaced.any(axis=1))[0]
+                raise ValueError(
+                    f"Element table has negative node id in element {elem}"
+                )
+
+            max_node_id = self._node_ids.max()
+            max_elem_node = table.max()
+            if max_elem_node > max_node_id:
+                elem = np.flatnonzero((table > max_node_id).any(axis=1))[0]
+                raise ValueError(
+                    f"Element table has node # {max_elem_node} (element {elem}). Max node id: {max_node_id}"
+                )
+
+            if len(element_ids) != n_elements:
+                raise ValueError(
+                    f"element_ids must have length of elements ({n_elements})"
+                )
+
+        return element_ids
 
     def _reindex(self) -> None:
         new_node_ids = np.arange(self.n_nodes)
         new_element_ids = np.arange(self.n_elements)
-        node_dict = dict(zip(self._node_ids, new_node_ids))
-        for eid in range(self.n_elements):
-            elem_nodes = self.element_table[eid]
-            new_elem_nodes = np.zeros_like(elem_nodes)
-            for jn, idx in enumerate(elem_nodes):
-                new_elem_nodes[jn] = node_dict[idx]
-            self.element_table[eid] = new_elem_nodes
+
+        # map node ids to their position in node_ids
+        table = self._connectivity
+        valid = table >= 0
+        sorter = np.argsort(self._node_ids, kind="stable")
+        pos = np.searchsorted(self._node_ids, table[valid], sorter=sorter)
+        pos = np.minimum(pos, len(sorter) - 1)
+        new_nodes = sorter[pos]
+        if not np.array_equal(self._node_ids[new_nodes], table[valid]):
+            raise ValueError("Element table contains node ids not in node_ids")
+        table = table.copy()
+        table[valid] = new_nodes
+        self._connectivity = table
+        self._element_table = None
 
         self._node_ids = new_node_ids
         self._element_ids = new_element_ids
 
+    def _get_nodes_and_table_for_elements(
+        self, elements: np.ndarray | Sequence[int]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """list of nodes and element table for a list of elements
+
+        Parameters
+        ----------
+        elements : np.array(int)
+            array of element ids
+
+        Returns
+        -------
+        np.array(int)
+            array of node ids (unique)
+        np.array(int)
+            element table (n_elements, max_nodes) with node ids, padded with -1
+        """
+        table = self._connectivity[elements]
+        n_nodes = self._n_nodes_per_element[elements]
+        if len(n_nodes) > 0:
+            table = table[:, : n_nodes.max()]
+        nodes = np.unique(table[table >= 0])
+        return nodes, table
+
+    def _subset_connectivity(
+        self, elements: np.ndarray | Sequence[int]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """list of nodes and reindexed element table for a list of elements
+
+        Returns
+        -------
+        np.array(int)
+            array of node ids (unique)
+        np.array(int)
+            element table (n_elements, max_nodes) with indices into
+            the node ids, padded with -1
+        """
+        table = self._connectivity[elements]
+        n_nodes = self._n_nodes_per_element[elements]
+        if len(n_nodes) > 0:
+            table = table[:, : n_nodes.max()]
+        valid = table >= 0
+        nodes, inverse = np.unique(table[valid], return_inverse=True)
+        new_table = np.full(table.shape, -1, dtype=np.int32)
+        new_table[valid] = inverse
+        return nodes, new_table
+
     @property
     def default_dims(self) -> Tuple[str, ...]:
         return ("element",)
@@ -359,15 +515,12 @@ class _GeometryFM(_Geometry):
     def element_ids(self) -> np.ndarray:
         return self._element_ids
 
-    @cached_property
+    @property
     def max_nodes_per_element(self) -> int:
         """The maximum number of nodes for an element"""
-        maxnodes = 0
-        for local_nodes in self.element_table:
-            n = len(local_nodes)
-            if n > maxnodes:
-                maxnodes = n
-        return maxnodes
+        if len(self._n_nodes_per_element) == 0:
+            return 0
+        return int(self._n_nodes_per_element.max())
 
     @property
     def codes(self) -> np.ndarray:
@@ -441,19 +594,6 @@ class GeometryFM2D(_GeometryFM):
             f"projection: {self.projection_string}"
         )
 
-    @staticmethod
-    def _point_in_polygon(xn: np.ndarray, yn: np.ndarray, xp: float, yp: float) -> bool:
-        """Check for each side in the polygon that the point is on the correct side"""
-
-        for j in range(len(xn) - 1):
-            if (yn[j + 1] - yn[j]) * (xp - xn[j]) + (-xn[j + 1] + xn[j]) * (
-                yp - yn[j]
-            ) > 0:
-                return False
-            if (yn[0] - yn[-1]) * (xp - xn[-1]) + (-xn[0] + xn[-1]) * (yp - yn[-1]) > 0:
-                return False
-        return True
-
     @staticmethod
     def _area_is_bbox(area: Sized) -> bool:
         return isinstance(area, Sized) and len(area) == 4
@@ -667,52 +807,72 @@ class GeometryFM2D(_GeometryFM):
         d, elem_id = self._tree2d.query(p, k=n)
         return elem_id, d
 
-    def _find_element_2d(self, coords: np.ndarray) -> Any:
-        points_outside = []
+    def _points_in_elements(self, xy: np.ndarray, elements: np.ndarray) -> np.ndarray:
+        """Check if each point is inside each of its candidate elements
 
-        coords = np.atleast_2d(coords)
-        nc = self.node_coordinates
+        Parameters
+        ----------
+        xy : np.array(float)
+            (n_points, 2) coordinates
+        elements : np.array(int)
+            (n_points, n_candidates) element ids
 
-        few_nearest, _ = self._find_n_nearest_2d_elements(
-            coords, n=min(self.n_elements, 2)
-        )
-        ids = np.atleast_2d(few_nearest)[:, 0]  # first guess
+        Returns
+        -------
+        np.array(bool)
+            (n_points, n_candidates) True if point is inside element
+        """
+        table = self._connectivity[elements]
+        n_nodes = self._n_nodes_per_element[elements][..., None]
+        cols = np.arange(table.shape[-1])
+        valid = cols < n_nodes
+        next_cols = np.where(cols + 1 < n_nodes, cols + 1, 0)
+        nodes0 = np.where(valid, table, 0)
+        nodes1 = np.take_along_axis(nodes0, next_cols, axis=-1)
 
-        for k in range(len(ids)):
-            # step 1: is nearest element = element containing point?
-            nodes = self.element_table[ids[k]]
-            element_found = self._point_in_polygon(
-                nc[nodes, 0], nc[nodes, 1], coords[k, 0], coords[k, 1]
-            )
+        xn = self.node_coordinates[:, 0]
+        yn = self.node_coordinates[:, 1]
+        xp = xy[:, 0, None, None]
+        yp = xy[:, 1, None, None]
 
-            # step 2: if not, then try second nearest point
-            if not element_found and self.n_elements > 1:
-                candidate = few_nearest[k, 1]
-                assert np.isscalar(candidate)
-                nodes = self.element_table[candidate]
-                element_found = self._point_in_polygon(
-                    nc[nodes, 0], nc[nodes, 1], coords[k, 0], coords[k, 1]
-                )
-                ids[k] = few_nearest[k, 1]
+        # the point must be on the correct side of each face
+        outside = (yn[nodes1] - yn[nodes0]) * (xp - xn[nodes0]) + (
+            -xn[nodes1] + xn[nodes0]
+        ) * (yp - yn[nodes0]) > 0
+        return ~np.any(outside & valid, axis=-1)
 
-            # step 3: if not, then try with *many* more points
-            if not element_found and self.n_elements > 1:
-                many_nearest, _ = self._find_n_nearest_2d_elements(
-                    coords[k, :],
-                    n=min(self.n_elements, 10),  # TODO is 10 enough?
-                )
-                for p in many_nearest[2:]:  # we have already tried the two first above
-                    nodes = self.element_table[p]
-                    element_found = self._point_in_polygon(
-                        nc[nodes, 0], nc[nodes, 1], coords[k, 0], coords[k, 1]
-                    )
-                    if element_found:
-                        ids[k] = p
-                        break
-
-            if not element_found:
-                points_outside.append(k)
+    @cached_property
+    def _element_index(self) -> _ElementIndex:
+        table = self._connectivity
+        nodes = np.where(table >= 0, table, table[:, :1])
+        xn = self.node_coordinates[nodes, 0]
+        yn = self.node_coordinates[nodes, 1]
+        bboxes = np.column_stack(
+            [xn.min(axis=1), yn.min(axis=1), xn.max(axis=1), yn.max(axis=1)]
+        )
+        return _ElementIndex(bboxes)
 
+    def _find_element_2d(self, coords: np.ndarray) -> np.ndarray:
+        coords = np.atleast_2d(coords)
+        xy = coords[:, :2]
+        ids = np.full(len(xy), -1, dtype=int)
+        ec = self.element_coordinates
+
+        for chunk in np.array_split(np.arange(len(xy)), max(1, len(xy) // 100_000)):
+            xyc = xy[chunk]
+            points, elements = self._element_index.query_points(xyc)
+            inside = self._points_in_elements(xyc[points], elements[:, None])[:, 0]
+            points, elements = points[inside], elements[inside]
+
+            # points on a shared face or node: element with the nearest center
+            d2 = np.sum((ec[elements, :2] - xyc[points]) ** 2, axis=1)
+            order = np.lexsort((d2, points))
+            points, elements = points[order], elements[order]
+            first = np.ones(len(points), dtype=bool)
+            first[1:] = points[1:] != points[:-1]
+            ids[chunk[points[first]]] = elements[first]
+
+        points_outside = np.flatnonzero(ids < 0).tolist()
         if len(points_outside) > 0:
             raise OutsideModelDomainError(  # type: ignore
                 x=coords[points_outside, 0],
@@ -723,20 +883,7 @@ class GeometryFM2D(_GeometryFM):
         return ids
 
     def _find_single_element_2d(self, x: float, y: float) -> Any:
-        nc = self.node_coordinates
-
-        few_nearest, _ = self._find_n_nearest_2d_elements(
-            x=x, y=y, n=min(self.n_elements, 10)
-        )
-
-        for idx in few_nearest:
-            nodes = self.element_table[idx]
-            element_found = self._point_in_polygon(nc[nodes, 0], nc[nodes, 1], x, y)
-
-            if element_found:
-                return idx
-
-        raise OutsideModelDomainError(x=x, y=y)  # type: ignore
+        return self._find_element_2d(np.array([[x, y]]))[0]
 
     def get_overset_grid(
         self,
@@ -782,63 +929,46 @@ class GeometryFM2D(_GeometryFM):
         np.array(float)
             areas in m2
         """
-        n_elements = self.n_elements
+        return self._element_area.copy()
+
+    @cached_property
+    def _element_area(self) -> np.ndarray:
+        table = self._connectivity
+        if table.shape[1] < 3:
+            # line elements have no area
+            return np.zeros(len(table))
+        is_quad = np.isin(self._n_nodes_per_element, (4, 8))
+
+        # corner nodes a, b, c and d (d=c for triangles)
+        na, nb, nc = table[:, 0], table[:, 1], table[:, 2]
+        nd = np.where(is_quad, table[:, min(3, table.shape[1] - 1)], nc)
 
-        # Node coordinates
         xn = self.node_coordinates[:, 0]
         yn = self.node_coordinates[:, 1]
 
-        area = np.empty(n_elements)
-        xcoords = np.empty(8)
-        ycoords = np.empty(8)
-
-        for j in range(n_elements):
-            nodes = self.element_table[j]
-            n_nodes = len(nodes)
-
-            for i in range(n_nodes):
-                nidx = nodes[i]
-                xcoords[i] = xn[nidx]
-                ycoords[i] = yn[nidx]
-
-            # ab : edge vector corner a to b
-            abx = xcoords[1] - xcoords[0]
-            aby = ycoords[1] - ycoords[0]
-
-            # ac : edge vector corner a to c
-            acx = xcoords[2] - xcoords[0]
-            acy = ycoords[2] - ycoords[0]
-
-            isquad = False
-            if n_nodes > 3:
-                isquad = True
-                # ad : edge vector corner a to d
-                adx = xcoords[3] - xcoords[0]
-                ady = ycoords[3] - ycoords[0]
-
-            # if geographical coords, convert all length to meters
-            if self.is_geo:
-                earth_radius = 6366707.0
-                deg_to_rad = np.pi / 180.0
-                earth_radius_deg_to_rad = earth_radius * deg_to_rad
-
-                # Y on element centers
-                Ye = np.sum(ycoords[:n_nodes]) / n_nodes
-                cosYe = np.cos(np.deg2rad(Ye))
-
-                abx = earth_radius_deg_to_rad * abx * cosYe
-                aby = earth_radius_deg_to_rad * aby
-                acx = earth_radius_deg_to_rad * acx * cosYe
-                acy = earth_radius_deg_to_rad * acy
-                if isquad:
-                    adx = earth_radius_deg_to_rad * adx * cosYe
-                    ady = earth_radius_deg_to_rad * ady
-
-            # calculate area in m2
-            area[j] = 0.5 * (abx * acy - aby * acx)
-            if isquad:
-                area[j] = area[j] + 0.5 * (acx * ady - acy * adx)
-
+        # edge vectors from corner a to b, c and d
+        abx, aby = xn[nb] - xn[na], yn[nb] - yn[na]
+        acx, acy = xn[nc] - xn[na], yn[nc] - yn[na]
+        adx, ady = xn[nd] - xn[na], yn[nd] - yn[na]
+
+        # if geographical coords, convert all length to meters
+        if self.is_geo:
+            earth_radius = 6366707.0
+            deg_to_rad = np.pi / 180.0
+            earth_radius_deg_to_rad = earth_radius * deg_to_rad
+
+            # Y on element centers
+            cosYe = np.cos(np.deg2rad(self.element_coordinates[:, 1]))
+
+            abx = earth_radius_deg_to_rad * abx * cosYe
+            aby = earth_radius_deg_to_rad * aby
+            acx = earth_radius_deg_to_rad * acx * cosYe
+            acy = earth_radius_deg_to_rad * acy
+            adx = earth_radius_deg_to_rad * adx * cosYe
+            ady = earth_radius_deg_to_rad * ady
+
+        # calculate area in m2 (second triangle is empty for triangles)
+        area = 0.5 * (abx * acy - aby * acx) + 0.5 * (acx * ady - acy * adx)
         return np.abs(area)
 
     @cached_property
@@ -846,6 +976,14 @@ class GeometryFM2D(_GeometryFM):
         """Lists of closed polylines defining domain outline"""
         return self._get_boundary_polylines()
 
+    @cached_property
+    def _boundary_index(self) -> _PolygonIndex:
+        bnd = self.boundary_polylines
+        return _PolygonIndex(
+            exteriors=[p.xy for p in bnd.exteriors],
+            interiors=[p.xy for p in bnd.interiors],
+        )
+
     def contains(self, points: np.ndarray) -> np.ndarray:
         """test if a list of points are contained by mesh
 
@@ -859,52 +997,55 @@ class GeometryFM2D(_GeometryFM):
         bool array
             True for points inside, False otherwise
         """
-        import matplotlib.path as mp  # type: ignore
-
         points = np.atleast_2d(points)
 
-        exterior = self.boundary_polylines.exteriors[0]
-        cnts = mp.Path(exterior.xy).contains_points(points)
-
-        if self.boundary_polylines.n_exteriors > 1:
-            # in case of several dis-joint outer domains
-            for exterior in self.boundary_polylines.exteriors[1:]:
-                in_domain = mp.Path(exterior.xy).contains_points(points)
-                cnts = np.logical_or(cnts, in_domain)
-
-        # subtract any holes
-        for interior in self.boundary_polylines.interiors:
-            in_hole = mp.Path(interior.xy).contains_points(points)
-            cnts = np.logical_and(cnts, ~in_hole)
-
-        return cnts
+        # inside any of the (dis-joint) outer domains, but not in any hole
+        return self._boundary_index.contains(points[:, :2])
 
     def __contains__(self, pt: np.ndarray) -> bool:
         return self.contains(pt)[0]
 
-    def _get_boundary_polylines_uncategorized(self) -> List[List[np.int64]]:
+    def _get_boundary_polylines_uncategorized(self) -> List[List[int]]:
         """Construct closed polylines for all boundary faces"""
         boundary_faces = self._get_boundary_faces()
-        face_remains = boundary_faces.copy()
+        n_faces = len(boundary_faces)
+        n0 = boundary_faces[:, 0]
+        n1 = boundary_faces[:, 1]
+
+        # outgoing boundary faces of each node (in face order)
+        n_out = np.bincount(n0, minlength=self.n_nodes)
+        offsets = np.concatenate(([0], np.cumsum(n_out)))
+        out_faces = np.argsort(n0, kind="stable").tolist()
+        next_out = offsets[:-1].tolist()
+        end_out = offsets[1:].tolist()
+
+        start_nodes = n0.tolist()
+        end_nodes = n1.tolist()
+        used = [False] * n_faces
+        n_remains = n_faces
+        first = 0
         polylines = []
-        while face_remains.shape[0] > 1:
-            n0 = face_remains[:, 0]
-            n1 = face_remains[:, 1]
-            polyline = [n0[0], n1[0]]
-            index_to_delete = [0]
-            count = 0
-            end_points = face_remains[0, 1]
-            while True:
-                next_point_index = np.where(n0 == end_points)
-                if next_point_index[0].size != 0:
-                    polyline.append(face_remains[next_point_index[0][0], 1])
-                    index_to_delete.append(next_point_index[0][0])
-                    end_points = polyline[-1]
-                count += 1
-                if count > face_remains.shape[0] or polyline[0] == end_points:
+        while n_remains > 1:
+            while used[first]:
+                first += 1
+            used[first] = True
+            n_remains -= 1
+            polyline = [start_nodes[first], end_nodes[first]]
+            end_point = polyline[-1]
+            while end_point != polyline[0]:
+                # next unused face starting at end_point
+                k = next_out[end_point]
+                while k < end_out[end_point] and used[out_faces[k]]:
+                    k += 1
+                next_out[end_point] = k
+                if k == end_out[end_point]:
                     break
+                face = out_faces[k]
+                used[face] = True
+                n_remains -= 1
+                end_point = end_nodes[face]
+                polyline.append(end_point)
 
-            face_remains = np.delete(face_remains, index_to_delete, axis=0)
             polylines.append(polyline)
         return polylines
 
@@ -936,26 +1077,93 @@ class GeometryFM2D(_GeometryFM):
         n_int = len(poly_lines_int)
         return BoundaryPolylines(n_ext, poly_lines_ext, n_int, poly_lines_int)
 
-    def _get_boundary_faces(self) -> np.ndarray:
-        """Construct list of faces"""
-        element_table = self.element_table
+    @cached_property
+    def _faces(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Faces of all elements and the faces sharing each unique edge
 
-        all_faces = []
-        for el in element_table:
-            ele = [*el, el[0]]
-            for j in range(len(el)):
-                all_faces.append(ele[j : j + 2])
+        Returns
+        -------
+        np.array(int)
+            directed faces (n_faces, 2), face j of an element goes from
+            node j to node j+1 (or back to node 0)
+        np.array(int)
+            element and local face index of each face (n_faces, 2)
+        np.array(int)
+            first and second face of each unique edge (n_edges, 2),
+            -1 for edges on the boundary
+        """
+        table = self._connectivity
+        n_nodes = self._n_nodes_per_element[:, None]
+
+        cols = np.arange(table.shape[1])
+        valid = cols < n_nodes
+        next_cols = np.where(cols + 1 < n_nodes, cols + 1, 0)
+        faces = np.column_stack(
+            [table[valid], np.take_along_axis(table, next_cols, axis=1)[valid]]
+        )
+        face_ids = np.column_stack(np.nonzero(valid))
+
+        # unique key for each face regardless of direction
+        n_keys = int(table.max()) + 1 if table.size > 0 else 0
+        faces_sorted = np.sort(faces, axis=1).astype(np.int64)
+        face_keys = faces_sorted[:, 0] * n_keys + faces_sorted[:, 1]
+        order = np.argsort(face_keys, kind="stable")
+        sorted_keys = face_keys[order]
+
+        # faces with the same key share an edge
+        is_first = np.ones(len(order), dtype=bool)
+        is_first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+        first = np.flatnonzero(is_first)
+        has_second = np.diff(np.append(first, len(order))) > 1
+        edge_faces = np.full((len(first), 2), -1, dtype=int)
+        edge_faces[:, 0] = order[first]
+        edge_faces[has_second, 1] = order[first[has_second] + 1]
+
+        return faces, face_ids, edge_faces
 
-        all_faces = np.asarray(all_faces)
+    @cached_property
+    def _edges(self) -> np.ndarray:
+        """Unique edges (n_edges, 2) as sorted pairs of node ids"""
+        faces, _, edge_faces = self._faces
+        return np.sort(faces[edge_faces[:, 0]], axis=1)
 
-        all_faces_sorted = np.sort(all_faces, axis=1)
-        _, uf_id, face_counts = np.unique(
-            all_faces_sorted, axis=0, return_index=True, return_counts=True
+    @cached_property
+    def _edge_elements(self) -> np.ndarray:
+        """Elements on either side of each edge (n_edges, 2), -1 if boundary"""
+        _, face_ids, edge_faces = self._faces
+        return np.where(edge_faces >= 0, face_ids[edge_faces, 0], -1)
+
+    @cached_property
+    def _element_neighbours(self) -> np.ndarray:
+        """Neighbour element across each face (n_elements, max_nodes_per_element),
+        face j goes from node j to node j+1, -1 for boundary faces and unused slots
+        """
+        _, face_ids, edge_faces = self._faces
+        neighbours = np.full(self._connectivity.shape, -1, dtype=int)
+        inner = edge_faces[edge_faces[:, 1] >= 0]
+        f0, f1 = face_ids[inner[:, 0]], face_ids[inner[:, 1]]
+        neighbours[f0[:, 0], f0[:, 1]] = f1[:, 0]
+        neighbours[f1[:, 0], f1[:, 1]] = f0[:, 0]
+        return neighbours
+
+    @cached_property
+    def _node_elements(self) -> csr_matrix:
+        """Sparse (n_nodes, n_elements) node to element incidence matrix
+
+        The elements of node i are indices[indptr[i]:indptr[i+1]]
+        """
+        table = self._connectivity
+        valid = table >= 0
+        elements = np.nonzero(valid)[0]
+        return csr_matrix(
+            (np.ones(len(elements), dtype=np.int8), (table[valid], elements)),
+            shape=(self.n_nodes, self.n_elements),
         )
 
-        # boundary faces are those appearing only once
-        bnd_face_id = face_counts == 1
-        return all_faces[uf_id[bnd_face_id]]
+    def _get_boundary_faces(self) -> np.ndarray:
+        """Directed faces only belonging to one element"""
+        faces, _, edge_faces = self._faces
+        return faces[edge_faces[edge_faces[:, 1] < 0, 0]]
 
     def isel(
         self, idx: Sequence[int], keepdims: bool = False, **kwargs: Any
@@ -1059,11 +1267,9 @@ class GeometryFM2D(_GeometryFM):
 
     @staticmethod
     def _inside_polygon(polygon: np.ndarray, xy: np.ndarray) -> np.ndarray:
-        import matplotlib.path as mp
-
         if polygon.ndim == 1:
             polygon = np.column_stack((polygon[0::2], polygon[1::2]))
-        return mp.Path(polygon).contains_points(xy)
+        return _PolygonIndex(exteriors=[polygon], interiors=[]).contains(xy)
 
     def _elements_in_area(
         self, area: Sequence[float] | Sequence[Tuple[float, float]]
@@ -1071,15 +1277,18 @@ class GeometryFM2D(_GeometryFM):
         """Find 2d element ids of elements inside area"""
         if self._area_is_bbox(area):
             x0, y0, x1, y1 = area
-            xc = self.element_coordinates[:, 0]
-            yc = self.element_coordinates[:, 1]
+            idx = self._element_index.query_bbox((x0, y0, x1, y1))  # type: ignore
+            xc = self.element_coordinates[idx, 0]
+            yc = self.element_coordinates[idx, 1]
             mask = (xc >= x0) & (xc <= x1) & (yc >= y0) & (yc <= y1)
-            return np.where(mask)[0]
+            return idx[mask]
         elif self._area_is_polygon(area):
             polygon = np.array(area)
-            xy = self.element_coordinates[:, :2]
+            bbox = (*polygon.min(axis=0), *polygon.max(axis=0))
+            idx = self._element_index.query_bbox(bbox)
+            xy = self.element_coordinates[idx, :2]
             mask = self._inside_polygon(polygon, xy)
-            return np.where(mask)[0]
+            return idx[mask]
         else:
             raise ValueError("'area' must be bbox [x0,y0,x1,y1] or polygon")
 
@@ -1096,48 +1305,19 @@ class GeometryFM2D(_GeometryFM):
             return GeometryPoint2D(x=x, y=y, projection=self.projection)
 
         # extract information for selected elements
-
-        node_ids, elem_tbl = self._get_nodes_and_table_for_elements(sel_elements)
+        node_ids, elem_tbl = self._subset_connectivity(sel_elements)
         node_coords = self.node_coordinates[node_ids]
         codes = self.codes[node_ids]
-        elem_ids = self.element_ids[sel_elements]
 
         return GeometryFM2D(
             node_coordinates=node_coords,
             codes=codes,
-            node_ids=node_ids,
             projection=self.projection_string,
             element_table=elem_tbl,
-            element_ids=elem_ids,
             dfsu_type=self._type,
-            reindex=True,
+            validate=False,
         )
 
-    def _get_nodes_and_table_for_elements(
-        self, elements: np.ndarray | List[int]
-    ) -> tuple[Any, Any]:
-        """list of nodes and element table for a list of elements
-
-        Parameters
-        ----------
-        elements : np.array(int)
-            array of element ids
-
-        Returns
-        -------
-        np.array(int)
-            array of node ids (unique)
-        list(list(int))
-            element table with a list of nodes for each element
-        """
-        elem_tbl = np.empty(len(elements), dtype=np.dtype("O"))
-
-        for j, eid in enumerate(elements):
-            elem_tbl[j] = np.asarray(self.element_table[eid])
-
-        nodes = np.unique(np.hstack(elem_tbl))  # type: ignore
-        return nodes, elem_tbl
-
     def get_node_centered_data(
         self, data: np.ndarray, extrapolate: bool = True
     ) -> np.ndarray:
@@ -1146,20 +1326,41 @@ class GeometryFM2D(_GeometryFM):
         Parameters
         ----------
         data : np.array(float)
-            cell-centered data
+            cell-centered data, (n_elements,) or (n_time, n_elements)
         extrapolate : bool, optional
             allow the method to extrapolate, default:True
 
         Returns
         -------
         np.array(float)
-            node-centered data
+            node-centered data, (n_nodes,) or (n_time, n_nodes)
         """
-        geometry = self
-        nc = geometry.node_coordinates
-        ec = geometry.element_coordinates
-        elem_table = geometry.element_table
-        return _get_node_centered_data(nc, elem_table, ec, data, extrapolate)
+        operator = self._get_node_centered_operator(extrapolate)
+        return _apply_node_centered_operator(operator, data)
+
+    @cached_property
+    def _node_centered_operators(self) -> Dict[bool, csr_matrix]:
+        return {}
+
+    def _get_node_centered_operator(self, extrapolate: bool = True) -> csr_matrix:
+        """cached sparse element to node operator, see get_node_centered_data"""
+        if extrapolate not in self._node_centered_operators:
+            tri_table, parent = self._tri_only_element_table
+            self._node_centered_operators[extrapolate] = _node_centered_operator(
+                self.node_coordinates,
+                tri_table,
+                parent,
+                self.n_elements,
+                extrapolate,
+            )
+        return self._node_centered_operators[extrapolate]
+
+    @cached_property
+    def _tri_only_element_table(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Triangles (quads split in two) and the parent element of each triangle"""
+        return _create_tri_only_element_table(
+            self._connectivity, self._n_nodes_per_element
+        )
 
     def to_shapely(self) -> Any:
         """Export mesh as shapely MultiPolygon
@@ -1169,20 +1370,51 @@ class GeometryFM2D(_GeometryFM):
         shapely.geometry.MultiPolygon
             polygons with mesh elements
         """
-        from shapely.geometry import MultiPolygon, Polygon  # type: ignore
+        import shapely
+
+        return shapely.multipolygons(self._to_shapely_polygons())
 
-        polygons = []
-        for j in range(self.n_elements):
-            nodes = self.element_table[j]
-            pcoords = np.empty([len(nodes), 2])
-            for i in range(len(nodes)):
-                nidx = nodes[i]
-                pcoords[i, :] = self.node_coordinates[nidx, 0:2]
-            polygon = Polygon(pcoords)
-            polygons.append(polygon)
-        mp = MultiPolygon(polygons)
+    def to_geopandas(
+        self, data: Mapping[str, np.ndarray] | None = None
+    ) -> "geopandas.GeoDataFrame":
+        """Export mesh as geopandas GeoDataFrame with a polygon for each element
 
-        return mp
+        Parameters
+        ----------
+        data : dict, optional
+            element values (n_elements,) to add as columns, by column name
+
+        Returns
+        -------
+        geopandas.GeoDataFrame
+            element_id, data columns and element polygons
+        """
+        import geopandas as gpd
+
+        columns: Dict[str, np.ndarray] = {"element_id": self.element_ids}
+        for name, values in (data or {}).items():
+            values = np.asarray(values)
+            if values.shape != (self.n_elements,):
+                raise ValueError(
+                    f"data '{name}' must have shape ({self.n_elements},), got {values.shape}"
+                )
+            columns[name] = values
+
+        crs = None
+        if not self.is_local_coordinates:
+            crs = CRS(self.projection_string).to_pyproj()
+
+        return gpd.GeoDataFrame(columns, geometry=self._to_shapely_polygons(), crs=crs)
+
+    def _to_shapely_polygons(self) -> np.ndarray:
+        """Array with a shapely Polygon for each element"""
+        import shapely
+
+        table = self._connectivity
+        valid = table >= 0
+        xy = self.node_coordinates[table[valid], 0:2]
+        rings = shapely.linearrings(xy, indices=np.nonzero(valid)[0])
+        return shapely.polygons(rings)
 
     def to_mesh(self, outfilename: str | Path) -> None:
         """Export geometry to new mesh file
@@ -1199,7 +1431,9 @@ class GeometryFM2D(_GeometryFM):
         builder.SetNodes(nc[:, 0], nc[:, 1], nc[:, 2], self.codes)
         # builder.SetNodeIds(geom2d.node_ids+1)
         # builder.SetElementIds(geom2d.elements+1)
-        element_table_MZ = [np.asarray(row) + 1 for row in self.element_table]
+        element_table_MZ = _split_connectivity(
+            self._connectivity + 1, self._n_nodes_per_element
+        )
         builder.SetElements(element_table_MZ)
         builder.SetProjection(self.projection_string)
         quantity = eumQuantity.Create(EUMType.Bathymetry, EUMUnit.meter)
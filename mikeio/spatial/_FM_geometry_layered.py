@@ -2,14 +2,20 @@ from __future__ import annotations
 from functools import cached_property
 from pathlib import Path
 
-from typing import Any, Iterable, Literal, Sequence, List, Tuple
+from typing import Any, Dict, Iterable, Literal, Sequence, List, Tuple
 
 from matplotlib.axes import Axes
 import numpy as np
 from mikecore.DfsuFile import DfsuFileType
-
-
-from ._FM_geometry import GeometryFM2D, _GeometryFM, _GeometryFMPlotter
+from scipy.spatial import cKDTree
+
+from .._interpolation import get_idw_interpolant
+from ._FM_geometry import (
+    GeometryFM2D,
+    _GeometryFM,
+    _GeometryFMPlotter,
+    _to_connectivity,
+)
 from ._geometry import GeometryPoint3D
 
 from ._FM_utils import _plot_vertical_profile, BoundaryPolylines
@@ -19,6 +25,58 @@ from ._utils import _relative_cumulative_distance
 Layer = Literal["all", "bottom", "top"]
 
 
+class _ColumnTable:
+    """3d element ids of each column (2d element) from bottom to top
+
+    The ids of all columns are stored in one flat array, the ids of
+    column j are ids[offsets[j]:offsets[j+1]].
+
+    Parameters
+    ----------
+    offsets : np.array(int)
+        (n_columns + 1) start of each column in ids
+    ids : np.array(int)
+        3d element ids of all columns
+    """
+
+    def __init__(self, offsets: np.ndarray, ids: np.ndarray) -> None:
+        self.offsets = offsets
+        self.ids = ids
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += len(self)
+            return self.ids[self.offsets[key] : self.offsets[key + 1]]
+        # object array with one array of element ids per column
+        columns = np.arange(len(self))[key]
+        res = np.empty(len(columns), dtype=object)
+        for j, col in enumerate(columns):
+            res[j] = self[col]
+        return res
+
+    def __iter__(self) -> Any:
+        return (self[j] for j in range(len(self)))
+
+    @property
+    def n_layers(self) -> np.ndarray:
+        """Number of 3d elements in each column"""
+        return np.diff(self.offsets)
+
+    def elements(self, columns: Sequence[int] | np.ndarray) -> np.ndarray:
+        """3d element ids of the columns (concatenated)"""
+        columns = np.asarray(columns, dtype=int).ravel()
+        starts = self.offsets[columns]
+        counts = self.offsets[columns + 1] - starts
+        pos = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(
+            counts.sum()
+        )
+        return self.ids[pos]
+
+
 class _GeometryFMLayered(_GeometryFM):
     def __init__(
         self,
@@ -53,10 +111,17 @@ class _GeometryFMLayered(_GeometryFM):
 
         # Lazy properties
         self._bot_elems: np.ndarray | None = None
-        self._e2_e3_table: np.ndarray | None = None
+        self._e2_e3_table: _ColumnTable | None = None
         self._2d_ids: np.ndarray | None = None
         self._layer_ids: np.ndarray | None = None
 
+    def _clear_derived(self) -> None:
+        super()._clear_derived()
+        self._bot_elems = None
+        self._e2_e3_table = None
+        self._2d_ids = None
+        self._layer_ids = None
+
     def __repr__(self) -> str:
         return (
             f"Flexible Mesh Geometry: {self._type.name}\n"
@@ -120,29 +185,37 @@ class _GeometryFMLayered(_GeometryFM):
         if n_layers == 1:
             elem2d = self.elem2d_ids[sel_elements]
             geom2d = self.geometry2d
-            node_ids, elem_tbl = geom2d._get_nodes_and_table_for_elements(elem2d)
-            assert len(elem_tbl[0]) <= 4, "Not a 2D element"
+            node_ids, elem_tbl = geom2d._subset_connectivity(elem2d)
+            assert elem_tbl.shape[1] <= 4, "Not a 2D element"
             node_coords = geom2d.node_coordinates[node_ids]
             codes = geom2d.codes[node_ids]
-            elem_ids = self._element_ids[elem2d]
+            reindex = False
+        elif node_layers == "all":
+            node_ids, elem_tbl = self._subset_connectivity(sel_elements)
+            node_coords = self.node_coordinates[node_ids]
+            codes = self.codes[node_ids]
+            reindex = False
         else:
             node_ids, elem_tbl = self._get_nodes_and_table_for_elements(
                 sel_elements, node_layers=node_layers
             )
             node_coords = self.node_coordinates[node_ids]
             codes = self.codes[node_ids]
-            elem_ids = self._element_ids[sel_elements]
+            reindex = True
+
+        # the new geometry has node and element ids 0, 1, 2, ...
+        new_node_ids = node_ids if reindex else None
 
         if new_type == DfsuFileType.Dfsu2D:
             return GeometryFM2D(
                 node_coordinates=node_coords,
                 codes=codes,
-                node_ids=node_ids,
+                node_ids=new_node_ids,
                 projection=self.projection_string,
                 element_table=elem_tbl,
-                element_ids=elem_ids,
                 dfsu_type=DfsuFileType.Dfsu2D,
-                reindex=True,
+                reindex=reindex,
+                validate=False,
             )
         else:
             lowest_sigma = self.n_layers - self.n_sigma_layers
@@ -151,12 +224,12 @@ class _GeometryFMLayered(_GeometryFM):
                 return GeometryFMVerticalColumn(
                     node_coordinates=node_coords,
                     codes=codes,
-                    node_ids=node_ids,
+                    node_ids=new_node_ids,
                     projection=self.projection_string,
                     element_table=elem_tbl,
-                    element_ids=elem_ids,
                     dfsu_type=self._type,
-                    reindex=True,
+                    reindex=reindex,
+                    validate=False,
                     n_layers=n_layers,
                     n_sigma=n_sigma,
                 )
@@ -165,12 +238,12 @@ class _GeometryFMLayered(_GeometryFM):
                 return klass(  # type: ignore
                     node_coordinates=node_coords,
                     codes=codes,
-                    node_ids=node_ids,
+                    node_ids=new_node_ids,
                     projection=self.projection_string,
                     element_table=elem_tbl,
-                    element_ids=elem_ids,
                     dfsu_type=self._type,
-                    reindex=True,
+                    reindex=reindex,
+                    validate=False,
                     n_layers=n_layers,
                     n_sigma=n_sigma,
                 )
@@ -178,7 +251,7 @@ class _GeometryFMLayered(_GeometryFM):
     @cached_property
     def element_coordinates(self) -> np.ndarray:
         """Center coordinates of each element"""
-        return self._calc_element_coordinates(maxnodes=8)
+        return self._calc_element_coordinates()
 
     def _get_nodes_and_table_for_elements(
         self,
@@ -199,27 +272,25 @@ class _GeometryFMLayered(_GeometryFM):
         -------
         np.array(int)
             array of node ids (unique)
-        list(list(int))
-            element table with a list of nodes for each element
+        np.array
+            element table with the node ids of each element
         """
-        elem_tbl = np.empty(len(elements), dtype=np.dtype("O"))
         if (node_layers == "all") or self.is_2d:
-            for j, eid in enumerate(elements):
-                elem_tbl[j] = np.asarray(self.element_table[eid])
+            return super()._get_nodes_and_table_for_elements(elements)
+
+        # 3D => 2D: first half of the nodes are bottom nodes, last half top nodes
+        elements = np.asarray(elements, dtype=int)
+        table = self._connectivity[elements]
+        n_half = self._n_nodes_per_element[elements] // 2
+        cols = np.arange(n_half.max(initial=0))
+        valid = cols < n_half[:, None]
+        if node_layers == "top":
+            cols = np.minimum(cols + n_half[:, None], table.shape[1] - 1)
+        elem_tbl = np.where(
+            valid, np.take_along_axis(table, np.broadcast_to(cols, valid.shape), 1), -1
+        )
 
-        else:
-            # 3D => 2D
-            for j, eid in enumerate(elements):
-                elem_nodes = np.asarray(self.element_table[eid])
-                nn = len(elem_nodes)
-                halfn = int(nn / 2)
-                if node_layers == "bottom":
-                    elem_nodes = elem_nodes[:halfn]
-                if node_layers == "top":
-                    elem_nodes = elem_nodes[halfn:]
-                elem_tbl[j] = elem_nodes
-
-        nodes = np.unique(np.hstack(elem_tbl))  # type: ignore
+        nodes = np.unique(elem_tbl[valid])
         return nodes, elem_tbl
 
     def to_2d_geometry(self) -> GeometryFM2D:
@@ -257,20 +328,20 @@ class _GeometryFMLayered(_GeometryFM):
 
         # Fix z-coordinate for sigma-z:
         if self._type == DfsuFileType.Dfsu3DSigmaZ:
+            # deepest of the bottom nodes in the columns sharing a 2d node
+            table2d = geom._connectivity
+            valid = table2d >= 0
+            nodes3d = self._connectivity[self.bottom_elements, : table2d.shape[1]]
             zn = geom.node_coordinates[:, 2].copy()
-            for j, elem_nodes in enumerate(geom.element_table):
-                elem_nodes3d = self.element_table[self.bottom_elements[j]]
-                for jn in range(len(elem_nodes)):
-                    znj_3d = self.node_coordinates[elem_nodes3d[jn], 2]
-                    zn[elem_nodes[jn]] = min(zn[elem_nodes[jn]], znj_3d)
+            np.minimum.at(zn, table2d[valid], self.node_coordinates[nodes3d[valid], 2])
             geom.node_coordinates[:, 2] = zn
 
         return geom
 
-    @cached_property
+    @property
     def n_elements(self) -> int:
         """Number of 3d elements"""
-        return len(self.element_table)
+        return len(self._connectivity)
 
     @property
     def n_nodes(self) -> int:
@@ -327,7 +398,7 @@ class _GeometryFMLayered(_GeometryFM):
             )
         else:
             # slow path
-            return self._find_top_layer_elements(self.element_table)
+            return self._find_top_layer_elements(self._connectivity)
 
     def _elements_in_area(
         self, area: Sequence[Tuple[float, float]] | Sequence[float]
@@ -335,7 +406,7 @@ class _GeometryFMLayered(_GeometryFM):
         """Find element ids of elements inside area"""
         idx2d = self.geometry2d._elements_in_area(area)
         if len(idx2d) > 0:
-            return np.hstack(self.e2_e3_table[idx2d])
+            return self.e2_e3_table.elements(idx2d)
         else:
             return np.array([], dtype=int)
 
@@ -356,45 +427,29 @@ class _GeometryFMLayered(_GeometryFM):
         :returns: A list of element indices of top layer elements
         """
 
-        topLayerElments = []
+        connectivity, n_nodes = _to_connectivity(elementTable)
+        is_top = np.ones(len(connectivity), dtype=bool)
 
-        # Find top layer elements by matching the number numers of the last half of elmt i
+        # Find top layer elements by matching the node numbers of the last half of elmt i
         # with the first half of element i+1.
-        # Elements always start from the bottom, and the element of one columne are following
+        # Elements always start from the bottom, and the element of one column are following
         # each other in the element table.
-        for i in range(len(elementTable) - 1):
-            elmt1 = elementTable[i]
-            elmt2 = elementTable[i + 1]
-
-            if len(elmt1) != len(elmt2):
-                # elements with different number of nodes can not be on top of each other,
-                # so elmt2 must be another column, and elmt1 must be a top element
-                topLayerElments.append(i)
-                continue
-
+        # Elements with different number of nodes can not be on top of each other.
+        same_size = n_nodes[:-1] == n_nodes[1:]
+        for nn in np.unique(n_nodes):
+            rows = np.flatnonzero(same_size & (n_nodes[:-1] == nn))
             # Number of nodes in a 2D element
-            elmt2DSize = len(elmt1) // 2
-
-            for j in range(elmt2DSize):
-                if elmt2DSize > 2:
-                    if elmt1[j + elmt2DSize] != elmt2[j]:
-                        # At least one node number did not match
-                        # so elmt2 must be another column, and elmt1 must be a top element
-                        topLayerElments.append(i)
-                        break
-                else:
-                    # for 2D vertical profiles the nodes in the element on the
-                    # top is in reverse order of those in the bottom.
-                    if elmt1[j + elmt2DSize] != elmt2[(elmt2DSize - 1) - j]:
-                        # At least one node number did not match
-                        # so elmt2 must be another column, and elmt1 must be a top element
-                        topLayerElments.append(i)
-                        break
+            elmt2DSize = nn // 2
+            upper = connectivity[rows, elmt2DSize:nn]
+            lower = connectivity[rows + 1, :elmt2DSize]
+            if elmt2DSize <= 2:
+                # for 2D vertical profiles the nodes in the element on the
+                # top is in reverse order of those in the bottom.
+                lower = lower[:, ::-1]
+            is_top[rows] = np.any(upper != lower, axis=1)
 
         # The last element will always be a top layer element
-        topLayerElments.append(len(elementTable) - 1)
-
-        return np.array(topLayerElments, dtype=np.int32)
+        return np.flatnonzero(is_top).astype(np.int32)
 
     @cached_property
     def n_layers_per_column(self) -> np.ndarray:
@@ -460,7 +515,7 @@ class _GeometryFMLayered(_GeometryFM):
         return self._element_ids[self.layer_ids == layers]
 
     @property
-    def e2_e3_table(self) -> np.ndarray:
+    def e2_e3_table(self) -> _ColumnTable:
         """The 2d-to-3d element connectivity table for a 3d object"""
 
         # e2_e3, 2d_ids and layer_ids are all set at the same time
@@ -482,65 +537,79 @@ class _GeometryFMLayered(_GeometryFM):
             self._layer_ids = res[2]
         return self._2d_ids
 
-    def _get_2d_to_3d_association(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        e2_to_e3 = (
-            []
-        )  # for each 2d element: the corresponding 3d element ids from bot to top
-        index2d = []  # for each 3d element: the associated 2d element id
-        layerid = []  # for each 3d element: the associated layer number
-        n2d = len(self.top_elements)
-        topid = self.top_elements
-        botid = self.bottom_elements
-        # layer_ids = 0, 1, 2...
-        global_layer_ids = np.arange(self.n_layers)
-        for j in range(n2d):
-            col = np.arange(botid[j], topid[j] + 1)
-
-            e2_to_e3.append(col)
-            for _ in col:
-                index2d.append(j)
-
-            n_local_layers = len(col)
-            local_layers = global_layer_ids[-n_local_layers:]
-            for ll in local_layers:
-                layerid.append(ll)
-
-        e2_to_e3 = np.array(e2_to_e3, dtype=object)
-        index2d = np.array(index2d)
-        layerid = np.array(layerid)
+    def _get_2d_to_3d_association(
+        self,
+    ) -> Tuple[_ColumnTable, np.ndarray, np.ndarray]:
+        # the elements of a column follow each other from bottom to top
+        n_layers_column = self.n_layers_per_column
+        offsets = np.zeros(len(n_layers_column) + 1, dtype=np.int64)
+        offsets[1:] = self.top_elements + 1
+        e2_to_e3 = _ColumnTable(offsets, np.arange(offsets[-1]))
+
+        # for each 3d element: the associated 2d element id
+        index2d = np.repeat(np.arange(len(n_layers_column)), n_layers_column)
+
+        # for each 3d element: the associated layer number (0=bottom, 1, 2, ...)
+        local_layer = np.arange(len(index2d)) - offsets[index2d]
+        layerid = local_layer + (self.n_layers - n_layers_column)[index2d]
         return e2_to_e3, index2d, layerid
 
-    def _z_idx_in_column(self, e3_col: np.ndarray, z: np.ndarray) -> np.ndarray:
-        dz = self._dz[e3_col]
-        z_col = self.element_coordinates[e3_col, 2]
-        z_face = np.append(z_col - dz / 2, z_col[-1] + dz[-1] / 2)
-        if z < z_face[0] or z > z_face[-1]:
-            xy = tuple(self.element_coordinates[e3_col[0], :2])
-            raise ValueError(
-                f"z value '{z}' is outside water column [{z_face[0]},{z_face[-1]}] in point x,y={xy}"
-            )
-        idx = np.searchsorted(z_face, z) - 1
-        return idx
-
     def _find_elem3d_from_elem2d(
-        self, elem2d: int | np.ndarray, z: np.ndarray | float
+        self,
+        elem2d: int | np.ndarray,
+        z: np.ndarray | float,
+        zn: np.ndarray | None = None,
     ) -> np.ndarray:
-        """Find 3d element ids from 2d element ids and z-values"""
+        """Find 3d element ids from 2d element ids and z-values
 
-        # TODO: coordinate with _find_3d_from_2d_points()
+        Parameters
+        ----------
+        elem2d : int or np.array(int)
+            2d element ids
+        z : float or np.array(float)
+            z-value of each point
+        zn : np.array(float), optional
+            dynamic z-values of the nodes at a given time step,
+            by default the static z-values of the node coordinates
 
-        elem2d = [elem2d] if np.isscalar(elem2d) else elem2d
-        elem2d = np.asarray(elem2d)
-        z_vec = np.full(elem2d.shape, fill_value=z) if np.isscalar(z) else z
+        Returns
+        -------
+        np.array(int)
+            3d element id of each point
+        """
+        elem2d = np.atleast_1d(np.asarray(elem2d))
+        z_vec = np.broadcast_to(np.asarray(z, dtype=np.float64), elem2d.shape)
 
-        elem3d = np.full_like(elem2d, fill_value=-1)
-        for j, e2 in enumerate(elem2d):
-            idx_3d = np.hstack(self.e2_e3_table[e2])
-            elem3d[j] = idx_3d[self._z_idx_in_column(idx_3d, z_vec[j])]  # type: ignore
+        if zn is None:
+            zc = self.element_coordinates[:, 2]
+            dz = self._dz
+        else:
+            z_bot, z_top = self._element_z_bot_top(zn)
+            zc = (z_bot + z_top) / 2
+            dz = z_top - z_bot
+        z_face = zc - dz / 2
+
+        e2_e3 = self.e2_e3_table
+        starts = e2_e3.offsets[elem2d]
+        counts = e2_e3.offsets[elem2d + 1] - starts
+        bot = e2_e3.ids[starts]
+        top = e2_e3.ids[starts + counts - 1]
+        col_bot = z_face[bot]
+        col_top = zc[top] + dz[top] / 2
+        outside = np.flatnonzero((z_vec < col_bot) | (z_vec > col_top))
+        if len(outside) > 0:
+            j = outside[0]
+            xy = tuple(self.element_coordinates[bot[j], :2])
+            raise ValueError(
+                f"z value '{z_vec[j]}' is outside water column [{col_bot[j]},{col_top[j]}] in point x,y={xy}"
+            )
 
-            # z_col = self.element_coordinates[idx_3d, 2]
-            # elem3d[j] = (np.abs(z_col - z_vec[j])).argmin()  # nearest
-        return elem3d
+        # number of element bottom faces below z in each column
+        point = np.repeat(np.arange(len(elem2d)), counts)
+        below = z_face[e2_e3.elements(elem2d)] < z_vec[point]
+        n_below = np.bincount(point[below], minlength=len(elem2d))
+        idx = np.maximum(n_below - 1, 0)
+        return e2_e3.ids[starts + idx]
 
     # def _find_3d_from_2d_points(self, elem2d, z=None, layer=None):
 
@@ -592,30 +661,101 @@ class _GeometryFMLayered(_GeometryFM):
 
     #     return idx
 
+    def _element_z_bot_top(self, zn: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Mean z of the bottom nodes and of the top nodes of each 3d element
+
+        Parameters
+        ----------
+        zn : np.array(float)
+            z-values of the nodes, (n_nodes,) or (n_time, n_nodes)
+
+        Returns
+        -------
+        np.array(float)
+            bottom z, (n_elements,) or (n_time, n_elements)
+        np.array(float)
+            top z, (n_elements,) or (n_time, n_elements)
+        """
+        table = self._connectivity
+        n_half = self._n_nodes_per_element // 2
+        shape = (*zn.shape[:-1], len(table))
+        z_bot = np.zeros(shape)
+        z_top = np.zeros(shape)
+        for col in range(table.shape[1]):
+            nodes = table[:, col]
+            is_bot = col < n_half
+            is_top = ~is_bot & (nodes >= 0)
+            z_bot[..., is_bot] += zn[..., nodes[is_bot]]
+            z_top[..., is_top] += zn[..., nodes[is_top]]
+        return z_bot / n_half, z_top / n_half
+
     @cached_property
     def _dz(self) -> np.ndarray:
         """Height of each 3d element (using static zn information)"""
         return self._calc_dz()
 
-    def _calc_dz(self) -> np.ndarray:
-        """Height of 3d elements using static or dynamic zn information"""
-        element_table = self.element_table
-        n_elements = len(element_table)
+    def _calc_dz(self, zn: np.ndarray | None = None) -> np.ndarray:
+        """Height of 3d elements using static or dynamic zn information
+
+        Parameters
+        ----------
+        zn : np.array(float), optional
+            dynamic z-values of the nodes, (n_nodes,) or (n_time, n_nodes),
+            by default the static z-values of the node coordinates
+
+        Returns
+        -------
+        np.array(float)
+            height of each element, (n_elements,) or (n_time, n_elements)
+        """
+        if zn is None:
+            zn = self.node_coordinates[:, 2]
+        z_bot, z_top = self._element_z_bot_top(np.asarray(zn))
+        return z_top - z_bot
+
+    def _vertical_integral(
+        self,
+        values: np.ndarray,
+        dz: np.ndarray,
+        average: bool = False,
+    ) -> np.ndarray:
+        """Vertical integral (or average) of element values in each column
 
-        zn = self.node_coordinates[:, 2]
-        zn_is_2d = len(zn.shape) == 2
-        shape = (zn.shape[0], n_elements) if zn_is_2d else (n_elements,)
-        dz = np.full(shape=shape, fill_value=np.nan)
+        Parameters
+        ----------
+        values : np.array(float)
+            element values, (n_elements,) or (n_time, n_elements)
+        dz : np.array(float)
+            height of each element, (n_elements,) or (n_time, n_elements),
+            see _calc_dz
+        average : bool, optional
+            divide the integral by the water depth, by default False
 
-        # static zn
-        for j in range(n_elements):
-            nodes = element_table[j]
-            halfn = int(len(nodes) / 2)
-            z_bot = np.mean(zn[nodes[:halfn]])
-            z_top = np.mean(zn[nodes[halfn:]])
-            dz[j] = z_top - z_bot
+        Returns
+        -------
+        np.array(float)
+            value of each column, (n_2d_elements,) or (n_time, n_2d_elements),
+            NaN where all elements of the column are NaN
+
+        Notes
+        -----
+        NaN values are skipped, i.e. they do not contribute to the integral,
+        and the average is taken over the height of the non-NaN elements only.
+        """
+        has_value = ~np.isnan(values)
+        dz = np.where(has_value, dz, 0.0)
 
-        return dz
+        # the elements of a column follow each other in the element table
+        starts = self.e2_e3_table.offsets[:-1]
+        integral = np.add.reduceat(
+            np.where(has_value, values, 0.0) * dz, starts, axis=-1
+        )
+        n_values = np.add.reduceat(has_value, starts, axis=-1, dtype=np.int32)
+        if average:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                integral /= np.add.reduceat(dz, starts, axis=-1)
+        integral[n_values == 0] = np.nan
+        return integral
 
 
 class GeometryFM3D(_GeometryFMLayered):
@@ -659,6 +799,60 @@ class GeometryFM3D(_GeometryFMLayered):
     def to_mesh(self, outfilename: str | Path) -> None:
         return self.geometry2d.to_mesh(outfilename)
 
+    def get_element_area(self) -> np.ndarray:
+        """Calculate the horizontal area of each 3d element.
+
+        Returns
+        -------
+        np.array(float)
+            areas in m2
+        """
+        return self.geometry2d._element_area[self.elem2d_ids]
+
+    @cached_property
+    def _surface_interpolants(
+        self,
+    ) -> Dict[int, Tuple[GeometryFM2D, np.ndarray, np.ndarray | None]]:
+        return {}
+
+    def _get_surface_interpolant(
+        self, n_nearest: int = 4
+    ) -> Tuple[GeometryFM2D, np.ndarray, np.ndarray | None]:
+        """Interpolant from z-values of the surface nodes to the 2d element centers
+
+        Parameters
+        ----------
+        n_nearest : int, optional
+            number of nodes for inverse distance interpolation, default=4
+
+        Returns
+        -------
+        GeometryFM2D
+            2d geometry of the surface elements
+        np.array(int)
+            3d node ids used for interpolation to each 2d element
+        np.array(float)
+            interpolation weights (None if n_nearest=1)
+        """
+        if n_nearest not in self._surface_interpolants:
+            top_el = self.top_elements
+            geom = self.elements_to_geometry(top_el, node_layers="top")
+            assert isinstance(geom, GeometryFM2D)
+            tree2d = cKDTree(geom.node_coordinates[:, 0:2])
+            dist, node_ids = tree2d.query(geom.element_coordinates[:, 0:2], k=n_nearest)
+            weights = None if n_nearest == 1 else get_idw_interpolant(dist)
+
+            # node ids in the 2d geometry => 3d surface node ids
+            node_ids_surf, _ = self._get_nodes_and_table_for_elements(
+                top_el, node_layers="top"
+            )
+            self._surface_interpolants[n_nearest] = (
+                geom,
+                node_ids_surf[node_ids],
+                weights,
+            )
+        return self._surface_interpolants[n_nearest]
+
     def find_index(
         self,
         x: float | None = None,
@@ -693,7 +887,7 @@ class GeometryFM3D(_GeometryFMLayered):
             idx_2d = self.geometry2d._find_element_2d(coords=xy)
             assert len(idx_2d) == len(xy)
             if z is None:
-                idx_3d = np.hstack(self.e2_e3_table[idx_2d])
+                idx_3d = self.e2_e3_table.elements(idx_2d)
             else:
                 idx_3d = self._find_elem3d_from_elem2d(idx_2d, z)
             idx = np.intersect1d(idx, idx_3d).astype(int)
@@ -743,25 +937,33 @@ class GeometryFMVerticalProfile(_GeometryFMLayered):
         nc0 = self.node_coordinates[0, :2]
         return _relative_cumulative_distance(ec, nc0, is_geo=self.is_geo)
 
-    def get_nearest_relative_distance(self, coords: Tuple[float, float]) -> float:
+    @cached_property
+    def _tree2d(self) -> cKDTree:
+        # the columns of a transect are represented by their top element
+        xy = self.element_coordinates[self.top_elements, :2]
+        return cKDTree(xy)
+
+    def get_nearest_relative_distance(
+        self, coords: Tuple[float, float] | np.ndarray
+    ) -> float | np.ndarray:
         """For a point near a transect, find the nearest relative distance
         for showing position on transect plot.
 
         Parameters
         ----------
-        coords : [float, float]
-            x,y-coordinate of point
+        coords : [float, float] or np.array(float)
+            x,y-coordinate of point or array of points (n_points, 2)
 
         Returns
         -------
-        float
+        float or np.array(float)
             relative distance in meters from start of transect
         """
-        xe = self.element_coordinates[:, 0]
-        ye = self.element_coordinates[:, 1]
-        dd2 = np.square(xe - coords[0]) + np.square(ye - coords[1])
-        idx = np.argmin(dd2)
-        return self.relative_element_distance[idx]
+        idx_2d = self._find_nearest_element_2d(np.asarray(coords))
+        dist = self.relative_element_distance[self.top_elements[idx_2d]]
+        if np.ndim(coords) == 1:
+            return float(dist[0])
+        return dist
 
     def find_index(
         self,
@@ -794,7 +996,7 @@ class GeometryFMVerticalProfile(_GeometryFMLayered):
             idx_2d = self._find_nearest_element_2d(coords=xy)
 
             if z is None:
-                idx_3d = np.hstack(self.e2_e3_table[idx_2d])
+                idx_3d = self.e2_e3_table.elements(idx_2d)
             else:
                 idx_3d = self._find_elem3d_from_elem2d(idx_2d, z)
             idx = np.intersect1d(idx, idx_3d)
@@ -802,14 +1004,10 @@ class GeometryFMVerticalProfile(_GeometryFMLayered):
         return idx
 
     def _find_nearest_element_2d(self, coords: np.ndarray) -> np.ndarray:
-        ec2d = self.element_coordinates[self.top_elements, :2]
-        xe, ye = ec2d[:, 0], ec2d[:, 1]
-        coords = np.atleast_2d(coords)
-        idx = np.zeros(len(coords), dtype=int)
-        for j, pt in enumerate(coords):
-            x, y = pt[0:2]
-            idx[j] = np.argmin((xe - x) ** 2 + (ye - y) ** 2)
-        return idx
+        """Index of the nearest column (2d element) for each point"""
+        xy = np.atleast_2d(coords)[:, 0:2]
+        _, idx = self._tree2d.query(xy)
+        return np.asarray(idx, dtype=int)
 
 
 class GeometryFMVerticalColumn(GeometryFM3D):
@@ -857,7 +1055,7 @@ class GeometryFMVerticalColumn(GeometryFM3D):
 
     @property
     def _idx_f(self) -> np.ndarray:
-        nnodes_half = int(len(self.element_table[0]) / 2)
+        nnodes_half = int(self._n_nodes_per_element[0] / 2)
         n_vfaces = self.n_elements + 1
         idx_f = np.zeros((n_vfaces, nnodes_half), dtype=int)
         idx_e = self._idx_e
@@ -867,15 +1065,8 @@ class GeometryFMVerticalColumn(GeometryFM3D):
 
     @property
     def _idx_e(self) -> np.ndarray:
-        nnodes_per_elem = len(self.element_table[0])
-        idx_e = np.zeros((self.n_elements, nnodes_per_elem), dtype=int)
-
-        for j in range(self.n_elements):
-            nodes = self.element_table[j]
-            for i in range(nnodes_per_elem):
-                idx_e[j, i] = nodes[i]
-
-        return idx_e
+        nnodes_per_elem = self._n_nodes_per_element[0]
+        return self._connectivity[:, :nnodes_per_elem].astype(int)
 
     def _calc_z_using_idx(self, zn: np.ndarray, idx: np.ndarray) -> np.ndarray:
         if zn.ndim == 1:
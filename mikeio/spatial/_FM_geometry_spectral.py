@@ -156,20 +156,18 @@ class GeometryFMAreaSpectrum(_GeometryFMSpectrum):
                 y=coords[1],
             )
 
-        node_ids, elem_tbl = self._get_nodes_and_table_for_elements(elements)
+        node_ids, elem_tbl = self._subset_connectivity(elements)
         node_coords = self.node_coordinates[node_ids]
         codes = self.codes[node_ids]
 
         geom = GeometryFMAreaSpectrum(
             node_coordinates=node_coords,
             codes=codes,
-            node_ids=node_ids,
             projection=self.projection_string,
             element_table=elem_tbl,
-            element_ids=self.element_ids[elements],
             frequencies=self._frequencies,
             directions=self._directions,
-            reindex=True,
+            validate=False,
         )
         geom._type = self._type
         return geom
@@ -206,27 +204,24 @@ class GeometryFMLineSpectrum(_GeometryFMSpectrum):
                 y=coords[1],
             )
 
-        elements = []
-        for j, el_nodes in enumerate(self.element_table):
-            if np.all(np.isin(el_nodes, nodes)):
-                elements.append(j)
+        table = self._connectivity
+        selected = np.isin(table, nodes) | (table < 0)
+        elements = np.flatnonzero(np.all(selected, axis=1))
 
         assert len(elements) > 0, "no elements found"
 
-        node_ids, elem_tbl = self._get_nodes_and_table_for_elements(elements)
+        node_ids, elem_tbl = self._subset_connectivity(elements)
         node_coords = self.node_coordinates[node_ids]
         codes = self.codes[node_ids]
 
         geom = GeometryFMLineSpectrum(
             node_coordinates=node_coords,
             codes=codes,
-            node_ids=node_ids,
             projection=self.projection_string,
             dfsu_type=self._type,
             element_table=elem_tbl,
-            element_ids=self.element_ids[elements],
             frequencies=self._frequencies,
             directions=self._directions,
-            reindex=True,
+            validate=False,
         )
         return geom
@@ -0,0 +1,239 @@
+from __future__ import annotations
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+class _ElementIndex:
+    """Uniform bucket grid over the bounding boxes of flexible mesh elements
+
+    Each element is registered in all grid cells overlapped by its bounding
+    box, so the cell of a point gives the exact set of elements that can
+    contain the point. The index only holds numpy arrays and can be
+    pickled together with the geometry.
+
+    Parameters
+    ----------
+    bboxes : np.array(float)
+        (n_elements, 4) array with x0, y0, x1, y1 of each element
+    """
+
+    def __init__(self, bboxes: np.ndarray) -> None:
+        self.bboxes = np.asarray(bboxes, dtype=np.float64)
+        n_elements = len(self.bboxes)
+
+        self.x0 = float(self.bboxes[:, 0].min())
+        self.y0 = float(self.bboxes[:, 1].min())
+        width = float(self.bboxes[:, 2].max()) - self.x0
+        height = float(self.bboxes[:, 3].max()) - self.y0
+
+        # cells of the typical element size, but not more cells than 4 x elements
+        sizes = np.maximum(
+            self.bboxes[:, 2] - self.bboxes[:, 0], self.bboxes[:, 3] - self.bboxes[:, 1]
+        )
+        dx = max(float(np.median(sizes)), np.sqrt(width * height / (4 * n_elements)))
+        if dx <= 0.0:
+            dx = max(width, height, 1.0)
+        self.dx = dx
+        self.nx = int(width // dx) + 1
+        self.ny = int(height // dx) + 1
+
+        ix0, iy0 = self._cell(self.bboxes[:, 0], self.bboxes[:, 1])
+        ix1, iy1 = self._cell(self.bboxes[:, 2], self.bboxes[:, 3])
+
+        # all (cell, element) pairs
+        n_cols = ix1 - ix0 + 1
+        counts = n_cols * (iy1 - iy0 + 1)
+        elements = np.repeat(np.arange(n_elements, dtype=np.int32), counts)
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+        local = np.arange(len(elements)) - starts
+        n_cols = np.repeat(n_cols, counts)
+        cells = (np.repeat(iy0, counts) + local // n_cols) * self.nx + (
+            np.repeat(ix0, counts) + local % n_cols
+        )
+
+        # elements of each cell as CSR
+        order = np.argsort(cells, kind="stable")
+        self.elements = elements[order]
+        self.offsets = np.zeros(self.nx * self.ny + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cells, minlength=self.nx * self.ny), out=self.offsets[1:])
+
+    def _cell(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        ix = np.clip(np.floor((x - self.x0) / self.dx), 0, self.nx - 1).astype(int)
+        iy = np.clip(np.floor((y - self.y0) / self.dx), 0, self.ny - 1).astype(int)
+        return ix, iy
+
+    def query_points(self, xy: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Candidate elements for each point
+
+        Parameters
+        ----------
+        xy : np.array(float)
+            (n_points, 2) coordinates
+
+        Returns
+        -------
+        np.array(int)
+            point index of each candidate pair
+        np.array(int)
+            element id of each candidate pair
+        """
+        xy = np.atleast_2d(xy)
+        x, y = xy[:, 0], xy[:, 1]
+        in_grid = (
+            (x >= self.x0)
+            & (x <= self.x0 + self.nx * self.dx)
+            & (y >= self.y0)
+            & (y <= self.y0 + self.ny * self.dx)
+        )
+        points = np.flatnonzero(in_grid)
+        ix, iy = self._cell(x[points], y[points])
+        cells = iy * self.nx + ix
+
+        starts = self.offsets[cells]
+        counts = self.offsets[cells + 1] - starts
+        point_idx = np.repeat(points, counts)
+        pos = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(
+            len(point_idx)
+        )
+        return point_idx, self.elements[pos].astype(int)
+
+    def query_bbox(self, bbox: Sequence[float]) -> np.ndarray:
+        """Sorted ids of elements with bounding box overlapping bbox (x0, y0, x1, y1)"""
+        x0, y0, x1, y1 = bbox
+        if x1 < self.x0 or y1 < self.y0:
+            return np.array([], dtype=int)
+        ix0, iy0 = self._cell(np.array(x0), np.array(y0))
+        ix1, iy1 = self._cell(np.array(x1), np.array(y1))
+
+        rows = np.arange(iy0, iy1 + 1) * self.nx
+        starts = self.offsets[rows + ix0]
+        ends = self.offsets[rows + ix1 + 1]
+        candidates = np.unique(
+            np.concatenate(
+                [self.elements[s:e] for s, e in zip(starts, ends)]
+                + [np.array([], dtype=np.int32)]
+            )
+        )
+
+        b = self.bboxes[candidates]
+        overlap = (b[:, 0] <= x1) & (b[:, 2] >= x0) & (b[:, 1] <= y1) & (b[:, 3] >= y0)
+        return candidates[overlap].astype(int)
+
+
+class _PolygonIndex:
+    """Prepared domain outline for fast even-odd point in polygon tests
+
+    The edges are bucketed in horizontal bands, so each point is only
+    tested against the edges that can cross a horizontal ray from the
+    point. The crossing test is the same as in matplotlib's
+    Path.contains_points.
+
+    Parameters
+    ----------
+    exteriors : list(np.array(float))
+        (n, 2) coordinates of each closed outer polyline
+    interiors : list(np.array(float))
+        (n, 2) coordinates of each closed polyline around a hole
+    """
+
+    def __init__(
+        self, exteriors: Sequence[np.ndarray], interiors: Sequence[np.ndarray]
+    ) -> None:
+        polygons = [*exteriors, *interiors]
+        self.n_exteriors = len(exteriors)
+        self.n_polygons = len(polygons)
+        starts, ends, ids = [], [], []
+        for j, xy in enumerate(polygons):
+            xy = np.asarray(xy, dtype=np.float64)[:, :2]
+            starts.append(xy)
+            ends.append(np.roll(xy, -1, axis=0))
+            ids.append(np.full(len(xy), j, dtype=np.int32))
+
+        p0 = np.concatenate(starts) if starts else np.empty((0, 2))
+        p1 = np.concatenate(ends) if ends else np.empty((0, 2))
+        polygon_ids = np.concatenate(ids) if ids else np.empty(0, dtype=np.int32)
+
+        # only edges with different y can be crossed by a horizontal ray
+        crossable = p0[:, 1] != p1[:, 1]
+        self.p0 = p0[crossable]
+        self.p1 = p1[crossable]
+        self.polygon_ids = polygon_ids[crossable]
+
+        n_edges = len(self.p0)
+        ymin = np.minimum(self.p0[:, 1], self.p1[:, 1])
+        ymax = np.maximum(self.p0[:, 1], self.p1[:, 1])
+        self.y0 = float(ymin.min()) if n_edges > 0 else 0.0
+        height = float(ymax.max()) - self.y0 if n_edges > 0 else 0.0
+        self.n_bands = max(1, n_edges // 4)
+        self.dy = height / self.n_bands if height > 0 else 1.0
+
+        b0 = self._band(ymin)
+        b1 = self._band(ymax)
+        counts = b1 - b0 + 1
+        edges = np.repeat(np.arange(n_edges), counts)
+        local = np.arange(len(edges)) - np.repeat(np.cumsum(counts) - counts, counts)
+        bands = np.repeat(b0, counts) + local
+
+        order = np.argsort(bands, kind="stable")
+        self.edges = edges[order]
+        self.offsets = np.zeros(self.n_bands + 1, dtype=np.int64)
+        np.cumsum(np.bincount(bands, minlength=self.n_bands), out=self.offsets[1:])
+
+    def _band(self, y: np.ndarray) -> np.ndarray:
+        return np.clip(np.floor((y - self.y0) / self.dy), 0, self.n_bands - 1).astype(
+            int
+        )
+
+    def contains(self, points: np.ndarray) -> np.ndarray:
+        """Inside any of the exteriors but not inside any of the interiors
+
+        Parameters
+        ----------
+        points : np.array(float)
+            (n_points, 2) coordinates
+
+        Returns
+        -------
+        np.array(bool)
+            True for points inside, False otherwise
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+        in_exterior = np.zeros(len(points), dtype=bool)
+        in_interior = np.zeros(len(points), dtype=bool)
+
+        for chunk in np.array_split(
+            np.arange(len(points)), max(1, len(points) // 100_000)
+        ):
+            tx = points[chunk, 0]
+            ty = points[chunk, 1]
+            valid = np.flatnonzero(np.isfinite(tx) & np.isfinite(ty))
+            bands = self._band(ty[valid])
+
+            starts = self.offsets[bands]
+            counts = self.offsets[bands + 1] - starts
+            pts = np.repeat(valid, counts)
+            pos = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(
+                len(pts)
+            )
+            edges = self.edges[pos]
+
+            x, y = tx[pts], ty[pts]
+            vtx0, vty0 = self.p0[edges, 0], self.p0[edges, 1]
+            vtx1, vty1 = self.p1[edges, 0], self.p1[edges, 1]
+            yflag0 = vty0 >= y
+            yflag1 = vty1 >= y
+            crossing = (yflag0 != yflag1) & (
+                ((vty1 - y) * (vtx0 - vtx1) >= (vtx1 - x) * (vty0 - vty1)) == yflag1
+            )
+
+            # odd number of crossings of a polygon => inside
+            key = pts[crossing] * self.n_polygons + self.polygon_ids[edges[crossing]]
+            keys, n_crossings = np.unique(key, return_counts=True)
+            keys = keys[n_crossings % 2 == 1]
+            pts_inside = chunk[keys // self.n_polygons]
+            is_interior = keys % self.n_polygons >= self.n_exteriors
+            in_exterior[pts_inside[~is_interior]] = True
+            in_interior[pts_inside[is_interior]] = True
+
+        return in_exterior & ~in_interior
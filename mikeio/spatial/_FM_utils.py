@@ -8,6 +8,7 @@ from matplotlib.figure import Figure
 from matplotlib.tri import Triangulation
 import numpy as np
 from collections import namedtuple
+from scipy.sparse import csr_matrix
 
 from ._utils import _relative_cumulative_distance
 
@@ -43,6 +44,8 @@ def _plot_map(
     figsize: Tuple[float, float] | None = None,
     ax: Axes | None = None,
     add_colorbar: bool = True,
+    tri_only_element_table: Tuple[np.ndarray, np.ndarray] | None = None,
+    node_centered_operator: csr_matrix | None = None,
 ) -> Axes:
     """
     Plot unstructured data and/or mesh, mesh outline
@@ -85,6 +88,12 @@ def _plot_map(
         Adding to existing axis, instead of creating new fig
     add_colorbar: bool
         Add colorbar to plot, default True
+    tri_only_element_table: (np.array, np.array), optional
+        triangles and their parent elements (see _create_tri_only_element_table)
+        for node-based plots, calculated if not given
+    node_centered_operator: csr_matrix, optional
+        element to node operator (see _node_centered_operator)
+        for node-based plots, calculated if not given
 
     Returns
     -------
@@ -170,7 +179,18 @@ def _plot_map(
         if show_mesh and __is_tri_only(element_table):
             mesh_linewidth = 0.4
             n_refinements = 0
-        triang, zn = __get_tris(nc, element_table, ec, z, n_refinements)
+        if tri_only_element_table is None:
+            from ._FM_geometry import _to_connectivity
+
+            tri_only_element_table = _create_tri_only_element_table(
+                *_to_connectivity(element_table)
+            )
+        tri_table, parent = tri_only_element_table
+        if node_centered_operator is None:
+            node_centered_operator = _node_centered_operator(
+                nc, tri_table, parent, len(z)
+            )
+        triang, zn = __get_tris(nc, tri_table, node_centered_operator, z, n_refinements)
 
         if plot_type == "shaded":
             ax.triplot(triang, lw=mesh_linewidth, color=MESH_COL)
@@ -426,8 +446,8 @@ def __plot_patch(
 
 def __get_tris(
     nc: np.ndarray,
-    element_table: np.ndarray,
-    ec: np.ndarray,
+    tri_table: np.ndarray,
+    operator: csr_matrix,
     z: np.ndarray,
     n_refinements: int,
 ) -> Tuple[Triangulation, np.ndarray]:
@@ -437,10 +457,10 @@ def __get_tris(
     ----------
     nc : array of float
         node coordinates
-    element_table : array of int
-        element table
-    ec : array of int
-        element coordinates
+    tri_table : array of int
+        tri-only element table
+    operator : csr_matrix
+        element to node operator, see _node_centered_operator
     z : array of float
         data to be plotted
     n_refinements : int
@@ -453,10 +473,9 @@ def __get_tris(
 
     import matplotlib.tri as tri
 
-    elem_table, ec, z = __create_tri_only_element_table(nc, element_table, ec, data=z)
-    triang = tri.Triangulation(nc[:, 0], nc[:, 1], elem_table)
+    triang = tri.Triangulation(nc[:, 0], nc[:, 1], tri_table)
 
-    zn = _get_node_centered_data(nc, elem_table, ec, z)
+    zn = _apply_node_centered_operator(operator, z)
 
     if n_refinements > 0:
         # TODO: refinements doesn't seem to work for 3d files?
@@ -633,104 +652,97 @@ def _to_polygons(node_coordinates: np.ndarray, element_table: np.ndarray) -> lis
     return polygons
 
 
-def _get_node_centered_data(
+def _apply_node_centered_operator(operator: csr_matrix, data: np.ndarray) -> np.ndarray:
+    """Element data (n_elements,) or (n_time, n_elements) to node data"""
+    data = np.asarray(data)
+    if data.ndim == 1:
+        return operator @ data
+    return (operator @ data.T).T
+
+
+def _node_centered_operator(
     node_coordinates: np.ndarray,
-    element_table: np.ndarray,
-    element_coordinates: np.ndarray,
-    data: np.ndarray,
+    tri_table: np.ndarray,
+    parent: np.ndarray,
+    n_elements: int,
     extrapolate: bool = True,
-) -> np.ndarray:
-    """convert cell-centered data to node-centered by pseudo-laplacian method
+) -> csr_matrix:
+    """sparse (n_nodes, n_elements) matrix with pseudo-laplacian weights
 
-    Parameters
-    ----------
-    node_coordinates,
-    element_table,
-    element_coordinates
-    data : np.array(float)
-        cell-centered data
-    extrapolate : bool, optional
-        allow the method to extrapolate, default:True
-
-    Returns
-    -------
-    np.array(float)
-        node-centered data
+    The weights are calculated on the tri-only mesh (see
+    _create_tri_only_element_table); triangles split from the same quad
+    share the value of the quad. Nodes where the pseudo-laplacian weights
+    fail use inverse distance weights instead.
     """
-    nc = node_coordinates
-    elem_table, ec, data = __create_tri_only_element_table(
-        nc, element_table, element_coordinates, data
+    nc = np.asarray(node_coordinates)
+    elem_table = tri_table
+    ec = nc[elem_table].mean(axis=1)
+
+    # one entry per (node, triangle) pair
+    nodes = elem_table.ravel()
+    tris = np.repeat(np.arange(len(elem_table)), elem_table.shape[1])
+    n_nodes = nc.shape[0]
+
+    I = ec[tris, :2] - nc[nodes, :2]
+    Ix, Iy = I[:, 0], I[:, 1]
+    Ixx = np.bincount(nodes, weights=Ix**2, minlength=n_nodes)
+    Iyy = np.bincount(nodes, weights=Iy**2, minlength=n_nodes)
+    Ixy = np.bincount(nodes, weights=Ix * Iy, minlength=n_nodes)
+    lamb = Ixx * Iyy - Ixy**2
+
+    # Standard case - Pseudo
+    standard = lamb > 1e-10 * (Ixx * Iyy)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lambda_x = (Ixy[nodes] * Iy - Iyy[nodes] * Ix) / lamb[nodes]
+        lambda_y = (Ixy[nodes] * Ix - Ixx[nodes] * Iy) / lamb[nodes]
+        omega = 1.0 + lambda_x * Ix + lambda_y * Iy
+    if not extrapolate:
+        omega = np.clip(omega, 0, 2)
+    omega = np.where(standard[nodes], omega, 0.0)
+    omega_sum = np.bincount(nodes, weights=omega, minlength=n_nodes)
+
+    # We did not succeed using pseudo laplace procedure, use inverse distance instead
+    use_idw = (omega_sum <= 0)[nodes]
+    with np.errstate(divide="ignore"):
+        inv_dist = 1 / np.hypot(Ix, Iy)
+    weights = np.where(use_idw, inv_dist, omega)
+    weights_sum = np.bincount(nodes, weights=weights, minlength=n_nodes)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weights = weights / weights_sum[nodes]
+
+    # triangles split from the same quad contribute to the same element
+    return csr_matrix(
+        (weights, (nodes, parent[tris])),
+        shape=(n_nodes, n_elements),
     )
 
-    node_cellID = [
-        list(np.argwhere(elem_table == i)[:, 0])
-        for i in np.unique(
-            elem_table.reshape(
-                -1,
-            )
-        )
-    ]
-    node_centered_data = np.zeros(shape=nc.shape[0])
-    for n, item in enumerate(node_cellID):
-        I = ec[item][:, :2] - nc[n][:2]
-        I2 = (I**2).sum(axis=0)
-        Ixy = (I[:, 0] * I[:, 1]).sum(axis=0)
-        lamb = I2[0] * I2[1] - Ixy**2
-        omega = np.zeros(1)
-        if lamb > 1e-10 * (I2[0] * I2[1]):
-            # Standard case - Pseudo
-            lambda_x = (Ixy * I[:, 1] - I2[1] * I[:, 0]) / lamb
-            lambda_y = (Ixy * I[:, 0] - I2[0] * I[:, 1]) / lamb
-            omega = 1.0 + lambda_x * I[:, 0] + lambda_y * I[:, 1]
-            if not extrapolate:
-                omega[np.where(omega > 2)] = 2
-                omega[np.where(omega < 0)] = 0
-        if omega.sum() > 0:
-            node_centered_data[n] = np.sum(omega * data[item]) / np.sum(omega)
-        else:
-            # We did not succeed using pseudo laplace procedure, use inverse distance instead
-            InvDis = [
-                1 / np.hypot(case[0], case[1]) for case in ec[item][:, :2] - nc[n][:2]
-            ]
-            node_centered_data[n] = np.sum(InvDis * data[item]) / np.sum(InvDis)
-
-    return node_centered_data
-
-
-def __create_tri_only_element_table(
-    node_coordinates: np.ndarray,
-    element_table: np.ndarray,
-    element_coordinates: np.ndarray,
-    data: np.ndarray,
-) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-    """Convert quad/tri mesh to pure tri-mesh"""
 
-    if __is_tri_only(element_table):
-        # already tri-only? just convert to 2d array
-        return np.stack(element_table), element_coordinates, data  # type: ignore
+def _create_tri_only_element_table(
+    connectivity: np.ndarray, n_nodes_per_element: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert quad/tri mesh to pure tri-mesh by splitting each quad in two
 
-    ec = element_coordinates.copy()
-
-    elem_table = [list(element_table[i]) for i in range(len(element_table))]
-    tmp_elmnt_nodes = elem_table.copy()
-    for el, item in enumerate(tmp_elmnt_nodes):
-        if len(item) == 4:
-            elem_table.pop(el)  # remove quad element
-
-            # insert two new tri elements in table
-            elem_table.insert(el, item[:3])
-            tri2_nodes = [item[i] for i in [2, 3, 0]]
-            elem_table.append(tri2_nodes)
-
-            # new center coordinates for new tri-elements
-            ec[el] = node_coordinates[item[:3]].mean(axis=1)
-            tri2_ec = node_coordinates[tri2_nodes].mean(axis=1)
-            ec = np.append(ec, tri2_ec.reshape(1, -1), axis=0)
-
-            # use same data in two new tri elements
-            data = np.append(data, data[el])
+    Parameters
+    ----------
+    connectivity : np.array(int)
+        (n_elements, max_nodes) node ids padded with -1
+    n_nodes_per_element : np.array(int)
+        number of nodes of each element
 
-    return np.asarray(elem_table), ec, data
+    Returns
+    -------
+    np.array(int)
+        (n_triangles, 3) node ids; the first triangle of each element
+        followed by the second triangle of each quad
+    np.array(int)
+        parent element of each triangle
+    """
+    tri_table = connectivity[:, :3]
+    quads = np.flatnonzero(np.isin(n_nodes_per_element, (4, 8)))
+    if len(quads) > 0:
+        tri_table = np.vstack([tri_table, connectivity[quads][:, [2, 3, 0]]])
+    parent = np.concatenate([np.arange(len(connectivity)), quads])
+    return tri_table.astype(int), parent
 
 
 def __cbar_extend(
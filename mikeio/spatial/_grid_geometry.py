@@ -1057,6 +1057,7 @@ class Grid2D(_Geometry):
             element_table=elem_table,
             codes=codes,
             projection=self.projection,
+            validate=False,
         )
 
     def to_mesh(
@@ -0,0 +1,140 @@
+import numpy as np
+from mikeio.spatial import GeometryFM2D
+
+
+def _structured_mesh(nx: int, ny: int, quads: bool = True) -> GeometryFM2D:
+    """Mesh with quads in the left half and triangles in the right half"""
+    x, y = np.meshgrid(np.arange(nx + 1.0), np.arange(ny + 1.0))
+    nc = np.column_stack([x.ravel(), y.ravel(), np.zeros(x.size)])
+
+    i, j = np.meshgrid(np.arange(nx), np.arange(ny))
+    n0 = (j * (nx + 1) + i).ravel()
+    n1, n2, n3 = n0 + 1, n0 + nx + 2, n0 + nx + 1
+    is_quad = (i < nx // 2).ravel() & quads
+
+    quads = np.column_stack([n0, n1, n2, n3])[is_quad]
+    tris = np.vstack(
+        [
+            np.column_stack([n0, n1, n2])[~is_quad],
+            np.column_stack([n0, n2, n3])[~is_quad],
+        ]
+    )
+    el = [*quads, *tris]
+    return GeometryFM2D(nc, el, projection="UTM-33")
+
+
+def test_element_coordinates_large_mesh():
+    g = _structured_mesh(600, 500)
+    assert g.n_elements > 400_000
+
+    ec = g.element_coordinates
+
+    assert ec.shape == (g.n_elements, 3)
+    for e in (0, g.n_elements // 2, g.n_elements - 1):
+        nodes = g.element_table[e]
+        assert np.allclose(ec[e], g.node_coordinates[nodes].mean(axis=0))
+
+
+def test_boundary_polylines_large_mesh():
+    g = _structured_mesh(1000, 1000)
+
+    bnd = g.boundary_polylines
+
+    assert bnd.n_exteriors == 1
+    assert bnd.n_interiors == 0
+    assert bnd.exteriors[0].n_nodes == 4001
+
+
+def test_find_index_many_points():
+    g = _structured_mesh(600, 500)
+
+    rng = np.random.default_rng(0)
+    xy = np.column_stack(
+        [rng.uniform(0, 600, size=500_000), rng.uniform(0, 500, size=500_000)]
+    )
+
+    idx = g.find_index(coords=xy)
+
+    assert len(idx) == len(xy)
+    assert np.all(g._points_in_elements(xy, idx[:, None]))
+
+
+def test_contains_many_points():
+    g = _structured_mesh(1000, 1000)
+
+    rng = np.random.default_rng(0)
+    xy = rng.uniform(-100, 1100, size=(1_000_000, 2))
+
+    inside = g.contains(xy)
+
+    expected = np.all((xy >= 0) & (xy <= 1000), axis=1)
+    assert np.array_equal(inside, expected)
+
+
+def test_isel_large_subset():
+    g = _structured_mesh(1000, 1000)
+
+    idx = g.find_index(area=[100, 100, 900, 900])
+    assert len(idx) > 500_000
+
+    g2 = g.isel(idx)
+
+    assert g2.n_elements == len(idx)
+    assert np.allclose(g2.element_coordinates, g.element_coordinates[idx])
+
+
+def test_node_centered_data_time_series_large_mesh():
+    g = _structured_mesh(400, 400, quads=False)
+    n_time = 50
+    data = np.tile(g.element_coordinates[:, 0], (n_time, 1))
+
+    nodedata = g.get_node_centered_data(data)
+
+    # linear field is reproduced by the pseudo-laplacian weights
+    assert nodedata.shape == (n_time, g.n_nodes)
+    x, y = g.node_coordinates[:, 0], g.node_coordinates[:, 1]
+    interior = (x > 0) & (x < 400) & (y > 0) & (y < 400)
+    assert np.allclose(nodedata[-1, interior], g.node_coordinates[interior, 0])
+
+
+def test_adjacency_large_mesh():
+    g = _structured_mesh(1000, 1000)
+    n_elements = g.n_elements
+
+    edges = g._edges
+    edge_elements = g._edge_elements
+    neighbours = g._element_neighbours
+    node_elements = g._node_elements
+
+    # Euler characteristic of a mesh without holes: V - E + F = 1
+    assert g.n_nodes - len(edges) + n_elements == 1
+    assert np.sum(edge_elements[:, 1] < 0) == 4000
+    assert np.sum(neighbours >= 0) == 2 * np.sum(edge_elements[:, 1] >= 0)
+    assert node_elements.nnz == np.sum(g.n_nodes_per_element)
+
+    # neighbours are symmetric
+    e, j = np.nonzero(neighbours >= 0)
+    assert np.all(np.any(neighbours[neighbours[e, j]] == e[:, None], axis=1))
+
+
+def test_tri_only_element_table_large_mesh():
+    g = _structured_mesh(1000, 1000)
+    n_quads = np.sum(g.n_nodes_per_element == 4)
+    assert n_quads == 500_000
+
+    tri_table, parent = g._tri_only_element_table
+
+    assert tri_table.shape == (g.n_elements + n_quads, 3)
+    assert np.bincount(parent).max() == 2
+    assert np.array_equal(tri_table[g.n_elements :, 0], g._connectivity[:n_quads, 2])
+    assert g._tri_only_element_table[1] is parent
+
+
+def test_to_shapely_large_mesh():
+    g = _structured_mesh(1000, 1000)
+
+    shp = g.to_shapely()
+
+    assert len(shp.geoms) == g.n_elements
+    assert shp.geoms[0].area == 1.0
+    assert shp.geoms[g.n_elements - 1].area == 0.5
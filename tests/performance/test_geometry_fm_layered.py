@@ -0,0 +1,162 @@
+import numpy as np
+from mikecore.DfsuFile import DfsuFileType
+from mikeio.spatial import GeometryFM3D, GeometryFMVerticalProfile
+
+
+def _layered_mesh(nx: int, ny: int, n_layers: int, n_sigma: int) -> GeometryFM3D:
+    """Sigma-z mesh of triangular prisms with 1 m thick layers
+
+    The number of z-layers in a column increases in the x-direction
+    """
+    x, y = np.meshgrid(np.arange(nx + 1.0), np.arange(ny + 1.0))
+    n_levels = n_layers + 1
+    n_nodes2d = x.size
+    nc = np.column_stack(
+        [
+            np.repeat(x.ravel(), n_levels),
+            np.repeat(y.ravel(), n_levels),
+            np.tile(np.arange(n_levels) - float(n_layers), n_nodes2d),
+        ]
+    )
+
+    i, j = np.meshgrid(np.arange(nx), np.arange(ny))
+    n0 = (j * (nx + 1) + i).ravel()
+    n1, n2, n3 = n0 + 1, n0 + nx + 2, n0 + nx + 1
+    tris = np.vstack([np.column_stack([n0, n1, n2]), np.column_stack([n0, n2, n3])])
+    n_z = np.tile((i.ravel() * (n_layers - n_sigma + 1)) // nx, 2)
+    n_layers_column = n_sigma + np.minimum(n_z, n_layers - n_sigma)
+
+    # elements of each column from bottom to top
+    col = np.repeat(np.arange(len(tris)), n_layers_column)
+    offsets = np.cumsum(n_layers_column) - n_layers_column
+    level = np.arange(len(col)) - np.repeat(offsets, n_layers_column)
+    level += np.repeat(n_layers - n_layers_column, n_layers_column)
+    bot = tris[col] * n_levels + level[:, None]
+    el = np.hstack([bot, bot + 1])
+
+    return GeometryFM3D(
+        node_coordinates=nc,
+        element_table=el,
+        projection="UTM-33",
+        dfsu_type=DfsuFileType.Dfsu3DSigmaZ,
+        n_layers=n_layers,
+        n_sigma=n_sigma,
+    )
+
+
+def test_column_structure_large_mesh():
+    g = _layered_mesh(200, 200, n_layers=10, n_sigma=4)
+    assert g.n_elements > 500_000
+
+    top = g.top_elements
+    e2_e3 = g.e2_e3_table
+
+    assert len(top) == 80_000
+    assert np.all(e2_e3.n_layers == g.n_layers_per_column)
+    assert g.n_layers_per_column.min() == 4
+    assert g.n_layers_per_column.max() == 10
+    assert np.all(g.layer_ids[top] == 9)
+    assert np.all(g.layer_ids[g.bottom_elements] == 10 - g.n_layers_per_column)
+    assert np.all(g.elem2d_ids[e2_e3[1234]] == 1234)
+
+
+def test_find_elem3d_many_points_large_mesh():
+    g = _layered_mesh(200, 200, n_layers=10, n_sigma=4)
+    rng = np.random.default_rng(42)
+    elem3d = rng.integers(0, g.n_elements, 100_000)
+    z = g.element_coordinates[elem3d, 2] + rng.uniform(-0.49, 0.49, len(elem3d))
+
+    found = g._find_elem3d_from_elem2d(g.elem2d_ids[elem3d], z)
+    assert np.all(found == elem3d)
+
+    zn = g.node_coordinates[:, 2] + 0.25
+    found = g._find_elem3d_from_elem2d(g.elem2d_ids[elem3d], z + 0.25, zn=zn)
+    assert np.all(found == elem3d)
+
+
+def test_dz_time_series_large_mesh():
+    g = _layered_mesh(200, 200, n_layers=10, n_sigma=4)
+    n_time = 10
+    zn = np.tile(g.node_coordinates[:, 2], (n_time, 1))
+    zn[:, g.node_coordinates[:, 2] == 0.0] += np.linspace(0, 1, n_time)[:, None]
+
+    dz = g._calc_dz(zn)
+
+    assert dz.shape == (n_time, g.n_elements)
+    assert np.allclose(dz[0], g._dz)
+    assert np.allclose(dz[-1, g.top_elements], 2.0)
+
+
+def test_depth_average_time_series_large_mesh():
+    g = _layered_mesh(200, 200, n_layers=10, n_sigma=4)
+    n_time = 10
+    zn = np.tile(g.node_coordinates[:, 2], (n_time, 1))
+    values = np.tile(g.element_coordinates[:, 2], (n_time, 1))
+
+    dz = g._calc_dz(zn)
+    average = g._vertical_integral(values, dz, average=True)
+
+    # average of layer centers is half the water depth
+    n_layers = g.n_layers_per_column
+    assert average.shape == (n_time, len(n_layers))
+    assert np.allclose(average[-1], -n_layers / 2)
+
+
+def test_geometry2d_large_mesh():
+    g = _layered_mesh(200, 200, n_layers=10, n_sigma=4)
+
+    g2 = g.geometry2d
+
+    assert g2.n_elements == 80_000
+    assert g2.n_nodes == 201 * 201
+    assert g2.node_coordinates[:, 2].min() == -10.0
+    assert g2.node_coordinates[:, 2].max() == -4.0
+
+
+def test_surface_interpolant_large_mesh():
+    g = _layered_mesh(200, 200, n_layers=10, n_sigma=4)
+
+    geom, node_ids, weights = g._get_surface_interpolant(n_nearest=4)
+
+    assert geom.n_elements == 80_000
+    assert node_ids.shape == (80_000, 4)
+    assert np.allclose(weights.sum(axis=1), 1.0)
+    assert np.all(g.node_coordinates[node_ids, 2] == 0.0)
+    assert g._get_surface_interpolant(n_nearest=4)[1] is node_ids
+
+
+def _vertical_profile(n_columns: int, n_layers: int) -> GeometryFMVerticalProfile:
+    """Sigma transect along the line y=x with 1 m thick layers"""
+    n_levels = n_layers + 1
+    s = np.arange(n_columns + 1.0)
+    nc = np.column_stack(
+        [
+            np.repeat(s, n_levels),
+            np.repeat(s, n_levels),
+            np.tile(np.arange(n_levels) - float(n_layers), n_columns + 1),
+        ]
+    )
+    n0 = (np.arange(n_columns)[:, None] * n_levels + np.arange(n_layers)).ravel()
+    el = np.column_stack([n0, n0 + n_levels, n0 + n_levels + 1, n0 + 1])
+
+    return GeometryFMVerticalProfile(
+        node_coordinates=nc,
+        element_table=el,
+        projection="UTM-33",
+        dfsu_type=DfsuFileType.DfsuVerticalProfileSigma,
+        n_layers=n_layers,
+        n_sigma=n_layers,
+    )
+
+
+def test_vertical_profile_find_index_many_points():
+    g = _vertical_profile(20_000, n_layers=10)
+    rng = np.random.default_rng(0)
+    col = rng.integers(0, 20_000, 10_000)
+    xy = np.column_stack([col + 0.5, col + 0.5])
+
+    d = g.get_nearest_relative_distance(xy + 0.1)
+    assert np.allclose(d, np.sqrt(2) * (col + 0.5))
+
+    idx = g.find_index(coords=np.column_stack([xy, np.full(len(col), -0.5)]))
+    assert np.all(idx == np.unique(g.top_elements[col]))
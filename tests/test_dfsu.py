@@ -507,6 +507,14 @@ def test_get_element_area_tri_quad():
     assert areas[0] == 0.0006875642143608321
 
 
+def test_get_element_area_is_cached_copy():
+    dfs = mikeio.open("tests/testdata/HD2D.dfsu")
+
+    areas = dfs.geometry.get_element_area()
+    areas[0] = -1.0
+    assert dfs.geometry.get_element_area()[0] == 4949.102548750438
+
+
 def test_write(tmp_path):
     fp = tmp_path / "simple.dfsu"
     meshfilename = "tests/testdata/odense_rough.mesh"
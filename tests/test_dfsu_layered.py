@@ -122,6 +122,17 @@ def test_read_dfsu3d_area():
     assert np.all(dsa1.to_numpy() == dsa2.to_numpy())
 
 
+def test_get_element_area_3d():
+    dfs = mikeio.open("tests/testdata/oresund_sigma_z.dfsu")
+    g = dfs.geometry
+
+    area2d = g.geometry2d.get_element_area()
+    area3d = g.get_element_area()
+    assert len(area3d) == g.n_elements
+    assert np.all(area3d[g.top_elements] == area2d)
+    assert np.all(area3d[g.bottom_elements] == area2d)
+
+
 def test_read_dfsu3d_area_single_element():
     filename = "tests/testdata/oresund_sigma_z.dfsu"
     dfs = mikeio.open(filename)
@@ -263,6 +274,127 @@ def test_read_dfsu3d_xyz():
     # 20.531237
 
 
+def test_find_elem3d_from_elem2d_many_points():
+    g = mikeio.open("tests/testdata/oresund_sigma_z.dfsu").geometry
+    elem3d = np.arange(0, g.n_elements, 7)
+    z = g.element_coordinates[elem3d, 2]
+
+    found = g._find_elem3d_from_elem2d(g.elem2d_ids[elem3d], z)
+    assert np.all(found == elem3d)
+
+    # dynamic zn: all nodes 1 m lower
+    zn = g.node_coordinates[:, 2] - 1.0
+    found = g._find_elem3d_from_elem2d(g.elem2d_ids[elem3d], z - 1.0, zn=zn)
+    assert np.all(found == elem3d)
+
+    with pytest.raises(ValueError, match="outside water column"):
+        g._find_elem3d_from_elem2d(g.elem2d_ids[elem3d], z + 1.0, zn=zn)
+
+
+def test_calc_dz_dynamic_zn():
+    ds = mikeio.read("tests/testdata/oresund_sigma_z.dfsu")
+    g = ds.geometry
+
+    dz = g._calc_dz(ds._zn)
+
+    assert dz.shape == (ds.n_timesteps, g.n_elements)
+    assert np.allclose(dz[1], g._calc_dz(ds._zn[1]))
+    assert np.all(dz > 0)
+
+    # layer heights add up to the water depth of each column
+    e2_e3 = g.e2_e3_table
+    depth = np.add.reduceat(dz, e2_e3.offsets[:-1], axis=1)
+    z_bot, z_top = g._element_z_bot_top(ds._zn)
+    assert np.allclose(depth, z_top[:, g.top_elements] - z_bot[:, g.bottom_elements])
+
+
+def test_depth_average():
+    ds = mikeio.read("tests/testdata/oresund_sigma_z.dfsu")
+    g = ds.geometry
+
+    da = ds.Temperature.depth_average()
+
+    assert da.geometry.is_2d
+    assert da.dims == ("time", "element")
+    assert da.shape == (ds.n_timesteps, len(g.top_elements))
+    assert da.item == ds.Temperature.item
+
+    # column by column
+    step, e2 = 2, 42
+    dz = g._calc_dz(ds._zn[step])
+    col = g.e2_e3_table[e2]
+    values = ds.Temperature.to_numpy()[step, col]
+    expected = np.sum(values * dz[col]) / np.sum(dz[col])
+    assert da.to_numpy()[step, e2] == pytest.approx(expected)
+
+    # single time step
+    da0 = ds.Temperature.isel(time=0).depth_average()
+    assert np.allclose(da0.to_numpy(), da.to_numpy()[0])
+
+
+def test_vertical_integral():
+    ds = mikeio.read("tests/testdata/oresund_sigma_z.dfsu")
+    water_depth = (ds.Salinity * 0.0 + 1.0).vertical_integral()
+    average = ds.Salinity.depth_average()
+
+    integral = ds.Salinity.vertical_integral()
+
+    assert integral.type == mikeio.EUMType.Undefined
+    assert np.allclose(integral.to_numpy(), average.to_numpy() * water_depth.to_numpy())
+
+    with pytest.raises(ValueError, match="3d"):
+        average.vertical_integral()
+
+
+def test_depth_average_skips_nan():
+    ds = mikeio.read("tests/testdata/oresund_sigma_z.dfsu")
+    g = ds.geometry
+    da = ds.Temperature.copy()
+
+    step, e2 = 2, 42
+    col = g.e2_e3_table[e2]
+    da.values[step, col[0]] = np.nan
+    da.values[:, g.e2_e3_table[e2 + 1]] = np.nan
+
+    average = da.depth_average().to_numpy()
+
+    dz = g._calc_dz(ds._zn[step])[col[1:]]
+    values = da.to_numpy()[step, col[1:]]
+    assert average[step, e2] == pytest.approx(np.sum(values * dz) / np.sum(dz))
+    assert np.all(np.isnan(average[:, e2 + 1]))
+    assert np.isnan(average).sum() == ds.n_timesteps
+
+    integral = da.vertical_integral().to_numpy()
+    assert integral[step, e2] == pytest.approx(np.sum(values * dz))
+
+
+def test_geometry2d_sigma_z():
+    g = mikeio.open("tests/testdata/oresund_sigma_z.dfsu").geometry
+
+    g2 = g.geometry2d
+
+    assert g2 is g.geometry2d
+    assert g2.n_elements == len(g.top_elements)
+    # the 2d nodes have the depth of the deepest column sharing the node
+    bottom_nodes = g._connectivity[g.bottom_elements, :3]
+    zn_bottom = g.node_coordinates[bottom_nodes, 2]
+    assert np.all(g2.node_coordinates[g2._connectivity[:, :3], 2] <= zn_bottom)
+    assert g2.node_coordinates[:, 2].min() == g.node_coordinates[:, 2].min()
+
+
+def test_nodes_and_table_for_top_and_bottom_layer():
+    g = mikeio.open("tests/testdata/basin_3d.dfsu").geometry
+    elements = g.top_elements[[0, 5]]
+
+    nodes, table = g._get_nodes_and_table_for_elements(elements, node_layers="top")
+    assert table.shape == (2, 3)
+    assert np.all(table == g._connectivity[elements, 3:])
+    assert np.all(nodes == np.unique(table))
+
+    nodes, table = g._get_nodes_and_table_for_elements(elements, node_layers="bottom")
+    assert np.all(table == g._connectivity[elements, :3])
+
+
 def test_read_dfsu3d_xyz_to_xarray():
     filename = "tests/testdata/oresund_sigma_z.dfsu"
     dfs = mikeio.open(filename)
@@ -493,6 +625,23 @@ def test_n_layers_per_column():
     assert not hasattr(dfs, "n_layers_per_column")
 
 
+def test_e2_e3_table():
+    filename = "tests/testdata/oresund_sigma_z.dfsu"
+    g = mikeio.open(filename).geometry
+    e2_e3 = g.e2_e3_table
+
+    assert len(e2_e3) == 3700
+    assert np.all(e2_e3.n_layers == g.n_layers_per_column)
+    assert list(e2_e3[3]) == [13, 14, 15, 16]
+    assert list(e2_e3[-1]) == [g.n_elements - 1 - j for j in range(5, -1, -1)]
+
+    # columns of several 2d elements
+    assert list(e2_e3.elements([3, 0])) == [13, 14, 15, 16, 0, 1, 2, 3, 4]
+    assert np.all(np.hstack(e2_e3[[3, 0]]) == e2_e3.elements([3, 0]))
+    assert np.all(g.elem2d_ids[e2_e3[3]] == 3)
+    assert np.all(g.layer_ids[e2_e3[3]] == [5, 6, 7, 8])
+
+
 # def test_get_layer_elements():
 #     filename = "tests/testdata/oresund_sigma_z.dfsu"
 #     dfs = mikeio.open(filename)
@@ -585,6 +734,21 @@ def test_extract_surface_elevation_from_3d():
     assert da.geometry.n_elements == n_top1
 
 
+def test_extract_surface_elevation_from_3d_interpolant_is_cached():
+
+    dfs = mikeio.open("tests/testdata/oresund_sigma_z.dfsu")
+    da = dfs.extract_surface_elevation_from_3d(n_nearest=1)
+
+    geom, node_ids, weights = dfs.geometry._get_surface_interpolant(n_nearest=1)
+    assert geom is da.geometry
+    assert weights is None
+    assert np.all(dfs.geometry.node_coordinates[node_ids, 2] > -1.0)
+
+    # surface elevation of element equals zn of the nearest surface node
+    ds = mikeio.read("tests/testdata/oresund_sigma_z.dfsu", time=-1)
+    assert np.allclose(da[-1].values, ds._zn[node_ids], atol=1e-5)
+
+
 def test_dataset_write_dfsu3d(tmp_path):
 
     fp = tmp_path / "oresund_sigma_z.dfsu"
@@ -636,6 +800,7 @@ def test_append_dfsu_3d(tmp_path):
     assert ds3.n_timesteps == 2
     assert ds3.time[-1] == ds2.time[-1]
 
+
 def test_read_elements_3d():
     ds = mikeio.read("tests/testdata/oresund_sigma_z.dfsu", elements=[0, 10])
     assert ds.geometry.element_coordinates[0][0] == pytest.approx(354020.46382194717)
@@ -671,4 +836,3 @@ def test_write_3d_non_equidistant(tmp_path):
 
     # but getting the end time is not that expensive
     assert dfs.end_time == pd.Timestamp("2000-01-10")
-
@@ -82,6 +82,14 @@ def test_properties_area_spectrum(dfsu_area):
     assert len(dfs.directions) == 16
 
 
+def test_boundary_polylines_area_spectrum(dfsu_area):
+    # the domain has an element attached by a single node
+    bnd = dfsu_area.geometry.boundary_polylines
+    assert bnd.n_exteriors == 1
+    assert bnd.n_interiors == 0
+    assert bnd.exteriors[0].n_nodes == 25
+
+
 def test_properties_line_dir_spectrum(dfsu_line_dir):
     dfs = dfsu_line_dir
     assert dfs.geometry.is_spectral
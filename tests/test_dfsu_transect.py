@@ -60,6 +60,30 @@ def test_transect_geometry_properties_geo(vslice_geo):
     assert d1 == pytest.approx(25673.318)
 
 
+def test_transect_nearest_relative_distance_many_points(vslice_geo):
+    g = vslice_geo.geometry
+    pts = np.array([[10.77, 55.62], [10.8, 55.6], [10.9, 55.65]])
+
+    d = g.get_nearest_relative_distance(pts)
+
+    assert d.shape == (3,)
+    assert d[0] == pytest.approx(25673.318)
+    for j, pt in enumerate(pts):
+        assert g.get_nearest_relative_distance(pt) == d[j]
+
+
+def test_transect_find_index_many_points(vslice_geo):
+    g = vslice_geo.geometry
+    xy = g.element_coordinates[g.top_elements[[3, 10, 50]], :2]
+
+    idx = g.find_index(coords=xy)
+    assert np.all(idx == g.e2_e3_table.elements([3, 10, 50]))
+
+    z = g.element_coordinates[g.bottom_elements[[3, 10, 50]], 2]
+    idx = g.find_index(coords=np.column_stack([xy, z]))
+    assert np.all(idx == g.bottom_elements[[3, 10, 50]])
+
+
 def test_transect_read(vslice):
     ds = vslice.read()
     assert ds.geometry._type == DfsuFileType.DfsuVerticalProfileSigmaZ
@@ -1,3 +1,5 @@
+import shutil
+
 import numpy as np
 import pandas as pd
 import mikeio
@@ -601,3 +603,397 @@ def test_fill_corrupt_data(tmp_path):
     orig = mikeio.read(infile)
     extracted = mikeio.read(fp)
     assert extracted.n_timesteps == orig.n_timesteps
+
+
+def test_pipeline_equals_extract_scale_avg_time(tmp_path):
+    infilename = "tests/testdata/oresundHD_run1.dfsu"
+
+    fp1 = tmp_path / "extracted.dfsu"
+    fp2 = tmp_path / "scaled.dfsu"
+    fp3 = tmp_path / "averaged.dfsu"
+    extract(infilename, fp1, start=1, end=4, items="Surface elevation")
+    scale(fp1, fp2, offset=1.0, factor=2.0)
+    avg_time(fp2, fp3)
+
+    fp = tmp_path / "pipeline.dfsu"
+    (
+        generic.Pipeline(infilename)
+        .select(items="Surface elevation", start=1, end=4)
+        .scale(offset=1.0, factor=2.0)
+        .reduce("mean")
+        .to(fp)
+    )
+
+    expected = mikeio.read(fp3)
+    ds = mikeio.read(fp)
+    assert ds.n_timesteps == 1
+    assert ds.n_items == 1
+    assert ds.time[0] == expected.time[0]
+    assert np.allclose(ds[0].to_numpy(), expected[0].to_numpy())
+
+
+def test_pipeline_select_scale_items(tmp_path):
+    infilename = "tests/testdata/wind_north_sea.dfsu"
+    fp = tmp_path / "pipeline.dfsu"
+    generic.Pipeline(infilename).select(start=2, step=2).scale(
+        factor=1.5, items=["Wind speed"]
+    ).to(fp)
+
+    org = mikeio.read(infilename, time=slice(2, None, 2))
+    ds = mikeio.read(fp)
+
+    assert ds.n_items == org.n_items
+    assert ds.n_timesteps == org.n_timesteps
+    assert ds.time[0] == org.time[0]
+    assert np.allclose(ds["Wind speed"].to_numpy(), org["Wind speed"].to_numpy() * 1.5)
+    assert np.allclose(
+        ds["Wind direction"].to_numpy(), org["Wind direction"].to_numpy()
+    )
+
+
+def test_pipeline_where_max(tmp_path):
+    infilename = "tests/testdata/wind_north_sea.dfsu"
+    fp = tmp_path / "pipeline.dfsu"
+    generic.Pipeline(infilename).select(items=0).where(lambda x: x < 10.0).reduce(
+        "max"
+    ).to(fp)
+
+    org = mikeio.read(infilename, items=0)[0].to_numpy()
+    org[org >= 10.0] = np.nan
+    expected = np.nanmax(org, axis=0)
+
+    ds = mikeio.read(fp)
+    assert ds.n_timesteps == 1
+    assert np.allclose(ds[0].to_numpy(), expected, equal_nan=True)
+
+
+def test_pipeline_where_mean(tmp_path):
+    infilename = "tests/testdata/HD2D.dfsu"
+    fp = tmp_path / "pipeline.dfsu"
+    generic.Pipeline(infilename).select(items=0).where(lambda x: x > 0.0).reduce(
+        "mean"
+    ).to(fp)
+
+    org = mikeio.read(infilename, items=0)[0].to_numpy().astype(np.float64)
+    org[org <= 0.0] = np.nan
+    expected = np.nanmean(org, axis=0)
+
+    ds = mikeio.read(fp)
+    assert ds.n_timesteps == 1
+    assert np.isnan(expected).sum() < len(expected) / 2
+    assert np.allclose(ds[0].to_numpy(), expected, equal_nan=True)
+
+
+def test_pipeline_where_mean_no_skipna(tmp_path):
+    infilename = "tests/testdata/HD2D.dfsu"
+    fp = tmp_path / "pipeline.dfsu"
+    generic.Pipeline(infilename).select(items=0).where(lambda x: x > 0.0).reduce(
+        "mean", skipna=False
+    ).to(fp)
+
+    org = mikeio.read(infilename, items=0)[0].to_numpy().astype(np.float64)
+    org[org <= 0.0] = np.nan
+    expected = np.mean(org, axis=0)
+
+    ds = mikeio.read(fp)
+    assert np.allclose(ds[0].to_numpy(), expected, equal_nan=True)
+
+
+def test_pipeline_dfsu_3d_keeps_zn(tmp_path):
+    infilename = "tests/testdata/oresund_sigma_z.dfsu"
+    fp = tmp_path / "pipeline_3d.dfsu"
+    generic.Pipeline(infilename).select(items="Salinity", end=2).scale(offset=-30.0).to(
+        fp
+    )
+
+    org = mikeio.read(infilename, items="Salinity", time=[0, 1])
+    ds = mikeio.read(fp)
+    assert ds.n_items == 1
+    assert ds.n_timesteps == 2
+    assert np.allclose(ds[0].to_numpy(), org[0].to_numpy() - 30.0)
+
+
+def test_pipeline_stage_on_unselected_item_fails(tmp_path):
+    infilename = "tests/testdata/wind_north_sea.dfsu"
+    fp = tmp_path / "pipeline.dfsu"
+    pipeline = generic.Pipeline(infilename).select(items=0).scale(factor=2, items=[1])
+
+    with pytest.raises(ValueError, match="not selected"):
+        pipeline.to(fp)
+
+
+def test_resample_daily_max_dfsu(tmp_path):
+    infilename = "tests/testdata/NorthSea_HD_and_windspeed.dfsu"
+    fp = tmp_path / "daily_max.dfsu"
+    generic.resample(infilename, fp, freq="1D", how="max")
+
+    org = mikeio.read(infilename)
+    ds = mikeio.read(fp)
+
+    assert ds.n_items == org.n_items
+    assert ds.n_timesteps == 3
+    assert ds.time[0] == pd.Timestamp("2017-10-27")
+    assert ds.time[-1] == pd.Timestamp("2017-10-29")
+
+    days = org.time.floor("1D")
+    for i, day in enumerate(days.unique()):
+        expected = org[1].to_numpy()[days == day].max(axis=0)
+        assert np.allclose(ds[1].to_numpy()[i], expected)
+
+
+def test_resample_non_equidistant_dfs0_like_pandas(tmp_path):
+    infilename = "tests/testdata/waves.dfs0"
+    fp = tmp_path / "waves_6h.dfs0"
+    generic.resample(infilename, fp, freq="6h", how="mean")
+
+    expected = mikeio.read(infilename).to_dataframe().resample("6h").mean()
+    df = mikeio.read(fp).to_dataframe()
+
+    assert all(df.index == expected.index)
+    assert np.allclose(df.to_numpy(), expected.to_numpy(), equal_nan=True)
+
+
+def test_resample_multi_day_bins_relative_to_epoch(tmp_path):
+    infilename = "tests/testdata/NorthSea_HD_and_windspeed.dfsu"
+    fp = tmp_path / "two_days.dfsu"
+    generic.resample(infilename, fp, freq="2D", items=[0])
+
+    org = mikeio.read(infilename, items=[0])
+    ds = mikeio.read(fp)
+
+    df = pd.DataFrame({"x": np.arange(org.n_timesteps)}, index=org.time)
+    expected = df.resample("2D", origin="epoch").mean()
+    assert all(ds.time == expected.index)
+
+
+def test_resample_non_equidistant_dfs0_in_days(tmp_path):
+    # time of each time step is stored in days, not seconds
+    infilename = "tests/testdata/neq_daily_time_unit.dfs0"
+    fp = tmp_path / "neq_weekly.dfs0"
+    generic.resample(infilename, fp, freq="7D", how="mean")
+
+    org = mikeio.read(infilename).to_dataframe()
+    expected = org.resample("7D", origin="epoch").mean()
+    df = mikeio.read(fp).to_dataframe()
+
+    assert len(df) == 597
+    assert all(df.index == expected.index)
+    assert np.allclose(df.to_numpy(), expected.to_numpy(), equal_nan=True)
+
+
+def test_resample_dfsu_3d(tmp_path):
+    infilename = "tests/testdata/oresund_sigma_z.dfsu"
+    fp = tmp_path / "oresund_sigma_z_12h.dfsu"
+    generic.resample(infilename, fp, freq="12h", how="sum", items="Salinity")
+
+    org = mikeio.read(infilename, items="Salinity")
+    ds = mikeio.read(fp)
+
+    assert ds.n_items == 1
+    assert ds.n_timesteps == 2
+    assert np.allclose(ds[0].to_numpy()[0], org[0].to_numpy()[:1].sum(axis=0))
+    assert np.allclose(ds[0].to_numpy()[1], org[0].to_numpy()[1:].sum(axis=0))
+
+
+def test_resample_invalid_freq(tmp_path):
+    infilename = "tests/testdata/waves.dfs0"
+    fp = tmp_path / "waves_monthly.dfs0"
+
+    with pytest.raises(ValueError, match="fixed frequency"):
+        generic.resample(infilename, fp, freq="MS")
+
+
+def test_rolling_mean_center_like_pandas(tmp_path):
+    infilename = "tests/testdata/NorthSea_HD_and_windspeed.dfsu"
+    fp = tmp_path / "rolling_mean.dfsu"
+    generic.rolling(infilename, fp, window=25, center=True)
+
+    org = mikeio.read(infilename)
+    ds = mikeio.read(fp)
+
+    assert ds.n_timesteps == org.n_timesteps
+    assert all(ds.time == org.time)
+    for item in range(org.n_items):
+        df = pd.DataFrame(org[item].to_numpy())
+        expected = df.rolling(25, center=True).mean().to_numpy()
+        assert np.allclose(ds[item].to_numpy(), expected, equal_nan=True)
+
+
+def test_rolling_max_min_periods_like_pandas(tmp_path):
+    infilename = "tests/testdata/waves.dfs0"
+    fp = tmp_path / "rolling_max.dfs0"
+    generic.rolling(infilename, fp, window=4, how="max", min_periods=2, items=[0])
+
+    org = mikeio.read(infilename, items=[0]).to_dataframe()
+    expected = org.rolling(4, min_periods=2).max()
+    df = mikeio.read(fp).to_dataframe()
+
+    assert all(df.index == expected.index)
+    assert np.allclose(df.to_numpy(), expected.to_numpy(), equal_nan=True)
+
+
+def test_rolling_window_longer_than_file(tmp_path):
+    infilename = "tests/testdata/wind_north_sea.dfsu"
+    fp = tmp_path / "rolling_sum.dfsu"
+    generic.rolling(infilename, fp, window=10, how="sum", center=True, min_periods=1)
+
+    org = mikeio.read(infilename)
+    ds = mikeio.read(fp)
+
+    df = pd.DataFrame(org[0].to_numpy())
+    expected = df.rolling(10, center=True, min_periods=1).sum().to_numpy()
+    assert np.allclose(ds[0].to_numpy(), expected)
+
+
+def test_transpose_read_elements(tmp_path):
+    infilename = "tests/testdata/oresundHD_run1.dfsu"
+    sidecar = tmp_path / "oresund_sidecar"
+    generic.transpose(infilename, sidecar, block_size=1e4)
+
+    store = generic.TransposedStore(sidecar)
+    assert store.n_timesteps == 5
+    assert [item.name for item in store.items] == [
+        item.name for item in mikeio.open(infilename).items
+    ]
+
+    elements = [3, 5, 7]
+    ds = store.read(elements=elements)
+    expected = mikeio.read(infilename, elements=elements)
+    assert all(ds.time == expected.time)
+    assert ds.geometry.n_elements == 3
+    assert np.allclose(ds.to_numpy(), expected.to_numpy())
+
+    ds = store.read(x=340000, y=6160000, items="Surface elevation")
+    expected = mikeio.read(infilename, x=340000, y=6160000, items="Surface elevation")
+    assert ds.dims == ("time",)
+    assert np.allclose(ds[0].to_numpy(), expected[0].to_numpy())
+
+
+def test_transpose_deletevalues(tmp_path):
+    infilename = "tests/testdata/gebco_sound.dfs2"
+    sidecar = tmp_path / "gebco_sidecar"
+    generic.transpose(infilename, sidecar)
+
+    ds = generic.TransposedStore(sidecar).read()
+    expected = mikeio.read(infilename)[0].to_numpy().reshape(1, -1)
+    assert np.allclose(ds[0].to_numpy(), expected, equal_nan=True)
+
+
+def test_transpose_read_dfs0(tmp_path):
+    infilename = "tests/testdata/random.dfs0"
+    sidecar = tmp_path / "random_sidecar"
+    generic.transpose(infilename, sidecar)
+
+    store = generic.TransposedStore(sidecar)
+    assert isinstance(store.geometry, mikeio.spatial.GeometryUndefined)
+
+    ds = store.read()
+    expected = mikeio.read(infilename)
+    assert ds.n_items == 2
+    assert all(ds.time == expected.time)
+    assert np.allclose(ds[0].to_numpy()[:, 0], expected[0].to_numpy(), equal_nan=True)
+
+    ds = store.read(elements=[0], items=1)
+    assert ds.dims == ("time",)
+    assert np.allclose(ds[0].to_numpy(), expected[1].to_numpy(), equal_nan=True)
+
+    with pytest.raises(ValueError, match="spatial source"):
+        store.read(x=0.0, y=0.0)
+
+
+def test_transpose_read_dfs2(tmp_path):
+    infilename = "tests/testdata/eq.dfs2"
+    sidecar = tmp_path / "eq_sidecar"
+    generic.transpose(infilename, sidecar)
+
+    store = generic.TransposedStore(sidecar)
+    assert isinstance(store.geometry, mikeio.Grid2D)
+
+    # elements are flat indices into the (y, x) grid
+    expected = mikeio.read(infilename)[0].to_numpy()
+    ds = store.read(elements=[np.ravel_multi_index((3, 5), expected.shape[1:])])
+    assert ds.dims == ("time",)
+    assert np.allclose(ds[0].to_numpy(), expected[:, 3, 5])
+
+    with pytest.raises(ValueError, match="flexible mesh"):
+        store.read(x=store.geometry.x[5], y=store.geometry.y[3])
+
+
+def test_transpose_sidecar_moved_with_source(tmp_path):
+    infilename = tmp_path / "data" / "oresundHD_run1.dfsu"
+    infilename.parent.mkdir()
+    shutil.copyfile("tests/testdata/oresundHD_run1.dfsu", infilename)
+    generic.transpose(infilename, tmp_path / "data" / "sidecar")
+
+    (tmp_path / "data").rename(tmp_path / "moved")
+    store = generic.TransposedStore(tmp_path / "moved" / "sidecar")
+    ds = store.read(elements=[3, 5])
+    assert ds.geometry.n_elements == 2
+
+    # without source, data can still be read
+    (tmp_path / "moved" / "oresundHD_run1.dfsu").unlink()
+    store = generic.TransposedStore(tmp_path / "moved" / "sidecar")
+    ds = store.read(elements=[3, 5])
+    assert isinstance(ds.geometry, mikeio.spatial.GeometryUndefined)
+    assert ds.shape == (5, 2)
+
+
+def test_quantile_from_sidecar_dfsu_3d(tmp_path):
+    infilename = "tests/testdata/oresund_sigma_z.dfsu"
+    sidecar = tmp_path / "oresund_sigma_z_sidecar"
+    generic.transpose(infilename, sidecar)
+
+    fp1 = tmp_path / "q_sidecar.dfsu"
+    fp2 = tmp_path / "q.dfsu"
+    kwargs = dict(q=[0.1, 0.9], items=["Temperature"], buffer_size=1e4)
+    generic.quantile(infilename, fp1, sidecar=sidecar, **kwargs)
+    generic.quantile(infilename, fp2, **kwargs)
+
+    ds1 = mikeio.read(fp1)
+    ds2 = mikeio.read(fp2)
+    assert ds1.n_items == 2
+    assert np.allclose(ds1.to_numpy(), ds2.to_numpy())
+
+    org = mikeio.read(infilename, items="Temperature")
+    expected = np.quantile(org[0].to_numpy(), q=0.9, axis=0)
+    assert np.allclose(ds1[1].to_numpy()[0], expected)
+
+
+def test_depth_average_dfsu_3d(tmp_path):
+    infilename = "tests/testdata/oresund_sigma_z.dfsu"
+    fp = tmp_path / "oresund_depth_average.dfsu"
+    generic.depth_average(infilename, fp, items="Salinity")
+
+    org = mikeio.read(infilename, items="Salinity")
+    ds = mikeio.read(fp)
+
+    assert ds.n_items == 1
+    assert ds.geometry.is_2d
+    assert ds.geometry.n_elements == len(org.geometry.top_elements)
+    assert all(ds.time == org.time)
+    assert ds[0].item == org[0].item
+    expected = org.Salinity.depth_average().to_numpy()
+    assert np.allclose(ds[0].to_numpy(), expected, atol=1e-5)
+
+
+def test_extract_surface_elevation(tmp_path):
+    infilename = "tests/testdata/oresund_sigma_z.dfsu"
+    fp = tmp_path / "surface_elevation.dfsu"
+    generic.extract_surface_elevation(infilename, fp)
+
+    da = mikeio.open(infilename).extract_surface_elevation_from_3d()
+    ds = mikeio.read(fp)
+
+    assert ds.geometry.is_2d
+    assert ds.n_items == 1
+    assert ds[0].type == mikeio.EUMType.Surface_Elevation
+    assert ds.time.equals(da.time)
+    assert np.allclose(ds[0].values, da.values, atol=1e-5)
+
+    with pytest.raises(ValueError, match="3d"):
+        generic.extract_surface_elevation("tests/testdata/HD2D.dfsu", fp)
+
+
+def test_vertical_integral_dfsu_2d_fails(tmp_path):
+    with pytest.raises(ValueError, match="3d"):
+        generic.vertical_integral("tests/testdata/HD2D.dfsu", tmp_path / "vi.dfsu")
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from mikeio.spatial import GeometryFM2D, GeometryFM3D
 from mikeio.exceptions import OutsideModelDomainError
 from mikeio.spatial import GeometryPoint2D
@@ -86,6 +87,44 @@ def test_too_many_elements():
     assert "element" in str(excinfo.value).lower()
 
 
+def test_negative_node_id_in_element():
+    nc = [
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (0.5, 1.0, 0.0),
+        (1.5, 1.0, 0.0),
+    ]
+    el = [(0, 1, 2), (1, -3, 2)]
+
+    with pytest.raises(ValueError, match="element 1"):
+        GeometryFM2D(nc, el)
+
+
+def test_element_ids_wrong_length():
+    nc = [
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (0.5, 1.0, 0.0),
+    ]
+    el = [(0, 1, 2)]
+
+    with pytest.raises(ValueError, match="element_ids"):
+        GeometryFM2D(nc, el, element_ids=[0, 1])
+
+
+def test_no_validation_of_trusted_element_table():
+    nc = [
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (0.5, 1.0, 0.0),
+    ]
+    el = [(0, 1, 2, 3)]
+
+    g = GeometryFM2D(nc, el, validate=False)
+
+    assert g.n_elements == 1
+
+
 def test_overset_grid():
     #     x     y    z
     nc = [
@@ -277,3 +316,432 @@ def test_equality_shifted_coords():
 
     g2 = GeometryFM2D(node_coordinates=nc2, element_table=el, projection="LONG/LAT")
     assert g != g2
+
+
+def test_element_table_mixed_mesh():
+    #     x     y    z
+    nc = [
+        (0.0, 0.0, 0.0),  # 0
+        (1.0, 0.0, 0.0),  # 1
+        (1.0, 1.0, 0.0),  # 2
+        (0.0, 1.0, 0.0),  # 3
+        (2.0, 0.0, 0.0),  # 4
+    ]
+
+    el = [(0, 1, 2, 3), (1, 4, 2)]
+
+    g = GeometryFM2D(node_coordinates=nc, element_table=el, projection="UTM-33")
+    assert g.max_nodes_per_element == 4
+    assert list(g.n_nodes_per_element) == [4, 3]
+    assert g._connectivity.dtype == np.int32
+    assert g._connectivity.tolist() == [[0, 1, 2, 3], [1, 4, 2, -1]]
+
+    # list-like access
+    assert len(g.element_table) == 2
+    assert list(g.element_table[1]) == [1, 4, 2]
+    assert np.hstack(g.element_table).tolist() == [0, 1, 2, 3, 1, 4, 2]
+
+    # padded array as input
+    g2 = GeometryFM2D(
+        node_coordinates=nc, element_table=g._connectivity, projection="UTM-33"
+    )
+    assert list(g2.n_nodes_per_element) == [4, 3]
+    assert list(g2.element_table[1]) == [1, 4, 2]
+
+
+def test_element_table_setter():
+    nc = [
+        (0.0, 0.0, 0.0),  # 0
+        (1.0, 0.0, 0.0),  # 1
+        (1.0, 1.0, 0.0),  # 2
+        (0.0, 1.0, 0.0),  # 3
+    ]
+
+    g = GeometryFM2D(nc, [(0, 1, 2), (0, 2, 3)], projection="UTM-33")
+    g.element_table = [(0, 1, 2, 3), (0, 2, 3)]
+    assert g.max_nodes_per_element == 4
+    assert list(g.element_table[0]) == [0, 1, 2, 3]
+
+    with pytest.raises(ValueError, match="length"):
+        g.element_table = [(0, 1, 2)]
+
+
+def test_element_table_is_read_only():
+    nc = [
+        (0.0, 0.0, 0.0),  # 0
+        (1.0, 0.0, 0.0),  # 1
+        (1.0, 1.0, 0.0),  # 2
+        (0.0, 1.0, 0.0),  # 3
+    ]
+
+    g = GeometryFM2D(nc, [(0, 1, 2), (0, 2, 3)], projection="UTM-33")
+    ec = g.element_coordinates.copy()
+
+    with pytest.raises(ValueError, match="read-only"):
+        g.element_table[0][0] = 3
+    with pytest.raises(ValueError, match="read-only"):
+        g.element_table[0] = np.array([1, 2, 3])
+
+    assert list(g.element_table[0]) == [0, 1, 2]
+    assert np.all(g.element_coordinates == ec)
+
+
+def test_element_table_setter_layered() -> None:
+    #     x     y    z
+    nc = [
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (1.0, 1.0, 0.0),
+        (0.0, 0.0, -1.0),
+        (1.0, 0.0, -1.0),
+        (1.0, 1.0, -1.0),
+        (0.0, 0.0, -2.0),
+        (1.0, 0.0, -2.0),
+        (1.0, 1.0, -2.0),
+    ]
+    # sigma-z: the columns are found from the element table
+    g = GeometryFM3D(
+        node_coordinates=nc,
+        element_table=[(6, 7, 8, 3, 4, 5), (3, 4, 5, 0, 1, 2)],
+        projection="LONG/LAT",
+        n_layers=2,
+        n_sigma=1,
+    )
+    # a single column with two layers
+    assert list(g.layer_ids) == [0, 1]
+    assert list(g.e2_e3_table[0]) == [0, 1]
+    assert list(g.elem2d_ids) == [0, 0]
+    assert list(g.bottom_elements) == [0]
+
+    # two columns with one layer each
+    g.element_table = [(3, 4, 5, 0, 1, 2), (6, 7, 8, 3, 4, 5)]
+
+    assert list(g.layer_ids) == [1, 1]
+    assert list(g.e2_e3_table[0]) == [0]
+    assert list(g.elem2d_ids) == [0, 1]
+    assert list(g.bottom_elements) == [0, 1]
+    assert list(g.top_elements) == [0, 1]
+
+
+def test_reindex_element_table():
+    nc = [
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (1.0, 1.0, 0.0),
+        (0.0, 1.0, 0.0),
+    ]
+
+    g = GeometryFM2D(
+        nc, [(10, 11, 12, 13), (10, 12, 13)], node_ids=[10, 11, 12, 13], reindex=True
+    )
+    assert list(g.node_ids) == [0, 1, 2, 3]
+    assert g._connectivity.tolist() == [[0, 1, 2, 3], [0, 2, 3, -1]]
+
+
+def test_element_coordinates_mixed_mesh():
+    nc = [
+        (0.0, 0.0, 0.0),  # 0
+        (1.0, 0.0, -1.0),  # 1
+        (1.0, 1.0, -2.0),  # 2
+        (0.0, 1.0, -3.0),  # 3
+        (2.0, 0.0, -4.0),  # 4
+    ]
+
+    el = [(0, 1, 2, 3), (1, 4, 2)]
+
+    g = GeometryFM2D(node_coordinates=nc, element_table=el, projection="UTM-33")
+    ec = g.element_coordinates
+    assert ec[0] == pytest.approx([0.5, 0.5, -1.5])
+    assert ec[1] == pytest.approx([4.0 / 3, 1.0 / 3, -7.0 / 3])
+
+
+def test_element_coordinates_layered(simple_3d_geom: GeometryFM3D):
+    ec = simple_3d_geom.element_coordinates
+    assert ec[:, 0] == pytest.approx([2.0 / 3, 2.0 / 3])
+    assert ec[:, 1] == pytest.approx([1.0 / 3, 1.0 / 3])
+    assert ec[:, 2] == pytest.approx([-0.5, -1.5])
+
+
+def test_boundary_polylines_with_hole():
+    # 3x3 quads with the center element removed
+    x, y = np.meshgrid(np.arange(4.0), np.arange(4.0))
+    nc = np.column_stack([x.ravel(), y.ravel(), np.zeros(16)])
+    el = [
+        (j * 4 + i, j * 4 + i + 1, j * 4 + i + 5, j * 4 + i + 4)
+        for j in range(3)
+        for i in range(3)
+        if (i, j) != (1, 1)
+    ]
+
+    g = GeometryFM2D(nc, el, projection="UTM-33")
+    bnd = g.boundary_polylines
+    assert bnd.n_exteriors == 1
+    assert bnd.n_interiors == 1
+    assert bnd.exteriors[0].n_nodes == 13
+    assert bnd.exteriors[0].nodes[0] == bnd.exteriors[0].nodes[-1]
+    assert bnd.exteriors[0].area == pytest.approx(9.0)
+    assert set(bnd.interiors[0].nodes) == {5, 6, 9, 10}
+    assert bnd.interiors[0].area == pytest.approx(-1.0)
+
+
+def test_boundary_polylines_touching_at_node():
+    # two triangles sharing a single node
+    nc = [
+        (0.0, 0.0, 0.0),  # 0
+        (1.0, 0.0, 0.0),  # 1
+        (1.0, 1.0, 0.0),  # 2
+        (2.0, 1.0, 0.0),  # 3
+        (2.0, 2.0, 0.0),  # 4
+    ]
+    el = [(0, 1, 2), (2, 3, 4)]
+
+    g = GeometryFM2D(nc, el, projection="UTM-33")
+    bnd = g.boundary_polylines
+    assert bnd.n_exteriors == 2
+    assert bnd.n_interiors == 0
+    assert list(bnd.exteriors[0].nodes) == [0, 1, 2, 0]
+    assert list(bnd.exteriors[1].nodes) == [2, 3, 4, 2]
+
+
+def test_find_index_many_points_mixed_mesh():
+    nc = [
+        (0.0, 0.0, 0.0),  # 0
+        (1.0, 0.0, 0.0),  # 1
+        (1.0, 1.0, 0.0),  # 2
+        (0.0, 1.0, 0.0),  # 3
+        (2.0, 0.0, 0.0),  # 4
+    ]
+    el = [(0, 1, 2, 3), (1, 4, 2)]
+    g = GeometryFM2D(nc, el, projection="UTM-33")
+
+    xy = np.array([[0.5, 0.5], [1.2, 0.5], [0.1, 0.9], [1.9, 0.05]])
+    assert list(g.find_index(coords=xy)) == [0, 1, 0, 1]
+
+    xy_outside = np.array([[0.5, 0.5], [1.8, 0.9], [-1.0, 0.0]])
+    with pytest.raises(OutsideModelDomainError) as excinfo:
+        g.find_index(coords=xy_outside)
+    assert excinfo.value.indices == [1, 2]
+
+
+def test_find_index_next_to_many_small_elements():
+    # a large triangle next to a strip of small triangles, which have
+    # element centers much closer to the point than the large triangle
+    n = 60
+    t = np.linspace(0.0, 1.0, n + 1)
+    inner = np.column_stack([40 + 20 * t, 60 - 20 * t])
+    outer = inner + 0.5
+    nc = np.vstack([[(0.0, 0.0), (100.0, 0.0), (0.0, 100.0)], inner, outer])
+    nc = np.column_stack([nc, np.zeros(len(nc))])
+    el = [(0, 1, 2)]
+    for i in range(n):
+        a, b = 3 + i, 3 + i + 1
+        c, d = 3 + n + 1 + i, 3 + n + 1 + i + 1
+        el += [(a, b, d), (a, d, c)]
+
+    g = GeometryFM2D(nc, el, projection="UTM-33")
+    assert g.find_index(x=49.9, y=49.9)[0] == 0
+    assert g.find_index(x=50.2, y=50.2)[0] > 0
+
+
+def test_element_index_is_pickled_with_geometry():
+    import pickle
+
+    nc = [
+        (0.0, 0.0, 0.0),  # 0
+        (1.0, 0.0, 0.0),  # 1
+        (1.0, 1.0, 0.0),  # 2
+        (0.0, 1.0, 0.0),  # 3
+    ]
+    g = GeometryFM2D(nc, [(0, 1, 2), (0, 2, 3)], projection="UTM-33")
+    assert list(g.find_index(coords=[[0.9, 0.1], [0.1, 0.9]])) == [0, 1]
+
+    g2 = pickle.loads(pickle.dumps(g))
+    assert "_element_index" in g2.__dict__
+    assert list(g2.find_index(coords=[[0.9, 0.1], [0.1, 0.9]])) == [0, 1]
+    assert list(g2.find_index(area=[0.5, -1, 2, 0.5])) == [0]
+
+
+def test_contains_with_hole():
+    # 3x3 quads with the center element removed
+    x, y = np.meshgrid(np.arange(4.0), np.arange(4.0))
+    nc = np.column_stack([x.ravel(), y.ravel(), np.zeros(16)])
+    el = [
+        (j * 4 + i, j * 4 + i + 1, j * 4 + i + 5, j * 4 + i + 4)
+        for j in range(3)
+        for i in range(3)
+        if (i, j) != (1, 1)
+    ]
+    g = GeometryFM2D(nc, el, projection="UTM-33")
+
+    xy = [[0.5, 0.5], [1.5, 1.5], [2.5, 1.5], [3.5, 1.5], [np.nan, 1.0]]
+    assert list(g.contains(xy)) == [True, False, True, False, False]
+    assert (0.5, 2.5) in g
+    assert (1.5, 1.5) not in g
+
+
+def test_isel_reindexes_nodes_and_elements():
+    nc = [
+        (0.0, 0.0, 0.0),  # 0
+        (1.0, 0.0, -1.0),  # 1
+        (1.0, 1.0, -2.0),  # 2
+        (0.0, 1.0, -3.0),  # 3
+        (2.0, 0.0, -4.0),  # 4
+        (2.0, 1.0, -5.0),  # 5
+    ]
+    el = [(0, 1, 2, 3), (1, 4, 2), (4, 5, 2)]
+    g = GeometryFM2D(nc, el, codes=[1, 0, 0, 1, 2, 2], projection="UTM-33")
+
+    g2 = g.isel([2, 1])
+    assert isinstance(g2, GeometryFM2D)
+    assert g2.n_nodes == 4
+    assert list(g2.node_ids) == [0, 1, 2, 3]
+    assert list(g2.element_ids) == [0, 1]
+    assert list(g2.codes) == [0, 0, 2, 2]
+    assert g2.node_coordinates[:, 2].tolist() == [-1.0, -2.0, -4.0, -5.0]
+    assert g2._connectivity.tolist() == [[2, 3, 1], [0, 2, 1]]
+    assert g2.element_coordinates[0] == pytest.approx(g.element_coordinates[2])
+
+
+def test_node_centered_data_time_series():
+    nc = [
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (1.0, 1.0, 0.0),
+        (0.0, 1.0, 0.0),
+        (2.0, 0.0, 0.0),
+        (2.0, 1.0, 0.0),
+    ]
+    el = [(0, 1, 2, 3), (1, 4, 5), (1, 5, 2)]
+    g = GeometryFM2D(nc, el, projection="LONG/LAT")
+    data = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    nodedata = g.get_node_centered_data(data)
+
+    assert nodedata.shape == (2, 6)
+    for step in range(2):
+        assert np.allclose(nodedata[step], g.get_node_centered_data(data[step]))
+    # single element => same value at its nodes
+    assert nodedata[0, 3] == pytest.approx(1.0)
+
+
+def test_node_centered_data_after_new_element_table():
+    nc = [
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (1.0, 1.0, 0.0),
+        (0.0, 1.0, 0.0),
+    ]
+    g = GeometryFM2D(nc, [(0, 1, 2), (0, 2, 3)], projection="LONG/LAT")
+    assert g.get_node_centered_data(np.array([1.0, 2.0]))[1] == pytest.approx(1.0)
+
+    g.element_table = [(0, 1, 3), (1, 2, 3)]
+
+    assert g.get_node_centered_data(np.array([1.0, 2.0]))[2] == pytest.approx(2.0)
+
+
+def test_adjacency_mixed_mesh():
+    nc = [
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (1.0, 1.0, 0.0),
+        (0.0, 1.0, 0.0),
+        (2.0, 0.0, 0.0),
+        (2.0, 1.0, 0.0),
+    ]
+    el = [(0, 1, 2, 3), (1, 4, 5), (1, 5, 2)]
+    g = GeometryFM2D(nc, el, projection="LONG/LAT")
+
+    assert g._edges.tolist() == [
+        [0, 1],
+        [0, 3],
+        [1, 2],
+        [1, 4],
+        [1, 5],
+        [2, 3],
+        [2, 5],
+        [4, 5],
+    ]
+    assert g._edge_elements.tolist() == [
+        [0, -1],
+        [0, -1],
+        [0, 2],
+        [1, -1],
+        [1, 2],
+        [0, -1],
+        [2, -1],
+        [1, -1],
+    ]
+    # face j goes from node j to node j+1
+    assert g._element_neighbours.tolist() == [
+        [-1, 2, -1, -1],
+        [-1, -1, 2, -1],
+        [1, -1, 0, -1],
+    ]
+
+    ne = g._node_elements
+    assert ne.shape == (6, 3)
+    assert ne.indices[ne.indptr[1] : ne.indptr[2]].tolist() == [0, 1, 2]
+    assert ne.indices[ne.indptr[3] : ne.indptr[4]].tolist() == [0]
+
+    assert len(g._get_boundary_faces()) == 6
+
+
+def test_adjacency_after_new_element_table():
+    nc = [
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (1.0, 1.0, 0.0),
+        (0.0, 1.0, 0.0),
+    ]
+    g = GeometryFM2D(nc, [(0, 1, 2), (0, 2, 3)], projection="LONG/LAT")
+    assert g._edges.tolist()[1] == [0, 2]
+
+    g.element_table = [(0, 1, 3), (1, 2, 3)]
+
+    assert g._edges.tolist()[3] == [1, 3]
+    assert g._element_neighbours.tolist() == [[-1, 1, -1], [-1, -1, 0]]
+
+
+def test_tri_only_element_table_mixed_mesh():
+    nc = [
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (1.0, 1.0, 0.0),
+        (0.0, 1.0, 0.0),
+        (2.0, 0.0, 0.0),
+        (2.0, 1.0, 0.0),
+    ]
+    el = [(0, 1, 2, 3), (1, 4, 5), (1, 5, 2)]
+    g = GeometryFM2D(nc, el, projection="LONG/LAT")
+
+    tri_table, parent = g._tri_only_element_table
+
+    assert tri_table.tolist() == [[0, 1, 2], [1, 4, 5], [1, 5, 2], [2, 3, 0]]
+    assert parent.tolist() == [0, 1, 2, 0]
+
+    # same value in both triangles of the quad => same value at its nodes
+    nodedata = g.get_node_centered_data(np.array([1.0, 2.0, 3.0]))
+    assert nodedata[0] == pytest.approx(1.0)
+    assert nodedata[3] == pytest.approx(1.0)
+
+
+def test_tri_only_element_table_reused_by_plots():
+    import matplotlib.pyplot as plt
+
+    nc = [
+        (0.0, 0.0, -1.0),
+        (1.0, 0.0, -2.0),
+        (1.0, 1.0, -3.0),
+        (0.0, 1.0, -2.0),
+        (2.0, 0.0, -1.0),
+        (2.0, 1.0, -2.0),
+    ]
+    el = [(0, 1, 2, 3), (1, 4, 5), (1, 5, 2)]
+    g = GeometryFM2D(nc, el, projection="UTM-33")
+
+    g.plot.contourf()
+    tri_table, _ = g._tri_only_element_table
+    g.plot.contour()
+
+    assert g._tri_only_element_table[0] is tri_table
+    plt.close("all")
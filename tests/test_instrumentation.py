@@ -0,0 +1,77 @@
+import logging
+
+import pytest
+
+import mikeio
+from mikeio import generic, instrumentation
+
+
+def test_record_dfsu_read():
+    with instrumentation.record() as records:
+        ds = mikeio.read("tests/testdata/oresundHD_run1.dfsu")
+
+    assert len(records) == 1
+    stats = records[0]
+    assert stats.name == "Dfsu2DH.read"
+    assert stats.item_steps_read == ds.n_items * ds.n_timesteps
+    assert stats.bytes_read == ds.n_items * ds.n_timesteps * ds.geometry.n_elements * 4
+    assert stats.bytes_written == 0
+    assert stats.peak_buffer == stats.bytes_read
+    assert 0.0 < stats.time_mikecore <= stats.time_total
+    assert stats.time_processing == pytest.approx(
+        stats.time_total - stats.time_mikecore
+    )
+    assert stats.throughput > 0.0
+
+
+def test_record_dfs0_read_and_write(tmp_path):
+    with instrumentation.record() as records:
+        ds = mikeio.read("tests/testdata/random.dfs0")
+        ds.to_dfs(tmp_path / "random.dfs0")
+
+    assert [r.name for r in records] == ["Dfs0.read", "write_dfs0"]
+    assert records[0].item_steps_read == ds.n_items * ds.n_timesteps
+    assert records[1].item_steps_written == ds.n_items * ds.n_timesteps
+
+
+def test_record_generic(tmp_path):
+    infilename = "tests/testdata/oresundHD_run1.dfsu"
+    with instrumentation.record() as records:
+        generic.scale(infilename, tmp_path / "scaled.dfsu", factor=2.0)
+        generic.avg_time(infilename, tmp_path / "avg.dfsu")
+
+    assert [r.name for r in records] == ["generic.scale", "generic.avg_time"]
+    scale_stats, avg_stats = records
+    assert scale_stats.item_steps_read == 20
+    assert scale_stats.item_steps_written == 20
+    assert scale_stats.bytes_read == scale_stats.bytes_written
+    assert avg_stats.item_steps_read == 20
+    assert avg_stats.item_steps_written == 4
+
+
+def test_nested_calls_are_accounted_to_outer_call(tmp_path):
+    infilenames = ["tests/testdata/random.dfs0", "tests/testdata/random.dfs0"]
+    with instrumentation.record() as records:
+        generic.concat(infilenames, tmp_path / "concat.dfs0")
+
+    assert [r.name for r in records] == ["generic.concat"]
+    assert records[0].bytes_read > 0
+    assert records[0].bytes_written > 0
+
+
+def test_callback_and_logging(caplog):
+    calls = []
+    instrumentation.add_callback(calls.append)
+    try:
+        mikeio.read("tests/testdata/random.dfs2")
+    finally:
+        instrumentation.remove_callback(calls.append)
+    assert [c.name for c in calls] == ["Dfs2.read"]
+
+    with caplog.at_level(logging.DEBUG, logger="mikeio.instrumentation"):
+        mikeio.read("tests/testdata/random.dfs2")
+    assert "Dfs2.read" in caplog.text
+
+    # no callbacks and no logging: nothing is recorded
+    mikeio.read("tests/testdata/random.dfs2")
+    assert len(calls) == 1
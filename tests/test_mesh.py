@@ -155,3 +155,12 @@ def test_to_shapely(tri_mesh) -> None:
     shp = msh.to_shapely()
     assert shp.geom_type == "MultiPolygon"
     assert shp.area == pytest.approx(68931409.58160606)
+
+
+def test_to_geopandas(tri_mesh) -> None:
+    pytest.importorskip("geopandas")
+
+    msh = tri_mesh
+    gdf = msh.to_geopandas()
+    assert len(gdf) == msh.geometry.n_elements
+    assert gdf.geometry.area.sum() == pytest.approx(68931409.58160606)
@@ -1,4 +1,6 @@
+import numpy as np
 import pytest
+import mikeio
 from mikeio.spatial._FM_geometry import GeometryFM2D
 
 
@@ -22,3 +24,70 @@ def test_to_shapely():
     shp = g.to_shapely()
     assert shp.geom_type == "MultiPolygon"
     assert shp.area == 0.5
+
+
+def test_to_shapely_mixed_mesh():
+    nc = [
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (1.0, 1.0, 0.0),
+        (0.0, 1.0, 0.0),
+        (2.0, 0.0, 0.0),
+    ]
+    el = [(0, 1, 2, 3), (1, 4, 2)]
+
+    g = GeometryFM2D(nc, el)
+    shp = g.to_shapely()
+    assert shp.geom_type == "MultiPolygon"
+    assert len(shp.geoms) == 2
+    assert shp.geoms[0].area == 1.0
+    assert shp.geoms[1].area == 0.5
+    assert list(shp.geoms[1].exterior.coords) == [
+        (1.0, 0.0),
+        (2.0, 0.0),
+        (1.0, 1.0),
+        (1.0, 0.0),
+    ]
+
+
+def test_to_geopandas():
+    pytest.importorskip("geopandas")
+
+    nc = [
+        (0.0, 0.0, 0.0),
+        (1.0, 0.0, 0.0),
+        (1.0, 1.0, 0.0),
+        (0.0, 1.0, 0.0),
+        (2.0, 0.0, 0.0),
+    ]
+    el = [(0, 1, 2, 3), (1, 4, 2)]
+    g = GeometryFM2D(nc, el, projection="UTM-33")
+
+    gdf = g.to_geopandas(data={"depth": np.array([1.0, 2.0])})
+
+    assert list(gdf.columns) == ["element_id", "depth", "geometry"]
+    assert gdf.element_id.tolist() == [0, 1]
+    assert gdf.depth.tolist() == [1.0, 2.0]
+    assert gdf.geometry.area.tolist() == [1.0, 0.5]
+    assert gdf.crs is not None
+
+    with pytest.raises(ValueError, match="shape"):
+        g.to_geopandas(data={"depth": np.array([1.0, 2.0, 3.0])})
+
+
+def test_dataarray_to_geopandas():
+    pytest.importorskip("geopandas")
+
+    da = mikeio.read("tests/testdata/HD2D.dfsu")["Surface elevation"]
+
+    gdf = da.to_geopandas(time=-1)
+
+    assert len(gdf) == da.geometry.n_elements
+    assert np.all(gdf["Surface elevation"] == da[-1].to_numpy())
+    assert np.all(gdf.element_id == da.geometry.element_ids)
+
+    gdf = da.isel(time=0).to_geopandas()
+    assert np.all(gdf["Surface elevation"] == da[0].to_numpy())
+
+    with pytest.raises(ValueError, match="GeometryFM2D"):
+        da.sel(x=606200, y=6905480).to_geopandas()